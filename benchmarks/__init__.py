@@ -0,0 +1 @@
+"""Benchmarks, load tests and their synthetic dataset."""
@@ -0,0 +1,98 @@
+"""Compare two benchmark reports and fail on regressions."""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Lower is better for every compared metric
+LOAD_METRICS = ("p50_ms", "p99_ms")
+
+
+def metrics(report: Dict) -> Dict[str, float]:
+    """
+    Flatten a report into comparable values.
+
+    Args:
+        report: Output of ``benchmarks.load`` or ``pytest --benchmark-json``
+
+    Returns:
+        Metric name to value, lower is better
+    """
+    values: Dict[str, float] = {}
+    if report.get("kind") == "load":
+        for name, step in report["steps"].items():
+            for metric in LOAD_METRICS:
+                if step.get(metric) is not None:
+                    values[f"{name}.{metric}"] = step[metric]
+            if step["requests"]:
+                values[f"{name}.error_rate"] = step["errors"] / step["requests"]
+    else:
+        for bench in report.get("benchmarks", []):
+            values[f"{bench['name']}.mean_s"] = bench["stats"]["mean"]
+    return values
+
+
+def compare(
+    baseline: Dict, current: Dict, threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Find metrics that got worse by more than ``threshold``.
+
+    Args:
+        baseline: Reference report
+        current: New report
+        threshold: Allowed relative slowdown, 0.1 for 10%
+
+    Returns:
+        Printable lines of every shared metric, and the regressed ones
+    """
+    if baseline.get("dataset") != current.get("dataset"):
+        print("warning: reports were produced on different datasets", file=sys.stderr)
+
+    old, new = metrics(baseline), metrics(current)
+    lines, regressions = [], []
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name], new[name]
+        if name.endswith(".error_rate"):
+            # Rates near zero make relative change meaningless
+            worse = after - before > threshold
+            change = f"{(after - before) * 100:+.1f} pts"
+        else:
+            ratio = (after - before) / before if before else 0.0
+            worse = ratio > threshold
+            change = f"{ratio * 100:+.1f}%"
+        line = f"{name:40} {before:12.4g} {after:12.4g} {change:>10}"
+        lines.append(line + ("  REGRESSION" if worse else ""))
+        if worse:
+            regressions.append(name)
+    return lines, regressions
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed relative slowdown before failing (default 0.1)",
+    )
+    args = parser.parse_args()
+
+    lines, regressions = compare(
+        json.loads(args.baseline.read_text()),
+        json.loads(args.current.read_text()),
+        args.threshold,
+    )
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
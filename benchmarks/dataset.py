@@ -0,0 +1,257 @@
+"""Deterministic synthetic dataset for benchmarks and load tests."""
+
+import random
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import Table
+
+from src.app.models import Module, Permission, Role, Route, User
+from src.app.models import route_component, route_role, user_component
+from src.app.models.role import role_permission
+from src.app.models.user import user_role
+
+# Every seeded user shares this password, so load tests can log in as anyone
+PASSWORD = "Bench-pass-1!"
+MEMBER_ROLE = "member"  # held by every user, grants the benchmarked reads
+ADMIN_ROLE = "admin"
+
+RESOURCES = ["users", "roles", "permissions", "route", "module", "file", "debug"]
+ACTIONS = ["read", "create", "update", "delete"]
+FIRST_NAMES = ["Asha", "Ben", "Chen", "Dara", "Eli", "Fatima", "Goran", "Hana"]
+LAST_NAMES = ["Ito", "Jones", "Khan", "Lopez", "Mensah", "Novak", "Okafor", "Patel"]
+NAMESPACE = uuid.UUID("6f1c1b1e-6d5c-4a39-9d0e-0c7f3c8b5a10")
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Row counts of a dataset."""
+
+    users: int
+    roles: int
+    permissions: int
+    modules: int
+    routes_per_module: int
+    route_depth: int = 3
+    components_per_route: int = 5
+    roles_per_user: int = 3
+
+
+SCALES: Dict[str, Scale] = {
+    "1k": Scale(users=1_000, roles=20, permissions=200, modules=10, routes_per_module=10),
+    "10k": Scale(users=10_000, roles=50, permissions=500, modules=20, routes_per_module=15),
+    "100k": Scale(
+        users=100_000, roles=200, permissions=2_000, modules=30, routes_per_module=20
+    ),
+    "1m": Scale(
+        users=1_000_000, roles=500, permissions=5_000, modules=50, routes_per_module=20
+    ),
+}
+
+
+def username(index: int) -> str:
+    """Username of the seeded user with this index."""
+    return f"user{index:07d}"
+
+
+def user_id(index: int) -> str:
+    """Stable primary key of the seeded user with this index."""
+    return str(uuid.uuid5(NAMESPACE, username(index)))
+
+
+def _expression(rng: random.Random, role_names: List[str]) -> Any:
+    """Pick an ABAC expression, None for an unconditional permission."""
+    choice = rng.randrange(5)
+    if choice == 0:
+        return None
+    if choice == 1:
+        return {"eq": [{"var": "actor.is_active"}, True]}
+    if choice == 2:
+        return {"in": [{"var": "actor.roles"}, rng.choice(role_names)]}
+    if choice == 3:
+        return {
+            "and": [
+                {"startswith": [{"var": "actor.username"}, "user"]},
+                {"not": {"var": "target.locked"}},
+            ]
+        }
+    return {
+        "or": [
+            {"eq": [{"var": "target.owner"}, {"var": "actor.id"}]},
+            {"regexMatch": ["^user0", {"var": "actor.username"}]},
+        ]
+    }
+
+
+def _chunks(rows: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group rows into lists of at most ``size``."""
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def generate(
+    scale: Scale, seed: int = 42, password_hash: str = "", chunk_size: int = 5_000
+) -> Iterator[Tuple[Table, List[Dict[str, Any]]]]:
+    """
+    Generate the dataset rows, table by table in foreign key order.
+
+    The same scale and seed always produce the same rows. Large tables are
+    streamed in chunks so the 1M user scale fits in memory.
+
+    Args:
+        scale: Row counts
+        seed: Random seed
+        password_hash: Stored hash of ``PASSWORD``
+        chunk_size: Maximum rows per yielded batch
+
+    Yields:
+        Target table and a batch of its rows
+    """
+    rng = random.Random(seed)
+
+    # Roles: admin and member first, then generic roles
+    role_names = [ADMIN_ROLE, MEMBER_ROLE] + [
+        f"role-{i:04d}" for i in range(max(0, scale.roles - 2))
+    ]
+    yield Role.__table__, [
+        {"role_id": i + 1, "name": name, "description": f"Benchmark role {name}"}
+        for i, name in enumerate(role_names)
+    ]
+    member_role_id = 2
+
+    # Permissions: every resource/action pair once, then conditional variants
+    permissions = []
+    base = [(resource, action) for resource in RESOURCES for action in ACTIONS]
+    for i in range(max(scale.permissions, len(base))):
+        resource, action = base[i] if i < len(base) else rng.choice(base)
+        expression = _expression(rng, role_names)
+        if i < len(base) and action == "read":
+            # Members read everything the load scenario calls, behind a check
+            expression = {"eq": [{"var": "actor.is_active"}, True]}
+        permissions.append(
+            {
+                "permission_id": i + 1,
+                "name": f"{resource}:{action}:{i}",
+                "description": None,
+                "resource": resource,
+                "action": action,
+                "expression": expression,
+            }
+        )
+    yield Permission.__table__, permissions
+
+    links = {
+        (member_role_id, p["permission_id"])
+        for p in permissions[: len(base)]
+        if p["action"] == "read"
+    }
+    for role_id in range(3, len(role_names) + 1):
+        for permission in rng.sample(permissions, min(10, len(permissions))):
+            links.add((role_id, permission["permission_id"]))
+    yield role_permission, [
+        {"role_id": role_id, "permission_id": permission_id}
+        for role_id, permission_id in sorted(links)
+    ]
+
+    # Modules and nested routes
+    yield Module.__table__, [
+        {
+            "id": m + 1,
+            "name": f"module-{m:03d}",
+            "label": f"Module {m}",
+            "icon": "folder",
+            "is_active": True,
+        }
+        for m in range(scale.modules)
+    ]
+    routes = []
+    depth: Dict[int, int] = {}
+    for m in range(scale.modules):
+        module_routes: List[int] = []
+        for r in range(scale.routes_per_module):
+            route_id = len(routes) + 1
+            parents = [p for p in module_routes if depth[p] < scale.route_depth - 1]
+            parent_id = rng.choice(parents) if parents and rng.random() < 0.6 else None
+            depth[route_id] = depth[parent_id] + 1 if parent_id else 0
+            module_routes.append(route_id)
+            routes.append(
+                {
+                    "id": route_id,
+                    "path": f"/m{m}/r{r}",
+                    "label": f"Route {m}.{r}",
+                    "icon": "page",
+                    "is_active": rng.random() < 0.95,
+                    "is_sidebar": rng.random() < 0.8,
+                    "module_id": m + 1,
+                    "parent_id": parent_id,
+                }
+            )
+    yield Route.__table__, routes
+    route_roles = set()
+    for route in routes:
+        route_roles.add((route["id"], member_role_id))
+        for role_id in rng.sample(range(1, len(role_names) + 1), min(2, len(role_names))):
+            route_roles.add((route["id"], role_id))
+    yield route_role, [
+        {"route_id": route_id, "role_id": role_id}
+        for route_id, role_id in sorted(route_roles)
+    ]
+    yield route_component, [
+        {"route_id": route["id"], "component_id": f"cmp-{route['id']}-{k}"}
+        for route in routes
+        for k in range(scale.components_per_route)
+    ]
+
+    # Users with the member role plus a few random ones
+    def users() -> Iterator[Dict[str, Any]]:
+        for i in range(scale.users):
+            yield {
+                "id": user_id(i),
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "phoneNumber": f"+1555{i:07d}",
+                "email": f"{username(i)}@bench.example",
+                "username": username(i),
+                "hashed_password": password_hash,
+                "is_active": rng.random() < 0.97 or i < 1000,
+                "is_superuser": False,
+            }
+
+    for chunk in _chunks(users(), chunk_size):
+        yield User.__table__, chunk
+
+    extra_roles = max(0, min(scale.roles_per_user - 1, len(role_names) - 2))
+
+    def user_roles() -> Iterator[Dict[str, Any]]:
+        for i in range(scale.users):
+            uid = user_id(i)
+            role_ids = {member_role_id}
+            role_ids.update(
+                rng.sample(range(3, len(role_names) + 1), rng.randint(0, extra_roles))
+            )
+            if i == 0:
+                role_ids.add(1)  # user0000000 administers the dataset
+            for role_id in sorted(role_ids):
+                yield {"user_id": uid, "role_id": role_id}
+
+    for chunk in _chunks(user_roles(), chunk_size):
+        yield user_role, chunk
+
+    def user_components() -> Iterator[Dict[str, Any]]:
+        for i in range(0, scale.users, 10):
+            route = rng.choice(routes)
+            yield {"user_id": user_id(i), "component_id": f"cmp-{route['id']}-0"}
+
+    for chunk in _chunks(user_components(), chunk_size):
+        yield user_component, chunk
+
+
+def describe(scale_name: str, seed: int) -> Dict[str, Any]:
+    """Summary of a dataset for benchmark reports."""
+    return {"scale": scale_name, "seed": seed, **asdict(SCALES[scale_name])}
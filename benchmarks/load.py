@@ -0,0 +1,296 @@
+"""Async HTTP load scenario against a running server seeded by benchmarks.seed."""
+import argparse
+import asyncio
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import httpx
+
+from benchmarks.dataset import MEMBER_ROLE, PASSWORD, SCALES, describe, username
+
+API = "/api/v1"
+
+# Relative frequency of each step in a virtual user's loop
+WEIGHTS = {
+    "refresh": 1,
+    "users_search": 4,
+    "sidebar": 6,
+    "my_routes": 6,
+    "permissions": 3,
+    "upload": 1,
+    "download": 2,
+}
+
+
+def _png() -> bytes:
+    """Small valid PNG used by the upload step."""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (30, 120, 200)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class Recorder:
+    """Latency samples and errors per step."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    async def call(
+        self, name: str, request: Callable[[], Awaitable[httpx.Response]]
+    ) -> Optional[httpx.Response]:
+        """Time one request, counting transport failures and 4xx/5xx answers."""
+        start = time.perf_counter()
+        try:
+            response = await request()
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        self.latencies[name].append((time.perf_counter() - start) * 1000)
+        self.statuses[name][response.status_code] += 1
+        if response.status_code >= 400:
+            self.errors[name] += 1
+        return response
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """Per-step latency percentiles and throughput."""
+        steps = {}
+        for name in sorted(set(self.latencies) | set(self.errors)):
+            samples = sorted(self.latencies[name])
+            count = len(samples)
+            steps[name] = {
+                "requests": count,
+                "errors": self.errors[name],
+                "rps": round(count / elapsed, 2),
+                "mean_ms": round(statistics.fmean(samples), 2) if samples else None,
+                "p50_ms": _percentile(samples, 50),
+                "p90_ms": _percentile(samples, 90),
+                "p99_ms": _percentile(samples, 99),
+                "max_ms": round(samples[-1], 2) if samples else None,
+                "statuses": dict(self.statuses[name]),
+            }
+        return steps
+
+
+def _percentile(samples: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted samples."""
+    if not samples:
+        return None
+    rank = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return round(samples[rank], 2)
+
+
+class VirtualUser:
+    """One logged-in client looping over the weighted steps."""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, index: int, seed: int):
+        self.client = client
+        self.recorder = recorder
+        self.index = index
+        self.rng = random.Random(seed * 100_003 + index)
+        self.tokens: Dict[str, str] = {}
+        self.uploads: List[str] = []
+        self.png = _png()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens.get('access_token', '')}"}
+
+    async def login(self) -> bool:
+        response = await self.recorder.call(
+            "login",
+            lambda: self.client.post(
+                f"{API}/auth/login",
+                json={"username": username(self.index), "password": PASSWORD},
+            ),
+        )
+        if response is None or response.status_code != 200:
+            return False
+        self.tokens = response.json()
+        return True
+
+    async def refresh(self) -> None:
+        response = await self.recorder.call(
+            "refresh",
+            lambda: self.client.post(
+                f"{API}/auth/refresh",
+                json={"refresh_token": self.tokens.get("refresh_token", "")},
+            ),
+        )
+        if response is not None and response.status_code == 200:
+            self.tokens = response.json()
+
+    async def users_search(self) -> None:
+        term = f"user{self.rng.randrange(100):02d}"
+        await self.recorder.call(
+            "users_search",
+            lambda: self.client.get(
+                f"{API}/users/",
+                params={"search": term, "limit": 20},
+                headers=self.headers,
+            ),
+        )
+
+    async def sidebar(self) -> None:
+        await self.recorder.call(
+            "sidebar",
+            lambda: self.client.get(f"{API}/sidebar/sidebar", headers=self.headers),
+        )
+
+    async def my_routes(self) -> None:
+        await self.recorder.call(
+            "my_routes",
+            lambda: self.client.get(f"{API}/route/my-routes", headers=self.headers),
+        )
+
+    async def permissions(self) -> None:
+        await self.recorder.call(
+            "permissions",
+            lambda: self.client.get(f"{API}/rbac/permissions", headers=self.headers),
+        )
+
+    async def upload(self) -> None:
+        # Registration is the endpoint accepting an uploaded photo
+        name = f"load-{self.index}-{self.rng.getrandbits(48):012x}"
+        response = await self.recorder.call(
+            "upload",
+            lambda: self.client.post(
+                f"{API}/auth/register",
+                data={
+                    "name": name,
+                    "phoneNumber": "+15550000000",
+                    "email": f"{name}@bench.example",
+                    "username": name,
+                    "password": PASSWORD,
+                    "role_id": "2",
+                },
+                files={"photo": ("photo.png", self.png, "image/png")},
+            ),
+        )
+        if response is not None and response.status_code == 200:
+            photo = response.json().get("photo")
+            if photo:
+                self.uploads.append(photo)
+
+    async def download(self) -> None:
+        if not self.uploads:
+            await self.upload()
+            return
+        url = self.rng.choice(self.uploads)
+        await self.recorder.call(
+            "download",
+            lambda: self.client.get(url, headers=self.headers, follow_redirects=True),
+        )
+
+    async def run(self, deadline: float, steps: List[str]) -> None:
+        if not await self.login():
+            return
+        weights = [WEIGHTS[step] for step in steps]
+        while time.monotonic() < deadline:
+            step = self.rng.choices(steps, weights)[0]
+            await getattr(self, step)()
+
+
+async def run_load(
+    base_url: str,
+    scale_name: str,
+    seed: int,
+    concurrency: int,
+    duration: float,
+    steps: List[str],
+) -> Dict[str, Any]:
+    """
+    Run the scenario and build the JSON report.
+
+    Args:
+        base_url: Server URL
+        scale_name: Seeded dataset scale, picks which users log in
+        seed: Seed of the virtual users' choices
+        concurrency: Virtual users
+        duration: Seconds to run
+        steps: Steps to exercise, from ``WEIGHTS``
+
+    Returns:
+        Report with per-step latency percentiles
+    """
+    recorder = Recorder()
+    population = SCALES[scale_name].users
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        # Only active members are guaranteed below index 1000
+        users = [
+            VirtualUser(client, recorder, i % min(population, 1000), seed)
+            for i in range(concurrency)
+        ]
+        start = time.monotonic()
+        deadline = start + duration
+        await asyncio.gather(*(user.run(deadline, steps) for user in users))
+        elapsed = time.monotonic() - start
+
+    return {
+        "kind": "load",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "dataset": describe(scale_name, seed),
+        "config": {
+            "base_url": base_url,
+            "concurrency": concurrency,
+            "duration": duration,
+            "steps": steps,
+            "role": MEMBER_ROLE,
+        },
+        "elapsed": round(elapsed, 2),
+        "steps": recorder.summary(elapsed),
+    }
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument(
+        "--steps",
+        default=",".join(WEIGHTS),
+        help=f"comma separated subset of {', '.join(WEIGHTS)}",
+    )
+    parser.add_argument("--output", type=Path, default=Path("load-report.json"))
+    args = parser.parse_args()
+
+    steps = [step.strip() for step in args.steps.split(",") if step.strip()]
+    unknown = set(steps) - set(WEIGHTS)
+    if unknown:
+        parser.error(f"unknown steps: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(
+        run_load(args.base_url, args.scale, args.seed, args.concurrency, args.duration, steps)
+    )
+    args.output.write_text(json.dumps(report, indent=2))
+    for name, step in report["steps"].items():
+        print(
+            f"{name:14} {step['requests']:7} req  {step['errors']:5} err  "
+            f"p50 {step['p50_ms']} ms  p99 {step['p99_ms']} ms"
+        )
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""pytest-benchmark micro-benchmarks."""
@@ -0,0 +1,39 @@
+"""ABAC expression evaluation."""
+from src.app.api.abac.engine import ABACEngine
+
+
+def bench_evaluate_dataset_expressions(benchmark, permissions, context):
+    """Evaluate every seeded permission expression once."""
+    expressions = [p["expression"] for p in permissions if p["expression"]]
+
+    def run():
+        engine = ABACEngine(context)
+        return [engine.evaluate(expr) for expr in expressions]
+
+    assert benchmark(run)
+
+
+def bench_evaluate_nested_expression(benchmark, context):
+    """Evaluate one deep expression mixing every operator family."""
+    expr = {
+        "and": [
+            {"eq": [{"var": "actor.is_active"}, True]},
+            {"in": [{"var": "actor.roles"}, "member"]},
+            {
+                "or": [
+                    {"eq": [{"var": "target.owner"}, {"var": "actor.id"}]},
+                    {"regexMatch": ["^user0", {"var": "actor.username"}]},
+                ]
+            },
+            {"not": {"var": "target.locked"}},
+        ]
+    }
+    assert benchmark(lambda: ABACEngine(context).evaluate(expr)) is True
+
+
+def bench_run_compiled_dataset_expressions(benchmark, permissions, context):
+    """Run every seeded permission expression through its compiled form."""
+    runs = [
+        ABACEngine.compile(p["expression"]).run for p in permissions if p["expression"]
+    ]
+    assert benchmark(lambda: [run(context) for run in runs])
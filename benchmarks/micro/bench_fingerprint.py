@@ -0,0 +1,19 @@
+"""SQL fingerprinting done for every profiled statement."""
+from src.core.metrics.fingerprint import fingerprint
+
+STATEMENT = (
+    'SELECT "user".id, "user".username FROM "user" '
+    'JOIN user_role ON "user".id = user_role.user_id '
+    "WHERE user_role.role_id IN ($1, $2, $3) AND \"user\".is_active = $4 LIMIT $5"
+)
+
+
+def bench_fingerprint_uncached(benchmark):
+    """Normalize a statement the cache has not seen."""
+    benchmark(fingerprint.__wrapped__, STATEMENT)
+
+
+def bench_fingerprint_cached(benchmark):
+    """Look up a statement already fingerprinted."""
+    fingerprint(STATEMENT)
+    benchmark(fingerprint, STATEMENT)
@@ -0,0 +1,105 @@
+"""Response serialization of the sidebar and route listings."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.schemas.route import RouteResponse, RouteResponseList
+from src.core.responses import trusted_json
+
+
+def _routes(rng, count):
+    return [
+        {
+            "id": i,
+            "path": f"/m{i // 20}/r{i % 20}",
+            "label": f"Route {i}",
+            "icon": "page",
+            "is_active": True,
+            "is_sidebar": rng.random() < 0.8,
+            "module_id": i // 20 + 1,
+            "parent_id": i - 1 if i % 3 else None,
+            "version": 1,
+            "role_ids": [2, rng.randrange(3, 20)],
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def bench_validate_routes(benchmark, rng):
+    """Validate 1000 route rows into response models."""
+    rows = _routes(rng, 1000)
+    result = benchmark(lambda: [RouteResponse.model_validate(row) for row in rows])
+    assert len(result) == 1000
+
+
+def bench_dump_routes_json(benchmark, rng):
+    """Serialize 1000 route models to JSON."""
+    models = [RouteResponse.model_validate(row) for row in _routes(rng, 1000)]
+    benchmark(lambda: [model.model_dump_json() for model in models])
+
+
+def _route_objects(rng, count):
+    """ORM-like rows, as loaded with their roles."""
+    objects = []
+    for row in _routes(rng, count):
+        role_ids = row.pop("role_ids")
+        objects.append(
+            SimpleNamespace(
+                **row,
+                roles=[SimpleNamespace(role_id=role_id) for role_id in role_ids],
+                role_ids=role_ids,
+            )
+        )
+    return objects
+
+
+def bench_route_list_default_10k(benchmark, rng):
+    """10k routes built by hand, re-validated and encoded with json."""
+    objects = _route_objects(rng, 10_000)
+
+    def respond():
+        models = [
+            RouteResponse(
+                id=route.id,
+                path=route.path,
+                label=route.label,
+                icon=route.icon,
+                is_active=route.is_active,
+                is_sidebar=route.is_sidebar,
+                module_id=route.module_id,
+                parent_id=route.parent_id,
+                version=route.version,
+                role_ids=[role.role_id for role in route.roles],
+            )
+            for route in objects
+        ]
+        # What FastAPI does with a response_model before JSONResponse
+        validated = RouteResponseList.validate_python([m.model_dump() for m in models])
+        return json.dumps(RouteResponseList.dump_python(validated, mode="json")).encode()
+
+    assert benchmark(respond)
+
+
+def bench_route_list_orjson_10k(benchmark, rng):
+    """10k routes validated from attributes, re-validated and encoded with orjson."""
+    orjson = pytest.importorskip("orjson")
+    objects = _route_objects(rng, 10_000)
+
+    def respond():
+        models = RouteResponseList.validate_python(objects, from_attributes=True)
+        validated = RouteResponseList.validate_python([m.model_dump() for m in models])
+        return orjson.dumps(RouteResponseList.dump_python(validated, mode="json"))
+
+    assert benchmark(respond)
+
+
+def bench_route_list_trusted_10k(benchmark, rng):
+    """10k routes validated from attributes once and dumped by pydantic-core."""
+    objects = _route_objects(rng, 10_000)
+
+    def respond():
+        models = RouteResponseList.validate_python(objects, from_attributes=True)
+        return trusted_json(RouteResponseList, models).body
+
+    assert benchmark(respond)
@@ -0,0 +1,28 @@
+"""Token and password primitives on the login and refresh paths."""
+from jose import jwt
+
+from src.core.config import settings
+from src.core.security import (
+    create_access_token,
+    create_refresh_token,
+    get_password_hash,
+    verify_password,
+)
+
+
+def bench_create_token_pair(benchmark):
+    """Issue the access and refresh tokens of a login."""
+    benchmark(lambda: (create_access_token("user0000042"), create_refresh_token("user0000042")))
+
+
+def bench_decode_access_token(benchmark):
+    """Decode the bearer token of an authenticated request."""
+    token = create_access_token("user0000042")
+    payload = benchmark(jwt.decode, token, settings.SECRET_KEY, algorithms=["HS256"])
+    assert payload["sub"] == "user0000042"
+
+
+def bench_verify_password(benchmark):
+    """Check a password against its stored hash, the dominant login cost."""
+    hashed = get_password_hash("Bench-pass-1!")
+    assert benchmark.pedantic(verify_password, ("Bench-pass-1!", hashed), rounds=5)
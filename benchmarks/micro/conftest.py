@@ -0,0 +1,41 @@
+"""Shared fixtures of the micro-benchmarks."""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from benchmarks.dataset import SCALES, generate
+from src.app.models import Permission
+
+
+@pytest.fixture(scope="session")
+def permissions():
+    """Permission rows of the 1k dataset, with their ABAC expressions."""
+    for table, rows in generate(SCALES["1k"]):
+        if table is Permission.__table__:
+            return rows
+    raise AssertionError("dataset has no permissions")
+
+
+@pytest.fixture(scope="session")
+def context():
+    """ABAC context of a seeded member acting on an owned target."""
+    return {
+        "actor": {
+            "id": "bench-user",
+            "username": "user0000042",
+            "is_active": True,
+            "roles": ["member", "role-0001", "role-0007"],
+        },
+        "target": {"owner": "bench-user", "locked": False},
+    }
+
+
+@pytest.fixture
+def rng():
+    """Seeded random generator."""
+    return random.Random(42)
@@ -0,0 +1,113 @@
+"""Script to move flat upload directories into hashed-prefix shards."""
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.config import settings
+from src.core.storage import shard_key
+
+
+def iter_unsharded(root: Path) -> Iterator[Tuple[Path, Path]]:
+    """
+    Yield (source, target) pairs for files stored directly in a top-level folder.
+
+    Args:
+        root: Upload root directory
+
+    Yields:
+        Current path and sharded destination of each file
+    """
+    for folder in os.scandir(root):
+        if not folder.is_dir():
+            continue
+        for entry in os.scandir(folder.path):
+            # Skip shard directories and in-flight temporary files
+            if not entry.is_file() or entry.name.startswith("."):
+                continue
+            key = f"{folder.name}/{entry.name}"
+            target = shard_key(
+                key, depth=settings.UPLOAD_SHARD_DEPTH, width=settings.UPLOAD_SHARD_WIDTH
+            )
+            if target != key:
+                yield Path(entry.path), root / target
+
+
+def move_file(source: Path, target: Path, dry_run: bool) -> Optional[str]:
+    """
+    Move one file into its shard.
+
+    Returns:
+        Error message, or None on success
+    """
+    try:
+        if dry_run:
+            return None
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            return f"{target} already exists"
+        os.replace(source, target)
+        return None
+    except OSError as e:
+        return f"{source}: {e}"
+
+
+def reshard(root: Path, workers: int, dry_run: bool) -> Tuple[int, int]:
+    """
+    Reshard an upload tree in parallel.
+
+    Args:
+        root: Upload root directory
+        workers: Number of threads issuing filesystem calls
+        dry_run: Only report what would be moved
+
+    Returns:
+        Tuple of (moved, failed) counts
+    """
+    moved = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(move_file, source, target, dry_run)
+            for source, target in iter_unsharded(root)
+        ]
+        for future in futures:
+            error = future.result()
+            if error:
+                failed += 1
+                print(f"❌ {error}")
+            else:
+                moved += 1
+    return moved, failed
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--root", default=settings.UPLOAD_DIR or "uploads")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    if settings.UPLOAD_SHARD_DEPTH <= 0:
+        print("UPLOAD_SHARD_DEPTH is 0, nothing to do.")
+        return
+
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"❌ Upload directory {root} does not exist")
+        sys.exit(1)
+
+    moved, failed = reshard(root, args.workers, args.dry_run)
+    action = "Would move" if args.dry_run else "Moved"
+    print(f"\n✅ {action} {moved} files into shards ({failed} failed)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
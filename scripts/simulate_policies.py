@@ -0,0 +1,169 @@
+"""Script to replay recorded authorization requests against proposed policies."""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from src.app.api.abac.simulation import apply_changes, corpus_from_trace, simulate
+from src.app.models import Permission, Role
+from src.app.models.role import role_permission
+from src.core.db.session import engine
+
+
+async def fetch_policies() -> List[Dict[str, Any]]:
+    """
+    Read the deployed permissions with the names of the roles holding them.
+
+    Returns:
+        Policies in the simulation format
+    """
+    stmt = (
+        select(
+            Permission.permission_id,
+            Permission.name,
+            Permission.resource,
+            Permission.action,
+            Permission.expression,
+            Role.name.label("role_name"),
+        )
+        .outerjoin(
+            role_permission,
+            role_permission.c.permission_id == Permission.permission_id,
+        )
+        .outerjoin(Role, Role.role_id == role_permission.c.role_id)
+        .order_by(Permission.permission_id)
+    )
+    policies: Dict[int, Dict[str, Any]] = {}
+    async with engine.connect() as conn:
+        for row in await conn.execute(stmt):
+            policy = policies.setdefault(
+                row.permission_id,
+                {
+                    "permission_id": row.permission_id,
+                    "name": row.name,
+                    "resource": row.resource,
+                    "action": row.action,
+                    "expression": row.expression,
+                    "roles": [],
+                },
+            )
+            if row.role_name is not None:
+                policy["roles"].append(row.role_name)
+    await engine.dispose()
+    return list(policies.values())
+
+
+def load_corpus(path: Path) -> List[Dict[str, Any]]:
+    """
+    Read recorded requests.
+
+    Args:
+        path: JSON lines of requests, or a saved ``GET /debug/authz-trace``
+            response
+
+    Returns:
+        Requests in replay order
+    """
+    text = path.read_text()
+    try:
+        dump = json.loads(text)
+    except json.JSONDecodeError:
+        dump = None
+    if isinstance(dump, dict) and "records" in dump:
+        return corpus_from_trace(dump["records"])
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def print_summary(report: Dict[str, Any]) -> None:
+    """Print the diffs and flagged policies of a report."""
+    print(f"Replayed {report['replayed']} of {report['requests']} requests")
+    for chunk in report["timed_out_chunks"]:
+        print(f"❌ Timed out: requests {chunk['start']}+{chunk['requests']}")
+    for name, errors in report["invalid_policies"].items():
+        for policy, error in errors.items():
+            print(f"❌ Invalid {name} policy {policy}: {error}")
+    for diff in report["diffs"][:20]:
+        before = "allow" if diff["current"] else "deny"
+        after = "allow" if diff["proposed"] else "deny"
+        print(
+            f"  #{diff['index']} {diff['user_id']} {diff['resource']}:"
+            f"{diff['action']} {before} -> {after}"
+        )
+    if len(report["diffs"]) > 20:
+        print(f"  ... {len(report['diffs']) - 20} more")
+    print(
+        f"Decision changes: {report['granted_to_denied']} granted -> denied, "
+        f"{report['denied_to_granted']} denied -> granted"
+    )
+    for policy in report["slow_policies"]["proposed"]:
+        stats = report["latency"]["proposed"][policy]
+        print(f"⚠️  Slow policy {policy}: p99 {stats['p99_ms']} ms, max {stats['max_ms']} ms")
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", type=Path, help="Recorded requests")
+    parser.add_argument(
+        "proposed",
+        type=Path,
+        nargs="?",
+        help="Changed, added or deleted policies (JSON list)",
+    )
+    parser.add_argument(
+        "--current", type=Path, help="Current policies instead of the database"
+    )
+    parser.add_argument("--dump-current", type=Path, help="Write the current policies")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds per chunk")
+    parser.add_argument("--slow-ms", type=float, default=1.0, help="p99 limit per policy")
+    parser.add_argument("--output", type=Path, help="Write the full report as JSON")
+    parser.add_argument(
+        "--allow-diffs", action="store_true", help="Do not fail on decision changes"
+    )
+    args = parser.parse_args()
+
+    if args.current:
+        current = json.loads(args.current.read_text())
+    else:
+        current = asyncio.run(fetch_policies())
+    if args.dump_current:
+        args.dump_current.write_text(json.dumps(current, indent=2))
+    changes = json.loads(args.proposed.read_text()) if args.proposed else []
+    proposed = apply_changes(current, changes)
+
+    report = simulate(
+        load_corpus(args.corpus),
+        current,
+        proposed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        timeout=args.timeout,
+        slow_ms=args.slow_ms,
+    )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, default=str))
+    print_summary(report)
+
+    failed = (
+        report["timed_out_chunks"]
+        or report["slow_policies"]["proposed"]
+        or report["invalid_policies"]["proposed"]
+        or (report["diffs"] and not args.allow_diffs)
+    )
+    if failed:
+        sys.exit(1)
+    print("✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,21 @@
 """API package."""
 
 from src.app.api.deps import (
+    AuthorizedQuery,
     get_current_active_user,
     get_current_superuser,
     get_current_user,
     has_permission,
+    permission_filter,
 )
 from src.app.api.router import api_router
 
 __all__ = [
+    "AuthorizedQuery",
     "api_router",
     "get_current_user",
     "get_current_active_user",
     "get_current_superuser",
     "has_permission",
+    "permission_filter",
 ]
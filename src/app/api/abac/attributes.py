@@ -0,0 +1,224 @@
+"""Attribute providers resolving ABAC variables from stored data."""
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Loads the values of many keys at once, missing keys resolve to None
+BatchLoader = Callable[[AsyncSession, List[Hashable]], Awaitable[Dict[Hashable, Any]]]
+
+# Session info entries holding the request's loaders and their query lock
+LOADERS_KEY = "abac_loaders"
+LOCK_KEY = "abac_loaders_lock"
+
+
+class DataLoader:
+    """
+    Batch and cache the loads of one provider within a request.
+
+    Keys requested in the same event loop iteration are fetched with a
+    single call of the batch function; every key is fetched at most once.
+    """
+
+    def __init__(self, batch: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]):
+        self.batch = batch
+        self._cache: Dict[Hashable, asyncio.Future] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, key: Hashable) -> "asyncio.Future[Any]":
+        """
+        Get the value of a key, fetching it with the next batch if needed.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Future resolving to the value, None if the key does not exist
+        """
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._cache[key] = loop.create_future()
+            if not self._pending:
+                loop.call_soon(self._schedule)
+            self._pending[key] = future
+        return future
+
+    def _schedule(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        try:
+            values = await self.batch(list(pending))
+        except Exception as e:
+            for key, future in pending.items():
+                # Later requests for the key retry instead of reusing the error
+                self._cache.pop(key, None)
+                future.set_exception(e)
+            return
+        for key, future in pending.items():
+            future.set_result(values.get(key))
+
+
+class AttributeProvider(NamedTuple):
+    """Loader of the attribute at ``path``, keyed by the value at ``key``."""
+
+    path: str
+    key: str
+    loader: BatchLoader
+
+
+def referenced_vars(expr: Any) -> Set[str]:
+    """
+    Collect the variable paths an expression reads.
+
+    Args:
+        expr: ABAC expression
+
+    Returns:
+        Paths of every ``var``
+    """
+    paths: Set[str] = set()
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            path = node.get("var")
+            if isinstance(path, str):
+                paths.add(path)
+            else:
+                stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return paths
+
+
+def _get(context: dict, path: str) -> Any:
+    value: Any = context
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _set(context: dict, path: str, value: Any) -> None:
+    """Set a nested value, copying the dicts on the way."""
+    *parents, name = path.split(".")
+    node = context
+    for part in parents:
+        child = node.get(part)
+        node[part] = dict(child) if isinstance(child, dict) else {}
+        node = node[part]
+    node[name] = value
+
+
+class AttributeRegistry:
+    """Providers of ABAC attributes that are not in the request."""
+
+    def __init__(self):
+        self._providers: Dict[str, AttributeProvider] = {}
+
+    def register(self, path: str, key: str) -> Callable[[BatchLoader], BatchLoader]:
+        """
+        Register a batch loader for an attribute.
+
+        Args:
+            path: Variable path the loader fills, e.g. ``target.user``
+            key: Variable path of the lookup key, e.g. ``target.user_id``
+
+        Returns:
+            Decorator returning the loader unchanged
+        """
+
+        def decorator(loader: BatchLoader) -> BatchLoader:
+            self._providers[path] = AttributeProvider(path, key, loader)
+            return loader
+
+        return decorator
+
+    def provider_for(self, var: str) -> Optional[AttributeProvider]:
+        """Provider of a variable path or of one of its parents."""
+        parts = var.split(".")
+        for i in range(len(parts), 0, -1):
+            provider = self._providers.get(".".join(parts[:i]))
+            if provider is not None:
+                return provider
+        return None
+
+    def key_path(self, var: str) -> str:
+        """Path deciding the value of ``var``: its provider's key, or itself."""
+        provider = self.provider_for(var)
+        return var if provider is None else provider.key
+
+    def required(self, expressions: Iterable[Any]) -> List[AttributeProvider]:
+        """Providers of the variables the expressions reference."""
+        providers = {}
+        for expr in expressions:
+            for var in referenced_vars(expr):
+                provider = self.provider_for(var)
+                if provider is not None:
+                    providers[provider.path] = provider
+        return list(providers.values())
+
+    @staticmethod
+    def _loader(db: AsyncSession, provider: AttributeProvider) -> DataLoader:
+        """Request-scoped loader of a provider, kept on the session."""
+        loaders = db.info.setdefault(LOADERS_KEY, {})
+        loader = loaders.get(provider.path)
+        if loader is None:
+            # A session runs one query at a time, batches of providers queue
+            lock = db.info.setdefault(LOCK_KEY, asyncio.Lock())
+
+            async def batch(keys: List[Hashable]) -> Dict[Hashable, Any]:
+                async with lock:
+                    return await provider.loader(db, keys)
+
+            loader = loaders[provider.path] = DataLoader(batch)
+        return loader
+
+    async def provide(
+        self, db: AsyncSession, context: dict, providers: List[AttributeProvider]
+    ) -> dict:
+        """
+        Fill the provided attributes into a context.
+
+        Args:
+            db: Request database session, scoping the loader cache
+            context: ABAC context, left unchanged
+            providers: Providers to resolve, from ``required``
+
+        Returns:
+            Copy of the context with the attributes set
+        """
+        if not providers:
+            return context
+        loads = []
+        for provider in providers:
+            key = _get(context, provider.key)
+            if key is not None and isinstance(key, Hashable):
+                loads.append((provider, self._loader(db, provider).load(key)))
+        context = dict(context)
+        for provider, future in loads:
+            _set(context, provider.path, await future)
+        return context
+
+
+# Global instance
+attribute_providers = AttributeRegistry()
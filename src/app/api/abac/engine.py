@@ -1,4 +1,42 @@
-import re
+import json
+from typing import Any, Callable, Dict, NamedTuple
+
+from src.app.api.abac.regex import compile_pattern, regex_match
+
+# Compiled expressions kept before the cache is reset
+COMPILE_CACHE_SIZE = 4096
+
+# Relative cost of an operator, on top of its arguments
+OPERATOR_COSTS = {"regexMatch": 20, "len": 3, "in": 3, "contains": 3}
+DEFAULT_COST = 1
+
+# Operators that cannot raise when their arguments do not
+SAFE_OPERATORS = {"eq", "neq", "not"}
+
+
+class Compiled(NamedTuple):
+    """Expression compiled to a function of the context."""
+
+    run: Callable[[dict], Any]
+    cost: int
+    constant: bool = False
+    value: Any = None
+    safe: bool = True  # cannot raise, e.g. ``lt`` may on a missing attribute
+
+
+def _constant(value: Any) -> Compiled:
+    return Compiled(lambda context: value, 0, True, value)
+
+
+def _resolve(parts: tuple, context: dict) -> Any:
+    value = context
+    for part in parts:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+        if value is None:
+            return None
+    return value
 
 
 class ABACEngine:
@@ -17,16 +55,25 @@ class ABACEngine:
         "contains": lambda a, b: b in a
         if isinstance(a, (list, set, tuple, str))
         else False,
-        "regexMatch": lambda pattern, value: bool(re.match(pattern, value))
-        if isinstance(value, str)
-        else False,
+        "regexMatch": regex_match,
     }
 
-    def __init__(self, context: dict):
+    _compiled: Dict[str, Compiled] = {}
+
+    def __init__(self, context: dict, steps: list = None):
         self.context = context
+        # Collects (sub-expression, result) pairs when tracing is enabled
+        self.steps = steps
 
     def evaluate(self, expr):
-        print(f"Evaluating expression: {expr}")
+        if self.steps is None:
+            return self._evaluate(expr)
+        result = self._evaluate(expr)
+        if isinstance(expr, dict):
+            self.steps.append({"expr": expr, "result": result})
+        return result
+
+    def _evaluate(self, expr):
         if isinstance(expr, dict):
             if "var" in expr:
                 return self.resolve_var(expr["var"])
@@ -45,6 +92,11 @@ class ABACEngine:
                     raise ValueError(f"Unknown operator: {op}")
                 if not isinstance(args, list):
                     args = [args]
+                # Stop at the first argument deciding the outcome
+                if op == "and":
+                    return all(self.evaluate(arg) for arg in args)
+                if op == "or":
+                    return any(self.evaluate(arg) for arg in args)
                 eval_args = [self.evaluate(arg) for arg in args]
                 return self.OPERATORS[op](*eval_args)
         return expr
@@ -58,4 +110,145 @@ class ABACEngine:
             value = value.get(part)
             if value is None:
                 return None
-        return value
\ No newline at end of file
+        return value
+
+    @classmethod
+    def compile(cls, expr) -> Compiled:
+        """
+        Compile an expression into a function of the context.
+
+        Constant sub-expressions are folded, ``and``/``or`` stop at the
+        first deciding operand and ``if`` only runs the taken branch.
+        Operands that cannot raise are reordered cheapest first, but never
+        across one that can, so a guard still runs before the operand it
+        protects and decisions match ``evaluate``.
+
+        Args:
+            expr: ABAC expression
+
+        Returns:
+            Compiled expression; ``run(context)`` evaluates it like
+            ``evaluate`` and ``cost`` estimates its price
+
+        Raises:
+            ValueError: If the expression uses an unknown operator or a
+                ``regexMatch`` pattern that is not accepted
+        """
+        return cls._compile(expr)
+
+    @classmethod
+    def compile_cached(cls, expr) -> Compiled:
+        """Compile an expression once per distinct expression."""
+        key = json.dumps(expr, sort_keys=True, default=str)
+        compiled = cls._compiled.get(key)
+        if compiled is None:
+            if len(cls._compiled) >= COMPILE_CACHE_SIZE:
+                cls._compiled.clear()
+            compiled = cls._compiled[key] = cls.compile(expr)
+        return compiled
+
+    @classmethod
+    def _compile(cls, expr) -> Compiled:
+        if not isinstance(expr, dict) or not expr:
+            return _constant(expr)
+        if "var" in expr:
+            path = expr["var"]
+            parts = tuple(path.split("."))
+            return Compiled(lambda context: _resolve(parts, context), len(parts))
+
+        op, args = next(iter(expr.items()))
+        if op == "if":
+            if not isinstance(args, list) or len(args) < 2:
+                raise ValueError('"if" operator requires at least 2 arguments')
+            return cls._compile_if([cls._compile(arg) for arg in args])
+        if op not in cls.OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        if not isinstance(args, list):
+            args = [args]
+        compiled = [cls._compile(arg) for arg in args]
+        if op in ("and", "or"):
+            return cls._compile_junction(op, compiled)
+
+        func = cls.OPERATORS[op]
+        if all(arg.constant for arg in compiled):
+            try:
+                return _constant(func(*(arg.value for arg in compiled)))
+            except Exception:
+                pass  # raised again, as before, when evaluated
+        cost = OPERATOR_COSTS.get(op, DEFAULT_COST) + sum(arg.cost for arg in compiled)
+        safe = op in SAFE_OPERATORS and all(arg.safe for arg in compiled)
+
+        if (
+            op == "regexMatch"
+            and len(compiled) == 2
+            and compiled[0].constant
+            and isinstance(compiled[0].value, str)
+        ):
+            # The pattern is validated and compiled once, not on every evaluation
+            match = compile_pattern(compiled[0].value)
+            value = compiled[1].run
+            return Compiled(
+                lambda context: isinstance(v := value(context), str) and match(v),
+                cost,
+                safe=compiled[1].safe,
+            )
+        if len(compiled) == 1:
+            a = compiled[0].run
+            return Compiled(lambda context: func(a(context)), cost, safe=safe)
+        if len(compiled) == 2:
+            a, b = compiled[0].run, compiled[1].run
+            return Compiled(
+                lambda context: func(a(context), b(context)), cost, safe=safe
+            )
+        runs = [arg.run for arg in compiled]
+        return Compiled(
+            lambda context: func(*(run(context) for run in runs)), cost, safe=safe
+        )
+
+    @staticmethod
+    def _compile_junction(op: str, compiled: list) -> Compiled:
+        decisive = op == "or"
+        # Operands that can raise split the others into runs, reordered only
+        # within each run so an error surfaces exactly when it would in order
+        groups: list = [[]]
+        for arg in compiled:
+            if arg.constant and bool(arg.value) is not decisive:
+                continue
+            if arg.constant:
+                if len(groups) == 1:
+                    return _constant(decisive)
+                # Decides once reached, later operands never run
+                groups[-1].append(arg)
+                break
+            if arg.safe:
+                groups[-1].append(arg)
+            else:
+                groups += [[arg], []]
+        ordered = [
+            arg for group in groups for arg in sorted(group, key=lambda arg: arg.cost)
+        ]
+        if not ordered:
+            return _constant(not decisive)
+        runs = [arg.run for arg in ordered]
+        cost = sum(arg.cost for arg in ordered)
+        safe = all(arg.safe for arg in ordered)
+        if decisive:
+            return Compiled(
+                lambda context: any(run(context) for run in runs), cost, safe=safe
+            )
+        return Compiled(
+            lambda context: all(run(context) for run in runs), cost, safe=safe
+        )
+
+    @staticmethod
+    def _compile_if(compiled: list) -> Compiled:
+        condition, then = compiled[0], compiled[1]
+        otherwise = compiled[2] if len(compiled) > 2 else _constant(None)
+        if condition.constant:
+            return then if condition.value else otherwise
+        test, yes, no = condition.run, then.run, otherwise.run
+        return Compiled(
+            lambda context: yes(context) if test(context) else no(context),
+            condition.cost + max(then.cost, otherwise.cost),
+            safe=condition.safe and then.safe and otherwise.safe,
+        )
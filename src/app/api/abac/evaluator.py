@@ -1,21 +1,99 @@
-from src.app.api.abac.engine import ABACEngine
+import asyncio
+import json
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from src.app.api.abac import providers  # noqa: F401  registers built-in providers
+from src.app.api.abac.attributes import attribute_providers
+from src.app.api.abac.engine import ABACEngine, Compiled
+from src.app.api.abac.index import policy_index
+from src.app.api.abac.partial import policy_filter
 from src.app.services import PermissionService
+from src.app.services.permission import wildcard_match
+from src.core.config import settings
+from src.core.debug import authz_trace
+from src.core.metrics import record_abac_evaluation, record_abac_failure
+
+# (resource, action, target) tuple of a batch check
+Check = Tuple[str, str, dict]
+
+
+def target_vars(expr) -> Optional[FrozenSet[str]]:
+    """
+    Collect the target attributes an expression reads.
+
+    Args:
+        expr: ABAC expression
+
+    Returns:
+        Paths below ``target``, or None if the whole target is read
+    """
+    paths = set()
+
+    def visit(node) -> bool:
+        if isinstance(node, dict):
+            if "var" in node:
+                path = node["var"]
+                if not isinstance(path, str) or path == "target":
+                    return False
+                if path.startswith("target."):
+                    paths.add(path[len("target."):])
+                return True
+            return all(visit(args) for args in node.values())
+        if isinstance(node, list):
+            return all(visit(item) for item in node)
+        return True
+
+    return frozenset(paths) if visit(expr) else None
+
+
+def _group_key(target: dict, paths: Optional[Tuple[str, ...]]) -> str:
+    """Key of the target attributes the policies read."""
+    if paths is None:
+        projection: Any = target
+    else:
+        engine = ABACEngine({"target": target})
+        projection = [engine.resolve_var(f"target.{path}") for path in paths]
+    return json.dumps(projection, sort_keys=True, default=str)
+
+
+def _decided_by(path: str) -> Optional[str]:
+    """
+    Target attribute deciding the value of ``target.<path>``.
+
+    Provided attributes depend on their key, None if that is not in the target.
+    """
+    key = attribute_providers.key_path(f"target.{path}")
+    return key[len("target."):] if key.startswith("target.") else None
+
+
+def _compiled(permission) -> Compiled:
+    """Compiled expression of a policy, precompiled by the policy index."""
+    compiled = getattr(permission, "compiled", None)
+    return compiled or ABACEngine.compile_cached(permission.expression)
+
+
+def _cost(permission) -> int:
+    """Estimated evaluation cost of a policy, 0 when unconditional."""
+    if permission.expression is None:
+        return 0
+    try:
+        return _compiled(permission).cost
+    except ValueError:
+        return 0  # evaluated first so the invalid expression is logged
 
 
 class ABAuthorizer:
     def __init__(self, db):
+        self.db = db
         self.policy_service = PermissionService(db)
 
-    async def is_allowed(self, resource, action, actor, target):
-        roles = [role.name for role in actor.roles]
-
-        permissions = await self.policy_service.get_policies(roles, resource, action)
-        print(
-            f"Checking permissions for actor: {actor.id}, resource: {resource}, action: {action}"
-        )
-
-        # Extract actor fields for ABAC context
-        actor_context = {
+    @staticmethod
+    def _actor_context(actor, roles: List[str]) -> dict:
+        """Extract actor fields for the ABAC context."""
+        return {
             "id": actor.id,
             "name": actor.name,
             "email": actor.email,
@@ -25,13 +103,225 @@ class ABAuthorizer:
             "roles": roles,
         }
 
-        context = {"actor": actor_context, "target": target}
+    @staticmethod
+    def _evaluate(permission, context, resource, action, actor_id) -> bool:
+        """
+        Evaluate one policy, recording metrics and the debug trace.
 
-        for permission in permissions:
+        A policy that raises or runs over ``ABAC_POLICY_BUDGET_MS`` denies.
+        """
+        tracing = authz_trace.enabled
+        start = time.perf_counter()
+        steps = [] if tracing else None
+        reason = None
+        try:
             if permission.expression is None:
+                allowed = True
+            elif tracing:
+                # The interpreter records every step for the trace
+                allowed = bool(
+                    ABACEngine(context, steps).evaluate(permission.expression)
+                )
+            else:
+                allowed = bool(_compiled(permission).run(context))
+        except Exception as e:
+            logger.warning(f"Policy {permission.name} failed, denying: {e}")
+            allowed, reason = False, "error"
+        elapsed = time.perf_counter() - start
+        budget = settings.ABAC_POLICY_BUDGET_MS
+        if reason is None and budget > 0 and elapsed * 1000 > budget:
+            logger.warning(
+                f"Policy {permission.name} took {elapsed * 1000:.1f} ms, denying"
+            )
+            allowed, reason = False, "budget"
+        if reason is not None:
+            record_abac_failure(permission.name, reason)
+        record_abac_evaluation(permission.name, allowed, elapsed)
+        if tracing:
+            authz_trace.decision(
+                user_id=actor_id,
+                resource=resource,
+                action=action,
+                policy_id=permission.permission_id,
+                expression=permission.expression,
+                outcome=allowed,
+                duration_ms=elapsed * 1000,
+                steps=steps,
+                reason=reason,
+            )
+        return allowed
+
+    @staticmethod
+    def _trace_no_policy(actor_id, resource, action) -> None:
+        if authz_trace.enabled:
+            authz_trace.decision(
+                user_id=actor_id,
+                resource=resource,
+                action=action,
+                policy_id=None,
+                expression=None,
+                outcome=False,
+                duration_ms=0.0,
+                reason="no matching policy",
+            )
+
+    @staticmethod
+    def _trace_request(context, resource, action) -> None:
+        """Record a request with its full context, replayable offline."""
+        if authz_trace.enabled:
+            authz_trace.event(
+                "authz.request",
+                user_id=context["actor"]["id"],
+                actor=context["actor"],
+                resource=resource,
+                action=action,
+                target=context.get("target"),
+            )
+
+    async def _policies(self, roles, resource, action):
+        """Policies of a pair, from the index once it is loaded."""
+        if policy_index.loaded:
+            return policy_index.lookup(roles, resource, action)
+        return await self.policy_service.get_policies(roles, resource, action)
+
+    async def _policies_for(self, roles, pairs) -> Dict[Tuple[str, str], list]:
+        """Policies of several pairs, keyed by requested pair."""
+        if policy_index.loaded:
+            return {
+                pair: list(policy_index.lookup(roles, *pair)) for pair in pairs
+            }
+        permissions = await self.policy_service.get_policies_for(roles, pairs)
+        return {
+            (resource, action): [
+                permission
+                for permission in permissions
+                if wildcard_match(permission.resource, resource)
+                and wildcard_match(permission.action, action)
+            ]
+            for resource, action in pairs
+        }
+
+    async def is_allowed(self, resource, action, actor, target):
+        roles = [role.name for role in actor.roles]
+
+        permissions = await self._policies(roles, resource, action)
+
+        context = {"actor": self._actor_context(actor, roles), "target": target}
+        # Stored attributes are loaded only if a policy references them
+        context = await attribute_providers.provide(
+            self.db,
+            context,
+            attribute_providers.required(p.expression for p in permissions),
+        )
+        self._trace_request(context, resource, action)
+
+        # Any allowing policy decides, so the cheapest are tried first
+        for permission in sorted(permissions, key=_cost):
+            if self._evaluate(permission, context, resource, action, actor.id):
                 return True
-            engine = ABACEngine(context)
-            if engine.evaluate(permission.expression):
-                return True
 
-        return False
\ No newline at end of file
+        if not permissions:
+            self._trace_no_policy(actor.id, resource, action)
+        return False
+
+    async def authorized_filter(self, resource, action, actor, model):
+        """
+        Build the WHERE clause selecting the rows the actor may access.
+
+        Policies are partially evaluated against the actor, leaving
+        conditions on ``target.*`` that map to columns of ``model``.
+
+        Args:
+            resource: Resource name
+            action: Action name
+            actor: User with roles loaded
+            model: Mapped class of the listed rows
+
+        Returns:
+            WHERE clause, or None if no row is allowed
+        """
+        roles = [role.name for role in actor.roles]
+        permissions = await self._policies(roles, resource, action)
+        if not permissions:
+            self._trace_no_policy(actor.id, resource, action)
+            return None
+        context = await attribute_providers.provide(
+            self.db,
+            {"actor": self._actor_context(actor, roles)},
+            attribute_providers.required(p.expression for p in permissions),
+        )
+        return policy_filter(
+            [permission.expression for permission in permissions], context, model
+        )
+
+    async def is_allowed_batch(self, actor, checks: Iterable[Check]) -> List[bool]:
+        """
+        Authorize many (resource, action, target) checks at once.
+
+        Policies of every pair are fetched at once. Targets agreeing on
+        the attributes those policies read share a single evaluation, so a
+        page of rows usually costs a handful of evaluations.
+
+        Args:
+            actor: User with roles loaded
+            checks: (resource, action, target) tuples
+
+        Returns:
+            Whether each check is allowed, in input order
+        """
+        checks = list(checks)
+        roles = [role.name for role in actor.roles]
+        pairs = {(resource, action) for resource, action, _ in checks}
+        policies = await self._policies_for(roles, pairs)
+
+        # Target attributes read per pair, None when any policy reads it all
+        read: Dict[Tuple[str, str], Optional[Tuple[str, ...]]] = {}
+        for pair, pair_policies in policies.items():
+            paths: Optional[set] = set()
+            for permission in pair_policies:
+                used = target_vars(permission.expression)
+                if used is None:
+                    paths = None
+                    break
+                paths |= {_decided_by(path) for path in used}
+            if paths is not None:
+                paths.discard(None)
+            read[pair] = None if paths is None else tuple(sorted(paths))
+
+        actor_context = self._actor_context(actor, roles)
+        groups: Dict[Tuple[str, str, str], dict] = {}
+        keys: List[Optional[Tuple[str, str, str]]] = []
+        unmatched = set()
+        for resource, action, target in checks:
+            pair = (resource, action)
+            if not policies.get(pair):
+                if pair not in unmatched:
+                    unmatched.add(pair)
+                    self._trace_no_policy(actor.id, resource, action)
+                keys.append(None)
+                continue
+            key = (resource, action, _group_key(target, read[pair]))
+            groups.setdefault(key, target)
+            keys.append(key)
+
+        # Stored attributes of every group load together, one batch per provider
+        contexts = await asyncio.gather(
+            *(
+                attribute_providers.provide(
+                    self.db,
+                    {"actor": actor_context, "target": target},
+                    attribute_providers.required(
+                        p.expression for p in policies[key[:2]]
+                    ),
+                )
+                for key, target in groups.items()
+            )
+        )
+        decisions = {}
+        for key, context in zip(groups, contexts):
+            self._trace_request(context, key[0], key[1])
+            decisions[key] = any(
+                self._evaluate(permission, context, key[0], key[1], actor.id)
+                for permission in sorted(policies[key[:2]], key=_cost)
+            )
+        return [key is not None and decisions[key] for key in keys]
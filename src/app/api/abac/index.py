@@ -0,0 +1,242 @@
+"""In-memory index of ABAC policies by role, resource and action."""
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.api.abac.engine import ABACEngine, Compiled
+from src.app.models import Permission, Role
+from src.app.models.role import role_permission
+from src.app.services.permission import wildcard_patterns
+from src.core.db.session import engine as primary_engine
+
+# Cached lookups kept before the memo is reset
+MEMO_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class Policy:
+    """Detached copy of a permission, safe to share across requests."""
+
+    permission_id: int
+    name: str
+    resource: str
+    action: str
+    expression: Any
+    compiled: Optional[Compiled] = field(default=None, compare=False, repr=False)
+
+
+def _compile(expression: Any) -> Optional[Compiled]:
+    """Compile a policy at load time, leaving invalid ones to fail when used."""
+    if expression is None:
+        return None
+    try:
+        return ABACEngine.compile(expression)
+    except Exception as e:
+        logger.warning(f"Policy expression not compiled: {e}")
+        return None
+
+
+# resource pattern -> action pattern -> policies
+RoleRules = Dict[str, Dict[str, List[Policy]]]
+
+
+class PolicyIndex:
+    """
+    Policies of every role, looked up without touching the database.
+
+    Rules are bucketed by their resource and action patterns, so a lookup
+    probes the few patterns that can match a concrete pair (the pair itself,
+    its ``prefix.*`` patterns and ``*``). Loaded once at startup; writes to
+    roles and permissions reload only the affected roles, and a periodic
+    full reload picks up changes made by other processes.
+    """
+
+    def __init__(self, engine: Optional[AsyncEngine] = None):
+        self.engine = engine or primary_engine
+        self.loaded = False
+        self._rules: Dict[str, RoleRules] = {}
+        self._role_names: Dict[int, str] = {}
+        self._permission_roles: Dict[int, Set[int]] = defaultdict(set)
+        self._memo: Dict[Tuple[FrozenSet[str], str, str], Tuple[Policy, ...]] = {}
+        self._lock = asyncio.Lock()
+        self._reloader: Optional[asyncio.Task] = None
+
+    def lookup(
+        self, role_names: Iterable[str], resource: str, action: str
+    ) -> Tuple[Policy, ...]:
+        """
+        Get the policies granted to the roles for a resource and action.
+
+        Args:
+            role_names: Names of the actor's roles
+            resource: Concrete resource
+            action: Concrete action
+
+        Returns:
+            Matching policies ordered by permission id, each once
+        """
+        key = (frozenset(role_names), resource, action)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        resources = wildcard_patterns(resource)
+        actions = wildcard_patterns(action)
+        found: Dict[int, Policy] = {}
+        for role in key[0]:
+            rules = self._rules.get(role)
+            if not rules:
+                continue
+            for resource_pattern in resources:
+                by_action = rules.get(resource_pattern)
+                if not by_action:
+                    continue
+                for action_pattern in actions:
+                    for policy in by_action.get(action_pattern, ()):
+                        found[policy.permission_id] = policy
+
+        policies = tuple(found[i] for i in sorted(found))
+        if len(self._memo) >= MEMO_SIZE:
+            self._memo.clear()
+        self._memo[key] = policies
+        return policies
+
+    async def _fetch(self, role_ids: Optional[Set[int]]) -> List[Any]:
+        """Read roles with their permissions, all roles when ``role_ids`` is None."""
+        stmt = (
+            select(
+                Role.role_id,
+                Role.name.label("role_name"),
+                Permission.permission_id,
+                Permission.name,
+                Permission.resource,
+                Permission.action,
+                Permission.expression,
+            )
+            .outerjoin(role_permission, role_permission.c.role_id == Role.role_id)
+            .outerjoin(
+                Permission,
+                Permission.permission_id == role_permission.c.permission_id,
+            )
+        )
+        if role_ids is not None:
+            stmt = stmt.where(Role.role_id.in_(role_ids))
+        async with self.engine.connect() as conn:
+            return list(await conn.execute(stmt))
+
+    def _apply(self, rows: List[Any], role_ids: Optional[Set[int]]) -> None:
+        """Replace the rules of the fetched roles, dropping vanished ones."""
+        if role_ids is None:
+            self._rules.clear()
+            self._role_names.clear()
+            self._permission_roles.clear()
+        else:
+            for role_id in role_ids:
+                name = self._role_names.pop(role_id, None)
+                if name is not None:
+                    self._rules.pop(name, None)
+            for roles in self._permission_roles.values():
+                roles.difference_update(role_ids)
+
+        for row in rows:
+            self._role_names[row.role_id] = row.role_name
+            rules = self._rules.setdefault(row.role_name, {})
+            if row.permission_id is None:
+                continue
+            policy = Policy(
+                row.permission_id,
+                row.name,
+                row.resource,
+                row.action,
+                row.expression,
+                _compile(row.expression),
+            )
+            rules.setdefault(row.resource, {}).setdefault(row.action, []).append(policy)
+            self._permission_roles[row.permission_id].add(row.role_id)
+        self._memo.clear()
+
+    async def load(self) -> None:
+        """Build the index from every role and permission."""
+        async with self._lock:
+            self._apply(await self._fetch(None), None)
+            self.loaded = True
+        logger.info(f"Policy index loaded ({len(self._rules)} roles)")
+
+    async def refresh(
+        self,
+        role_ids: Iterable[int] = (),
+        permission_ids: Iterable[int] = (),
+    ) -> None:
+        """
+        Reload the roles affected by a change.
+
+        Args:
+            role_ids: Roles created, renamed, deleted or relinked
+            permission_ids: Permissions updated or deleted; every role
+                holding them is reloaded
+        """
+        if not self.loaded:
+            return
+        permission_ids = list(permission_ids)
+        try:
+            async with self._lock:
+                affected = set(role_ids)
+                for permission_id in permission_ids:
+                    affected |= self._permission_roles.get(permission_id, set())
+                if permission_ids:
+                    # Links created since the last load are only in the database
+                    stmt = select(role_permission.c.role_id).where(
+                        role_permission.c.permission_id.in_(permission_ids)
+                    )
+                    async with self.engine.connect() as conn:
+                        affected |= set((await conn.execute(stmt)).scalars())
+                if affected:
+                    self._apply(await self._fetch(affected), affected)
+        except Exception as e:
+            # A stale index is corrected by the next periodic reload
+            logger.error(f"Policy index refresh failed: {e}")
+
+    async def _reload_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.error(f"Policy index reload failed: {e}")
+
+    async def start(self, interval: float) -> None:
+        """
+        Load the index and keep it fresh.
+
+        Args:
+            interval: Seconds between full reloads, 0 disables them
+        """
+        try:
+            await self.load()
+        except Exception as e:
+            # Authorization falls back to querying the database
+            logger.error(f"Policy index unavailable: {e}")
+            return
+        if interval > 0 and self._reloader is None:
+            self._reloader = asyncio.create_task(
+                self._reload_periodically(interval), name="policy-index-reload"
+            )
+
+    async def stop(self) -> None:
+        """Stop reloading and drop the index."""
+        if self._reloader is not None:
+            self._reloader.cancel()
+            await asyncio.gather(self._reloader, return_exceptions=True)
+            self._reloader = None
+        self.loaded = False
+        self._apply([], None)
+
+
+# Global instance
+policy_index = PolicyIndex()
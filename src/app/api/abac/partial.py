@@ -0,0 +1,220 @@
+"""Partial evaluation of ABAC expressions into SQL filters."""
+
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+from loguru import logger
+from sqlalchemy import Boolean, and_, false, func, literal, not_, or_, true
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.app.api.abac.engine import ABACEngine
+
+TARGET_PREFIX = "target."
+
+# Target of a request for a whole list, as checked by has_permission
+LIST_TARGET = {"response": "all"}
+
+
+class PartialEvaluationError(ValueError):
+    """Residual expression that cannot be expressed in SQL."""
+
+
+class Var(NamedTuple):
+    """Target attribute left unresolved."""
+
+    path: str
+
+
+class Residual(NamedTuple):
+    """Operator applied to at least one unresolved argument."""
+
+    op: str
+    args: List[Any]
+
+
+def _is_residual(value: Any) -> bool:
+    return isinstance(value, (Var, Residual))
+
+
+def partial_evaluate(expr: Any, context: dict, known: Optional[dict] = None) -> Any:
+    """
+    Evaluate everything in an expression except the target attributes.
+
+    Args:
+        expr: ABAC expression
+        context: Context without a ``target``, usually just the actor
+        known: Target attributes with a fixed value, resolved like the actor
+
+    Returns:
+        The value if the expression does not depend on the target, otherwise
+        a ``Residual`` or ``Var`` tree over target attributes
+    """
+    engine = ABACEngine({**context, "target": known or {}})
+    known = known or {}
+
+    def visit(node: Any) -> Any:
+        if not isinstance(node, dict):
+            return node
+        if "var" in node:
+            path = node["var"]
+            if isinstance(path, str) and path.startswith(TARGET_PREFIX):
+                name = path[len(TARGET_PREFIX):]
+                if name.split(".")[0] in known:
+                    return engine.resolve_var(path)
+                return Var(name)
+            if path == "target":
+                raise PartialEvaluationError("the whole target cannot be filtered")
+            return engine.resolve_var(path)
+
+        for op, args in node.items():
+            if not isinstance(args, list):
+                args = [args]
+            if op == "if":
+                if len(args) < 2:
+                    raise ValueError('"if" operator requires at least 2 arguments')
+                condition = visit(args[0])
+                if _is_residual(condition):
+                    return Residual(op, [condition] + [visit(arg) for arg in args[1:]])
+                if condition:
+                    return visit(args[1])
+                return visit(args[2]) if len(args) > 2 else None
+            if op not in ABACEngine.OPERATORS:
+                raise ValueError(f"Unknown operator: {op}")
+
+            values = [visit(arg) for arg in args]
+            if op in ("and", "or"):
+                # Decided arguments fold away, as with all() and any()
+                decisive = op == "or"
+                residual = []
+                for value in values:
+                    if _is_residual(value):
+                        residual.append(value)
+                    elif bool(value) is decisive:
+                        return decisive
+                if not residual:
+                    return not decisive
+                return residual[0] if len(residual) == 1 else Residual(op, residual)
+            if any(_is_residual(value) for value in values):
+                return Residual(op, values)
+            return ABACEngine.OPERATORS[op](*values)
+        return node
+
+    return visit(expr)
+
+
+def _column(model: Any, var: Var) -> ColumnElement:
+    """Column of ``model`` a target attribute refers to."""
+    column = model.__table__.columns.get(var.path)
+    if column is None:
+        raise PartialEvaluationError(f"no column for target.{var.path}")
+    return column
+
+
+def _negate(condition: ColumnElement) -> ColumnElement:
+    """Negation treating NULL as false, as Python does with None."""
+    return not_(func.coalesce(condition, false()))
+
+
+def to_sql(residual: Any, model: Any) -> ColumnElement:
+    """
+    Translate a residual expression into a WHERE clause on ``model``.
+
+    Args:
+        residual: Output of ``partial_evaluate``
+        model: Mapped class whose columns are the target attributes
+
+    Returns:
+        Boolean SQL expression
+
+    Raises:
+        PartialEvaluationError: If an operator has no SQL equivalent
+    """
+
+    def operand(node: Any) -> Any:
+        if isinstance(node, Var):
+            return _column(model, node)
+        if isinstance(node, Residual):
+            return clause(node)
+        return node
+
+    def clause(node: Any) -> ColumnElement:
+        if isinstance(node, Var):
+            column = _column(model, node)
+            if not isinstance(column.type, Boolean):
+                raise PartialEvaluationError(f"target.{node.path} is not boolean")
+            return column
+        if not isinstance(node, Residual):
+            return true() if node else false()
+
+        op, args = node.op, node.args
+        if op == "and":
+            return and_(*(clause(arg) for arg in args))
+        if op == "or":
+            return or_(*(clause(arg) for arg in args))
+        if op == "not":
+            return _negate(clause(args[0]))
+
+        a, b = (operand(arg) for arg in args[:2]) if len(args) >= 2 else (None, None)
+        if op in ("eq", "neq"):
+            if not isinstance(a, ColumnElement):
+                a, b = b, a
+            return a == b if op == "eq" else a.is_distinct_from(b)
+        if op in ("lt", "gt"):
+            left = a if isinstance(a, ColumnElement) else literal(a)
+            return left < b if op == "lt" else left > b
+        if op in ("in", "contains"):
+            # Both test "b in a"
+            if isinstance(b, ColumnElement) and isinstance(a, (list, set, tuple)):
+                return b.in_(list(a))
+            if isinstance(a, ColumnElement) and isinstance(b, str):
+                return a.contains(b, autoescape=True)
+        if op in ("startswith", "endswith"):
+            if isinstance(a, ColumnElement) and isinstance(b, str):
+                method = a.startswith if op == "startswith" else a.endswith
+                return method(b, autoescape=True)
+        if op == "regexMatch":
+            pattern, value = a, b
+            if isinstance(value, ColumnElement) and isinstance(pattern, str):
+                # re.match anchors at the start, a Postgres regex does not
+                return value.regexp_match(f"^(?:{pattern})")
+        raise PartialEvaluationError(f'"{op}" cannot be translated to SQL')
+
+    return clause(residual)
+
+
+def policy_filter(
+    expressions: Iterable[Any], context: dict, model: Any
+) -> Optional[ColumnElement]:
+    """
+    Combine policies into the filter of the rows they allow.
+
+    A row is visible if any policy allows it. Attributes of ``LIST_TARGET``
+    that are not columns of ``model`` keep their list-request value, so
+    policies written for whole-list checks still apply. Policies whose
+    residual has no SQL equivalent are skipped, failing closed.
+
+    Args:
+        expressions: Expressions of the matching policies, None if unconditional
+        context: Context without a ``target``
+        model: Mapped class of the listed rows
+
+    Returns:
+        WHERE clause, ``true()`` when unrestricted, or None if no row is allowed
+    """
+    columns = model.__table__.columns
+    known = {name: value for name, value in LIST_TARGET.items() if name not in columns}
+    clauses = []
+    for expr in expressions:
+        if expr is None:
+            return true()
+        try:
+            residual = partial_evaluate(expr, context, known)
+            if not _is_residual(residual):
+                if residual:
+                    return true()
+                continue
+            clauses.append(to_sql(residual, model))
+        except PartialEvaluationError as e:
+            logger.warning(f"Policy skipped for {model.__tablename__} filtering: {e}")
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else or_(*clauses)
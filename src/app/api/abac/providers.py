@@ -0,0 +1,55 @@
+"""Built-in ABAC attribute providers."""
+
+from typing import Any, Dict, Hashable, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.app.api.abac.attributes import attribute_providers
+from src.app.models import Route, User
+
+
+@attribute_providers.register("target.user", key="target.user_id")
+async def load_users(db: AsyncSession, keys: List[Hashable]) -> Dict[Hashable, Any]:
+    """Users referenced by ``target.user_id``, with their role names."""
+    result = await db.execute(
+        select(User)
+        .where(User.id.in_([str(key) for key in keys]))
+        .options(selectinload(User.roles))
+    )
+    users = {
+        user.id: {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "is_active": user.is_active,
+            "is_superuser": user.is_superuser,
+            "roles": [role.name for role in user.roles],
+        }
+        for user in result.scalars()
+    }
+    # Keys from JSON bodies or path parameters may not be strings
+    return {key: users.get(str(key)) for key in keys}
+
+
+@attribute_providers.register("target.route", key="target.route_id")
+async def load_routes(db: AsyncSession, keys: List[Hashable]) -> Dict[Hashable, Any]:
+    """Routes referenced by ``target.route_id``, with their role names."""
+    ids = [int(key) for key in keys if str(key).isdigit()]
+    result = await db.execute(
+        select(Route).where(Route.id.in_(ids)).options(selectinload(Route.roles))
+    )
+    routes = {
+        route.id: {
+            "id": route.id,
+            "path": route.path,
+            "module_id": route.module_id,
+            "parent_id": route.parent_id,
+            "is_active": route.is_active,
+            "roles": [role.name for role in route.roles],
+        }
+        for route in result.scalars()
+    }
+    # Keys from JSON bodies or path parameters may be strings
+    return {key: routes.get(int(key)) for key in keys if str(key).isdigit()}
@@ -0,0 +1,271 @@
+"""Bounded regular expressions for the ABAC ``regexMatch`` operator."""
+
+import re
+from re import _parser as sre_parse
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.config import settings
+
+try:
+    import re2  # linear-time engine (poetry install -E re2)
+except ImportError:
+    re2 = None
+
+# Compiled patterns kept before the cache is reset
+PATTERN_CACHE_SIZE = 1024
+
+# Largest counted repetition, as in RE2
+MAX_REPEAT_COUNT = 1000
+
+_UNSUPPORTED = {
+    sre_parse.GROUPREF: "backreferences",
+    sre_parse.GROUPREF_EXISTS: "conditional groups",
+    sre_parse.ASSERT: "lookarounds",
+    sre_parse.ASSERT_NOT: "lookarounds",
+}
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, sre_parse.POSSESSIVE_REPEAT}
+
+# Anything may come first
+_ANY = None
+
+# Character classes with a known overlap, and a regex testing membership
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: re.compile(r"\d"),
+    sre_parse.CATEGORY_WORD: re.compile(r"\w"),
+    sre_parse.CATEGORY_SPACE: re.compile(r"\s"),
+}
+_OVERLAPPING_CATEGORIES = {
+    frozenset({sre_parse.CATEGORY_DIGIT, sre_parse.CATEGORY_WORD}),
+}
+# Widest range tested character by character against a class
+_MAX_RANGE_SCAN = 256
+
+
+class RegexError(ValueError):
+    """Pattern rejected for ``regexMatch``."""
+
+
+def _chars(low: int, high: int) -> Set[Tuple]:
+    """Range atoms for ``[low-high]``, with the other case of ASCII letters."""
+    atoms = {("range", low, high)}
+    for start, end, shift in ((65, 90, 32), (97, 122, -32)):
+        if low <= end and start <= high:
+            atoms.add(("range", max(low, start) + shift, min(high, end) + shift))
+    return atoms
+
+
+def _first(items) -> Optional[Set[Tuple]]:
+    """Characters a subpattern can start with, ``_ANY`` if unknown."""
+    for op, av in items:
+        if op == sre_parse.AT:
+            continue
+        if op == sre_parse.LITERAL:
+            return _chars(av, av)
+        if op == sre_parse.IN:
+            atoms: Set[Tuple] = set()
+            for item_op, item_av in av:
+                if item_op == sre_parse.LITERAL:
+                    atoms |= _chars(item_av, item_av)
+                elif item_op == sre_parse.RANGE:
+                    atoms |= _chars(*item_av)
+                elif item_op == sre_parse.CATEGORY and item_av in _CATEGORIES:
+                    atoms.add(("category", item_av))
+                else:
+                    return _ANY
+            return atoms
+        if op == sre_parse.SUBPATTERN:
+            return _first(av[-1])
+        if op == sre_parse.ATOMIC_GROUP:
+            return _first(av)
+        if op in _REPEATS:
+            # An optional item lets the next one start the match too
+            return _first(av[2]) if av[0] > 0 else _ANY
+        if op == sre_parse.BRANCH:
+            firsts = [_first(branch) for branch in av[1]]
+            if any(first is _ANY for first in firsts):
+                return _ANY
+            return set().union(*firsts)
+        return _ANY
+    # Matches the empty string, so whatever follows may come first
+    return _ANY
+
+
+def _atoms_overlap(a: Tuple, b: Tuple) -> bool:
+    if a[0] == b[0] == "range":
+        return a[1] <= b[2] and b[1] <= a[2]
+    if a[0] == b[0] == "category":
+        return a[1] == b[1] or frozenset({a[1], b[1]}) in _OVERLAPPING_CATEGORIES
+    (_, low, high), (_, category) = (a, b) if a[0] == "range" else (b, a)
+    if high - low > _MAX_RANGE_SCAN:
+        return True
+    member = _CATEGORIES[category].match
+    return any(member(chr(code)) for code in range(low, high + 1))
+
+
+def _overlap(a: Optional[Set[Tuple]], b: Optional[Set[Tuple]]) -> bool:
+    """Whether two character sets may share a character."""
+    if a is _ANY or b is _ANY:
+        return True
+    return any(_atoms_overlap(x, y) for x in a for y in b)
+
+
+def _nullable(items) -> bool:
+    """Whether a subpattern can match the empty string."""
+    return all(_nullable_item(op, av) for op, av in items)
+
+
+def _nullable_item(op, av) -> bool:
+    if op == sre_parse.AT:
+        return True
+    if op in _REPEATS:
+        return av[0] == 0 or _nullable(av[2])
+    if op == sre_parse.SUBPATTERN:
+        return _nullable(av[-1])
+    if op == sre_parse.ATOMIC_GROUP:
+        return _nullable(av)
+    if op == sre_parse.BRANCH:
+        return any(_nullable(branch) for branch in av[1])
+    return False
+
+
+def _edges(items, end: bool) -> List[Optional[Set[Tuple]]]:
+    """Characters of the unbounded repetitions a subpattern can start or end with."""
+    edges = []
+    for op, av in reversed(items) if end else items:
+        edges += _item_edges(op, av, end)
+        if not _nullable_item(op, av):
+            break
+    return edges
+
+
+def _item_edges(op, av, end: bool) -> List[Optional[Set[Tuple]]]:
+    if op in _REPEATS:
+        edges = _edges(av[2], end)
+        if av[1] == sre_parse.MAXREPEAT:
+            edges.append(_first(av[2]))
+        return edges
+    if op == sre_parse.SUBPATTERN:
+        return _edges(av[-1], end)
+    if op == sre_parse.ATOMIC_GROUP:
+        return _edges(av, end)
+    if op == sre_parse.BRANCH:
+        return [edge for branch in av[1] for edge in _edges(branch, end)]
+    return []
+
+
+def _check(items, outer: Optional[str]) -> None:
+    """
+    Reject the constructs that make backtracking exponential.
+
+    Args:
+        items: Parsed subpattern
+        outer: "bounded" or "unbounded" inside a repetition, else None
+    """
+    # Unbounded repetitions the next item may directly follow
+    pending: List[Optional[Set[Tuple]]] = []
+    for op, av in items:
+        if op in _UNSUPPORTED:
+            raise RegexError(f"{_UNSUPPORTED[op]} are not supported")
+        for head in _item_edges(op, av, end=False):
+            if any(_overlap(head, tail) for tail in pending):
+                raise RegexError("adjacent repetitions must not overlap")
+        tails = _item_edges(op, av, end=True)
+        pending = pending + tails if _nullable_item(op, av) else tails
+        if op in _REPEATS:
+            _, high, sub = av
+            unbounded = high == sre_parse.MAXREPEAT
+            if not unbounded and high > MAX_REPEAT_COUNT:
+                raise RegexError(f"repetition above {MAX_REPEAT_COUNT}")
+            repeating = high > 1
+            if repeating and outer is not None and (unbounded or outer == "unbounded"):
+                raise RegexError("nested quantifiers are not supported")
+            inner = outer
+            if repeating:
+                inner = "unbounded" if unbounded else outer or "bounded"
+            _check(sub, inner)
+        elif op == sre_parse.BRANCH:
+            branches = av[1]
+            if outer == "unbounded":
+                seen: Set[Tuple] = set()
+                for branch in branches:
+                    first = _first(branch)
+                    if first is _ANY or _overlap(seen, first):
+                        raise RegexError(
+                            "alternatives inside a repetition must start differently"
+                        )
+                    seen |= first
+            for branch in branches:
+                _check(branch, outer)
+        elif op == sre_parse.SUBPATTERN:
+            _check(av[-1], outer)
+        elif op == sre_parse.ATOMIC_GROUP:
+            _check(av, outer)
+
+
+def validate_pattern(pattern: Any) -> None:
+    """
+    Check that a pattern is accepted by ``regexMatch``.
+
+    Patterns are limited to a subset matched in linear time by RE2 and
+    without exponential backtracking by ``re``: no backreferences or
+    lookarounds, no repetition nested in an unbounded repetition, no
+    ambiguous alternatives under one, and no unbounded repetitions that can
+    follow each other over the same characters, such as ``a*a*``.
+
+    Args:
+        pattern: Pattern to check
+
+    Raises:
+        RegexError: If the pattern is rejected
+    """
+    if not isinstance(pattern, str):
+        raise RegexError("pattern must be a string")
+    if len(pattern) > settings.ABAC_REGEX_MAX_LENGTH:
+        raise RegexError(f"pattern longer than {settings.ABAC_REGEX_MAX_LENGTH}")
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error as e:
+        raise RegexError(f"invalid pattern: {e}") from e
+    _check(parsed, None)
+
+
+_compiled: Dict[str, Callable[[str], bool]] = {}
+
+
+def compile_pattern(pattern: Any) -> Callable[[str], bool]:
+    """
+    Compile a validated pattern into a matcher anchored at the start.
+
+    Uses RE2 when installed, ``re`` otherwise.
+
+    Args:
+        pattern: Pattern to compile
+
+    Returns:
+        Function telling whether a value matches; values longer than
+        ``ABAC_REGEX_MAX_INPUT`` never match
+
+    Raises:
+        RegexError: If the pattern is rejected
+    """
+    matcher = _compiled.get(pattern) if isinstance(pattern, str) else None
+    if matcher is None:
+        validate_pattern(pattern)
+        match = (re2 or re).compile(pattern).match
+        max_input = settings.ABAC_REGEX_MAX_INPUT
+
+        def matcher(value: str) -> bool:
+            return len(value) <= max_input and match(value) is not None
+
+        if len(_compiled) >= PATTERN_CACHE_SIZE:
+            _compiled.clear()
+        _compiled[pattern] = matcher
+    return matcher
+
+
+def regex_match(pattern: Any, value: Any) -> bool:
+    """Whether a value matches a pattern, False for non-strings."""
+    if not isinstance(value, str):
+        return False
+    return compile_pattern(pattern)(value)
+
@@ -0,0 +1,308 @@
+"""Replay recorded authorization requests against alternative policy sets."""
+
+import math
+import multiprocessing
+import time
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.app.api.abac.engine import ABACEngine
+from src.app.services.permission import wildcard_patterns
+
+# Recorded request: {"actor": {..., "roles": [...]}, "resource", "action", "target"}
+Request = Dict[str, Any]
+# Policy: {"permission_id", "name", "resource", "action", "expression", "roles"}
+PolicyRecord = Dict[str, Any]
+
+
+class PolicySet:
+    """Policies with their roles, compiled for repeated evaluation."""
+
+    def __init__(self, policies: Iterable[PolicyRecord]):
+        self.policies = list(policies)
+        self._rules: Dict[Tuple[str, str, str], List[Tuple[PolicyRecord, Any]]] = (
+            defaultdict(list)
+        )
+        self.errors: Dict[str, str] = {}
+        for policy in self.policies:
+            run = None
+            if policy.get("expression") is not None:
+                try:
+                    run = ABACEngine.compile(policy["expression"]).run
+                except Exception as e:
+                    self.errors[policy["name"]] = str(e)
+                    continue
+            for role in policy.get("roles", []):
+                key = (role, policy["resource"], policy["action"])
+                self._rules[key].append((policy, run))
+
+    def lookup(self, roles: Iterable[str], resource: str, action: str):
+        """Policies of the roles matching a resource and action, each once."""
+        found = {}
+        for role in roles:
+            for resource_pattern in wildcard_patterns(resource):
+                for action_pattern in wildcard_patterns(action):
+                    for policy, run in self._rules.get(
+                        (role, resource_pattern, action_pattern), ()
+                    ):
+                        found[policy["name"]] = (policy, run)
+        return list(found.values())
+
+    def decide(
+        self, request: Request, timings: Dict[str, List[float]]
+    ) -> Tuple[bool, List[str]]:
+        """
+        Evaluate every matching policy of a request.
+
+        All policies run, not just until the first grant, so each one's
+        latency is measured.
+
+        Args:
+            request: Recorded request
+            timings: Per-policy latency samples in milliseconds, appended to
+
+        Returns:
+            Decision and the names of the granting policies
+        """
+        actor = request.get("actor") or {}
+        context = {"actor": actor, "target": request.get("target") or {}}
+        granted = []
+        for policy, run in self.lookup(
+            actor.get("roles") or [], request["resource"], request["action"]
+        ):
+            start = time.perf_counter()
+            try:
+                allowed = run is None or bool(run(context))
+            except Exception:
+                allowed = False
+            timings[policy["name"]].append((time.perf_counter() - start) * 1000)
+            if allowed:
+                granted.append(policy["name"])
+        return bool(granted), granted
+
+
+def _simulate_chunk(
+    current: List[PolicyRecord],
+    proposed: List[PolicyRecord],
+    offset: int,
+    requests: List[Request],
+) -> Dict[str, Any]:
+    """Replay a chunk of requests against both policy sets, in a worker."""
+    sets = {"current": PolicySet(current), "proposed": PolicySet(proposed)}
+    timings: Dict[str, Dict[str, List[float]]] = {
+        name: defaultdict(list) for name in sets
+    }
+    diffs = []
+    for i, request in enumerate(requests, start=offset):
+        decisions = {
+            name: policy_set.decide(request, timings[name])
+            for name, policy_set in sets.items()
+        }
+        if decisions["current"][0] != decisions["proposed"][0]:
+            diffs.append(
+                {
+                    "index": i,
+                    "user_id": (request.get("actor") or {}).get("id"),
+                    "resource": request["resource"],
+                    "action": request["action"],
+                    "target": request.get("target"),
+                    "current": decisions["current"][0],
+                    "proposed": decisions["proposed"][0],
+                    "current_grants": decisions["current"][1],
+                    "proposed_grants": decisions["proposed"][1],
+                }
+            )
+    return {
+        "diffs": diffs,
+        "timings": {name: dict(samples) for name, samples in timings.items()},
+    }
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    rank = max(0, min(len(samples) - 1, math.ceil(pct / 100 * len(samples)) - 1))
+    return round(samples[rank], 4)
+
+
+def _latency(samples: List[float]) -> Dict[str, Any]:
+    samples = sorted(samples)
+    return {
+        "evaluations": len(samples),
+        "p50_ms": _percentile(samples, 50),
+        "p90_ms": _percentile(samples, 90),
+        "p99_ms": _percentile(samples, 99),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+# Seconds between checks of the running chunks
+POLL_INTERVAL = 0.05
+
+
+def _replay_in_pool(
+    chunks: List[Tuple], workers: int, timeout: Optional[float]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, int]]]:
+    """
+    Replay chunks in a process pool, giving each one ``timeout`` seconds.
+
+    At most ``workers`` chunks are submitted at once, so a chunk's deadline
+    starts when a worker is free to run it. A chunk past its deadline is
+    reported; the pool is then replaced, since its worker may be stuck, and
+    the other running chunks are replayed from the start in the new pool.
+    """
+    queue = deque(chunks)
+    results: List[Dict[str, Any]] = []
+    timed_out: List[Dict[str, int]] = []
+    while queue:
+        pool = multiprocessing.Pool(workers)
+        try:
+            running: List[Tuple[Tuple, Any, float]] = []
+            while queue or running:
+                while queue and len(running) < workers:
+                    chunk = queue.popleft()
+                    deadline = time.monotonic() + (
+                        math.inf if timeout is None else timeout
+                    )
+                    running.append(
+                        (chunk, pool.apply_async(_simulate_chunk, chunk), deadline)
+                    )
+                now = time.monotonic()
+                still_running = []
+                expired = False
+                for chunk, result, deadline in running:
+                    if result.ready():
+                        results.append(result.get())
+                    elif now >= deadline:
+                        timed_out.append({"start": chunk[2], "requests": len(chunk[3])})
+                        expired = True
+                    else:
+                        still_running.append((chunk, result, deadline))
+                running = still_running
+                if expired:
+                    # The stuck worker keeps its slot, so restart in a new pool
+                    queue.extendleft(chunk for chunk, _, _ in reversed(running))
+                    break
+                if running:
+                    running[0][1].wait(POLL_INTERVAL)
+        finally:
+            # Kills workers stuck in a pathological expression
+            pool.terminate()
+            pool.join()
+    timed_out.sort(key=lambda chunk: chunk["start"])
+    return results, timed_out
+
+
+def simulate(
+    requests: List[Request],
+    current: List[PolicyRecord],
+    proposed: List[PolicyRecord],
+    workers: int = 1,
+    chunk_size: int = 1000,
+    timeout: Optional[float] = None,
+    slow_ms: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Compare the decisions and costs of two policy sets.
+
+    Chunks of the corpus are replayed in a process pool. A chunk exceeding
+    ``timeout`` (e.g. a catastrophic regex) is reported and its worker
+    killed instead of hanging the run.
+
+    Args:
+        requests: Recorded requests
+        current: Deployed policies
+        proposed: Policies to compare against
+        workers: Worker processes, 1 replays in this process
+        chunk_size: Requests per task
+        timeout: Seconds a chunk may run once a worker picks it up, None
+            waits forever
+        slow_ms: p99 latency above which a policy is flagged
+
+    Returns:
+        Report with decision diffs and per-policy latency percentiles
+    """
+    chunks = [
+        (current, proposed, start, requests[start : start + chunk_size])
+        for start in range(0, len(requests), chunk_size)
+    ]
+    if workers <= 1:
+        results = [_simulate_chunk(*chunk) for chunk in chunks]
+        timed_out: List[Dict[str, int]] = []
+    else:
+        results, timed_out = _replay_in_pool(chunks, workers, timeout)
+
+    diffs = [diff for result in results for diff in result["diffs"]]
+    report: Dict[str, Any] = {
+        "requests": len(requests),
+        "replayed": len(requests) - sum(t["requests"] for t in timed_out),
+        "timed_out_chunks": timed_out,
+        "diffs": sorted(diffs, key=lambda diff: diff["index"]),
+        "granted_to_denied": sum(1 for d in diffs if d["current"]),
+        "denied_to_granted": sum(1 for d in diffs if not d["current"]),
+        "latency": {},
+        "slow_policies": {},
+        "invalid_policies": {
+            "current": PolicySet(current).errors,
+            "proposed": PolicySet(proposed).errors,
+        },
+    }
+    for name in ("current", "proposed"):
+        merged: Dict[str, List[float]] = defaultdict(list)
+        for result in results:
+            for policy, samples in result["timings"][name].items():
+                merged[policy].extend(samples)
+        latency = {policy: _latency(samples) for policy, samples in merged.items()}
+        report["latency"][name] = latency
+        report["slow_policies"][name] = sorted(
+            policy for policy, stats in latency.items() if stats["p99_ms"] > slow_ms
+        )
+    return report
+
+
+def corpus_from_trace(records: Iterable[Dict[str, Any]]) -> List[Request]:
+    """
+    Extract the recorded requests from authorization trace records.
+
+    Args:
+        records: Records of ``GET /debug/authz-trace``
+
+    Returns:
+        Requests, oldest first
+    """
+    requests = [
+        {
+            "actor": record["actor"],
+            "resource": record["resource"],
+            "action": record["action"],
+            "target": record.get("target"),
+        }
+        for record in records
+        if record.get("kind") == "event" and record.get("name") == "authz.request"
+    ]
+    requests.reverse()
+    return requests
+
+
+def apply_changes(
+    current: List[PolicyRecord], changes: Iterable[PolicyRecord]
+) -> List[PolicyRecord]:
+    """
+    Build a proposed policy set from changes to the current one.
+
+    A change replaces the policy with the same name, ``"deleted": true``
+    removes it, and unknown names are added.
+
+    Args:
+        current: Deployed policies
+        changes: Changed, deleted or new policies
+
+    Returns:
+        Proposed policies
+    """
+    proposed = {policy["name"]: policy for policy in current}
+    for change in changes:
+        if change.get("deleted"):
+            proposed.pop(change["name"], None)
+        else:
+            proposed[change["name"]] = {**proposed.get(change["name"], {}), **change}
+    return list(proposed.values())
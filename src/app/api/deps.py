@@ -1,24 +1,31 @@
 """API dependencies."""
 
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from sqlalchemy import select
+from sqlalchemy import select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
 from src.app.models import User, Role
 from src.app.schemas import TokenPayload, UserResponse
 from src.app.services import UserService
+from src.app.services.permission import WILDCARD
 from src.core.config import settings
 from src.core.db import get_db
 from src.app.api.abac.evaluator import ABAuthorizer
+from src.app.api.abac.partial import LIST_TARGET
+from src.core.debug import authz_trace
+from src.core.tracing import traced
 
 # HTTP Bearer scheme
 security = HTTPBearer()
 
 
+@traced("dependency:get_current_user")
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
@@ -26,6 +33,7 @@ async def get_current_user(
     Get current user from token.
 
     Args:
+        request: FastAPI request
         credentials: Bearer token credentials
         db: Database session
 
@@ -69,21 +77,18 @@ async def get_current_user(
     current_user = await user_service.get_by_username(username)
     if current_user is None:
         raise credentials_exception
-    print(f"Current user: {current_user} with ID: {current_user.id}")
-    return UserResponse(
-        id=current_user.id,
-        name=current_user.name,
-        phoneNumber=current_user.phoneNumber,
-        email=current_user.email,
-        username=current_user.username,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-        roles=[role.name for role in current_user.roles],
-    )
+    # Expose the principal to the access log
+    request.state.user_id = current_user.id
+    if authz_trace.enabled:
+        authz_trace.event(
+            "principal.resolved", user_id=current_user.id, username=username
+        )
+    return UserResponse.model_validate(current_user)
 
 
+@traced("dependency:get_current_user_with_roles")
 async def get_current_user_with_roles(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
@@ -91,6 +96,7 @@ async def get_current_user_with_roles(
     Get current user from token, with roles and permissions eagerly loaded.
 
     Args:
+        request: FastAPI request
         credentials: Bearer token credentials
         db: Database session
 
@@ -138,6 +144,8 @@ async def get_current_user_with_roles(
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    # Expose the principal to the access log
+    request.state.user_id = user.id
     return user
 
 
@@ -165,32 +173,44 @@ async def get_current_active_user(
     return current_user
 
 
+def is_superuser(user: User) -> bool:
+    """
+    Check if a principal has every permission.
+
+    Reads only the roles and permissions loaded with the principal, so the
+    check makes no query.
+
+    Args:
+        user: User with roles and permissions loaded
+
+    Returns:
+        True for the superuser flag or a role holding an unconditional
+        ``*``/``*`` permission
+    """
+    if user.is_superuser:
+        return True
+    return any(
+        permission.resource == WILDCARD
+        and permission.action == WILDCARD
+        and permission.expression is None
+        for role in user.roles
+        for permission in role.permissions
+    )
+
+
 async def get_current_superuser(
     current_user: User = Depends(get_current_user_with_roles),
-    db: AsyncSession = Depends(get_db),
 ) -> bool:
     """
-    Get current superuser.
+    Get whether the current user is a superuser.
 
     Args:
-        current_user: Current user
+        current_user: Current user with roles and permissions
 
     Returns:
-        Current superuser
-
-    Raises:
-        HTTPException: If user is not superuser
+        Whether the user has every permission
     """
-    try:
-        user_service = UserService(db)
-        user  = await user_service.get_by_username(current_user.username)
-        return user is not None
-
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error fetching user from database",
-        )
+    return is_superuser(current_user)
 
 
 def has_permission(resource: str, action: str):
@@ -205,6 +225,10 @@ def has_permission(resource: str, action: str):
         Dependency function
     """
 
+    @traced(
+        "dependency:check_permission",
+        {"authz.resource": resource, "authz.action": action},
+    )
     async def check_permission(
         current_user: User = Depends(get_current_user_with_roles),
         db: AsyncSession = Depends(get_db),
@@ -223,24 +247,25 @@ def has_permission(resource: str, action: str):
             HTTPException: If user does not have permission
         """
         # Superuser has all permissions
-        if await get_current_superuser(current_user, db):
-            return UserResponse(
-                id=current_user.id,
-                name=current_user.name,
-                phoneNumber=current_user.phoneNumber,
-                email=current_user.email,
-                username=current_user.username,
-                is_active=current_user.is_active,
-                created_at=current_user.created_at,
-                updated_at=current_user.updated_at,
-                roles=[role.name for role in current_user.roles],
-            )
+        if is_superuser(current_user):
+            if authz_trace.enabled:
+                authz_trace.decision(
+                    user_id=current_user.id,
+                    resource=resource,
+                    action=action,
+                    policy_id=None,
+                    expression=None,
+                    outcome=True,
+                    duration_ms=0.0,
+                    reason="superuser",
+                )
+            return UserResponse.model_validate(current_user)
         # Initialize ABAC Authorizer
         authorizer = ABAuthorizer(db)
         target = {}
         if request is None:
             # If request is not provided, assume it's a direct call
-            target = {"response": "all"}
+            target = dict(LIST_TARGET)
         else:
             if request.method == "POST" or request.method == "PUT":
                 target = await request.json()
@@ -250,26 +275,75 @@ def has_permission(resource: str, action: str):
                 if "id" in request.path_params:
                     target = {"id": request.path_params["id"]}
                 else:
-                    target = {"response": "all"}
+                    target = dict(LIST_TARGET)
 
         is_allowed = await authorizer.is_allowed(resource, action, current_user, target)
 
         # User does not have permission
         if is_allowed:
-            return UserResponse(
-                id=current_user.id,
-                name=current_user.name,
-                phoneNumber=current_user.phoneNumber,
-                email=current_user.email,
-                username=current_user.username,
-                is_active=current_user.is_active,
-                created_at=current_user.created_at,
-                updated_at=current_user.updated_at,
-                roles=[role.name for role in current_user.roles],
-            )
+            return UserResponse.model_validate(current_user)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
 
-    return check_permission
\ No newline at end of file
+    return check_permission
+
+
+class AuthorizedQuery(NamedTuple):
+    """Principal of a list request and the rows it may access."""
+
+    user: User
+    where: ColumnElement
+
+
+def permission_filter(resource: str, action: str, model: Any):
+    """
+    Authorize a list request by filtering rows instead of allowing all.
+
+    Policies are reduced to SQL conditions on the columns of ``model``, so
+    list endpoints fetch only authorized rows.
+
+    Args:
+        resource: Resource name
+        action: Action name
+        model: Mapped class of the listed rows
+
+    Returns:
+        Dependency function returning an ``AuthorizedQuery``
+    """
+
+    @traced(
+        "dependency:permission_filter",
+        {"authz.resource": resource, "authz.action": action},
+    )
+    async def build_filter(
+        current_user: User = Depends(get_current_user_with_roles),
+        db: AsyncSession = Depends(get_db),
+    ) -> AuthorizedQuery:
+        """
+        Build the row filter of the current user.
+
+        Args:
+            current_user: Current user
+            db: Database session
+
+        Returns:
+            Current user and the WHERE clause of the rows they may access
+
+        Raises:
+            HTTPException: If no row may be accessed
+        """
+        if is_superuser(current_user):
+            return AuthorizedQuery(current_user, true())
+        where = await ABAuthorizer(db).authorized_filter(
+            resource, action, current_user, model
+        )
+        if where is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions",
+            )
+        return AuthorizedQuery(current_user, where)
+
+    return build_filter
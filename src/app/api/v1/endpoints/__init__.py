@@ -5,6 +5,7 @@ from src.app.api.v1.endpoints.users import router as users_router
 from src.app.api.v1.endpoints.module import router as module_router
 from src.app.api.v1.endpoints.route import router as route_router
 from src.app.api.v1.endpoints.sidebar import router as sidebar_router
+from src.app.api.v1.endpoints.debug import router as debug_router
 
 __all__ = [
     "file_router"
@@ -14,4 +15,5 @@ __all__ = [
     "module_router",
     "route_router",
     "sidebar_router",
+    "debug_router",
 ]
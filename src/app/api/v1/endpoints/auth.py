@@ -7,7 +7,7 @@ from src.app.schemas import Login, RefreshToken, Token, UserResponse
 from src.app.services import AuthService, UserService
 from src.core.utils import create_rate_limiter
 from src.core.db import get_db
-from src.core.utils import file_upload_service
+from src.core.utils import file_upload_service, image_processing_service
 
 router = APIRouter()
 
@@ -76,6 +76,7 @@ async def register(
     photo_url = None
     if photo:
         file_info = await file_upload_service.save_file(photo, subfolder="userphotos")
+        await image_processing_service.enqueue(file_info["file_path"])
         photo_url = file_upload_service.get_file_url(file_info["file_path"])
     user_data = {
         "name": name,
@@ -87,16 +88,5 @@ async def register(
     }
     user_service = UserService(db)
     user = await user_service.create_user_with_role(user_data, role_id=role_id)
-    return UserResponse(
-        id=user.id,
-        name=user.name,
-        phoneNumber=user.phoneNumber,
-        email=user.email,
-        username=user.username,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        photo=user.photo,
-        roles=[role.name for role in user.roles] if user.roles else [],
-    )
+    return UserResponse.model_validate(user).model_copy(update={"photo": photo_url})
 
@@ -0,0 +1,39 @@
+"""Debug endpoints."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.app.api import has_permission
+from src.app.models import User
+from src.core.debug import authz_trace
+
+router = APIRouter()
+
+
+@router.get("/authz-trace")
+async def get_authz_trace(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum records"),
+    user_id: Optional[str] = Query(None, description="Filter by user"),
+    request_id: Optional[str] = Query(None, description="Filter by request"),
+    current_user: User = Depends(has_permission("debug", "read")),
+):
+    """
+    Inspect recent authorization decisions of this worker.
+
+    Records are only collected while AUTHZ_TRACE_ENABLED is set.
+    """
+    return {
+        "enabled": authz_trace.enabled,
+        "records": authz_trace.records(
+            limit=limit, user_id=user_id, request_id=request_id
+        ),
+    }
+
+
+@router.delete("/authz-trace", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_authz_trace(
+    current_user: User = Depends(has_permission("debug", "delete")),
+) -> None:
+    """Clear the authorization trace buffer."""
+    authz_trace.clear()
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import FileResponse
-from pathlib import Path
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
+from pathlib import PurePosixPath
 from src.core.config import settings
+from src.core.storage import normalize_key
+from src.core.utils import file_upload_service
+from src.core.utils.image_processing import image_processing_service, variant_path
 from src.app.api.deps import has_permission
 
 router = APIRouter()
@@ -9,20 +13,48 @@ router = APIRouter()
 
 @router.get("/files/{file_path:path}")
 async def serve_file(
-    file_path: str, current_user: dict = Depends(has_permission("file", "read"))
+    file_path: str,
+    size: Optional[int] = Query(
+        None, ge=1, description="Serve a precomputed thumbnail of this size"
+    ),
+    current_user: dict = Depends(has_permission("file", "read")),
 ):
     """Serve uploaded files."""
-    full_path = Path(settings.UPLOAD_DIR) / file_path
+    storage = file_upload_service.storage
 
-    if not full_path.exists() or not full_path.is_file():
-        raise HTTPException(status_code=404, detail="File not found")
-
-    # Security: Ensure file is within upload directory
+    # Security: Ensure file stays within the storage root
     try:
-        full_path.resolve().relative_to(Path(settings.UPLOAD_DIR).resolve())
+        file_key = normalize_key(file_path)
     except ValueError:
         raise HTTPException(status_code=403, detail="Access denied")
+    file_key = await file_upload_service.resolve_key(file_key)
+    if file_key is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    media_type = "application/octet-stream"
+
+    # Prefer a precomputed thumbnail, falling back to the original
+    if size and image_processing_service.is_image(file_key):
+        variant_size = image_processing_service.resolve_size(size)
+        if variant_size:
+            variant_key = variant_path(file_key, variant_size)
+            if await storage.exists(variant_key):
+                file_key = variant_key
+                media_type = "image/webp"
+
+    # Object stores serve the bytes themselves
+    url = await storage.presigned_url(
+        file_key, expires_in=settings.S3_PRESIGNED_URL_EXPIRE_SECONDS
+    )
+    if url:
+        return RedirectResponse(url, status_code=307)
+
+    filename = PurePosixPath(file_key).name
+    local_path = storage.local_path(file_key)
+    if local_path is not None:
+        return FileResponse(path=local_path, filename=filename, media_type=media_type)
 
-    return FileResponse(
-        path=full_path, filename=full_path.name, media_type="application/octet-stream"
+    return StreamingResponse(
+        storage.open(file_key),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
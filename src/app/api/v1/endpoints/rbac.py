@@ -2,14 +2,25 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.core.db import get_db
+from src.core.cache import RBAC_CACHE_NAMESPACE, invalidate_cache
+from src.core.db import get_db, read_only
+from src.core.responses import trusted_json
 from src.app.api import has_permission
+from src.app.api.deps import get_current_user_with_roles, is_superuser
+from src.app.api.abac.engine import ABACEngine
+from src.app.api.abac.evaluator import ABAuthorizer
+from src.app.api.abac.index import policy_index
 from src.app.models import User
 from src.app.schemas import (
+    AssociationBatch,
+    AssociationBatchResult,
+    AuthorizationBatch,
+    AuthorizationBatchResult,
     Permission,
     PermissionCreate,
+    PermissionList,
     PermissionUpdate,
     Role,
     RoleCreate,
@@ -21,6 +32,25 @@ from src.app.services import PermissionService, RoleService
 router = APIRouter()
 
 
+def validate_expression(expression) -> None:
+    """
+    Reject an ABAC expression that cannot be evaluated.
+
+    Raises:
+        HTTPException: If an operator is unknown, the expression is
+            malformed or a regexMatch pattern is not accepted
+    """
+    if expression is None:
+        return
+    try:
+        ABACEngine.compile(expression)
+    except Exception as e:  # e.g. AttributeError for a non-string var path
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid expression: {e}",
+        )
+
+
 # Role endpoints
 @router.post("/roles", response_model=Role)
 async def create_role(
@@ -35,6 +65,7 @@ async def create_role(
 
 
 @router.get("/roles", response_model=List[Role])
+@read_only
 async def list_roles(
     skip: int = 0,
     limit: int = 100,
@@ -64,29 +95,31 @@ async def get_role(
 async def update_role(
     role_id: int,
     role_in: RoleUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("roles", "update")),
 ) -> Role:
     """Update role."""
     role_service = RoleService(db)
-    role = await role_service.get_by_id(role_id)
+    role = await role_service.update(role_id, role_in)
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
-    return await role_service.update(role, role_in)
+    background_tasks.add_task(policy_index.refresh, role_ids=[role_id])
+    return role
 
 
 @router.delete("/roles/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_role(
     role_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("roles", "delete")),
 ) -> None:
     """Delete role."""
     role_service = RoleService(db)
-    role = await role_service.get_by_id(role_id)
-    if not role:
+    if not await role_service.delete(role_id):
         raise HTTPException(status_code=404, detail="Role not found")
-    await role_service.delete(role)
+    background_tasks.add_task(policy_index.refresh, role_ids=[role_id])
 
 
 # Permission endpoints
@@ -97,11 +130,13 @@ async def create_permission(
     current_user: User = Depends(has_permission("permissions", "create")),
 ) -> Permission:
     """Create new permission."""
+    validate_expression(permission_in.expression)
     permission_service = PermissionService(db)
     return await permission_service.create(permission_in)
 
 
 @router.get("/permissions", response_model=List[Permission])
+@read_only
 async def list_permissions(
     skip: int = 0,
     limit: int = 300,
@@ -110,7 +145,11 @@ async def list_permissions(
 ) -> List[Permission]:
     """List permissions."""
     permission_service = PermissionService(db)
-    return await permission_service.get_multi(skip=skip, limit=limit)
+    permissions = await permission_service.get_multi(skip=skip, limit=limit)
+    return trusted_json(
+        PermissionList,
+        PermissionList.validate_python(permissions, from_attributes=True),
+    )
 
 
 @router.get("/permissions/{permission_id}", response_model=Permission)
@@ -131,54 +170,93 @@ async def get_permission(
 async def update_permission(
     permission_id: int,
     permission_in: PermissionUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("permissions", "update")),
 ) -> Permission:
     """Update permission."""
+    validate_expression(permission_in.expression)
     permission_service = PermissionService(db)
-    permission = await permission_service.get(permission_id)
+    permission = await permission_service.update(permission_id, permission_in)
     if not permission:
         raise HTTPException(status_code=404, detail="Permission not found")
-    return await permission_service.update(permission, permission_in)
+    background_tasks.add_task(policy_index.refresh, permission_ids=[permission_id])
+    return permission
 
 
 @router.delete("/permissions/{permission_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_permission(
     permission_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("permissions", "delete")),
 ) -> None:
     """Delete permission."""
     permission_service = PermissionService(db)
-    permission = await permission_service.get(permission_id)
-    if not permission:
+    if not await permission_service.delete(permission_id):
         raise HTTPException(status_code=404, detail="Permission not found")
-    await permission_service.delete(permission_id)
+    background_tasks.add_task(policy_index.refresh, permission_ids=[permission_id])
 
 
 # Role-Permission management
-@router.post("/roles/{role_id}/permissions/{permission_id}")
+@router.patch(
+    "/roles/{role_id}/permissions", response_model=AssociationBatchResult[int]
+)
+async def update_role_permissions(
+    role_id: int,
+    batch: AssociationBatch[int],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(has_permission("roles", "update")),
+):
+    """Add, remove or replace the permissions of a role in one request."""
+    role_service = RoleService(db)
+    change = await role_service.update_permissions(role_id, batch)
+    if change.changed:
+        # Runs after the response, so after the request transaction committed
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+        background_tasks.add_task(policy_index.refresh, role_ids=[role_id])
+    return change
+
+
+@router.post(
+    "/roles/{role_id}/permissions/{permission_id}",
+    response_model=Role,
+)
 async def add_permission_to_role(
     role_id: int,
     permission_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("roles", "update")),
-) -> Role:
+):
     """Add permission to role."""
     role_service = RoleService(db)
-    return await role_service.add_permission(role_id, permission_id)
+    affected = await role_service.add_permission(role_id, permission_id)
+    if affected:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+        background_tasks.add_task(policy_index.refresh, role_ids=[role_id])
+    return await role_service.get_by_id(role_id)
 
 
-@router.delete("/roles/{role_id}/permissions/{permission_id}")
+@router.delete(
+    "/roles/{role_id}/permissions/{permission_id}",
+    response_model=Role,
+)
 async def remove_permission_from_role(
     role_id: int,
     permission_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("roles", "update")),
-) -> Role:
+):
     """Remove permission from role."""
     role_service = RoleService(db)
-    return await role_service.remove_permission(role_id, permission_id)
+    affected = await role_service.remove_permission(role_id, permission_id)
+    if affected:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+        background_tasks.add_task(policy_index.refresh, role_ids=[role_id])
+    return await role_service.get_by_id(role_id)
 
 
 @router.get(
@@ -194,3 +272,22 @@ async def get_all_permissions_with_role_selected(
     """
     permission_service = PermissionService(db)
     return await permission_service.get_all_with_role_selected(role_id)
+
+
+@router.post("/authorize", response_model=AuthorizationBatchResult)
+async def authorize_batch(
+    batch: AuthorizationBatch,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user_with_roles),
+) -> AuthorizationBatchResult:
+    """
+    Check which actions the current user may perform, e.g. per row of a page.
+    """
+    if is_superuser(current_user):
+        return AuthorizationBatchResult(allowed=[True] * len(batch.checks))
+    authorizer = ABAuthorizer(db)
+    allowed = await authorizer.is_allowed_batch(
+        current_user,
+        [(check.resource, check.action, check.target) for check in batch.checks],
+    )
+    return AuthorizationBatchResult(allowed=allowed)
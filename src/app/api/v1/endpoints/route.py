@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.core.db import get_db
+from src.core.cache import RBAC_CACHE_NAMESPACE, invalidate_cache
+from src.core.db import get_db, query_budget, read_only
+from src.core.responses import trusted_json
 from src.app.api import has_permission
-from src.app.schemas import RouteCreate, RouteUpdate, RouteResponse, RouteComponentAdd, RouteComponentRemove, RouteComponentList
+from src.app.schemas import AssociationBatch, AssociationBatchResult, AssociationLinkResult, RouteCreate, RouteUpdate, RouteResponse, RouteResponseList, RouteComponentAdd, RouteComponentRemove, RouteComponentList
 from src.app.services import RouteService, RoleService
 from src.app.models import User
 
@@ -26,7 +28,7 @@ async def list_routes(
     current_user: User = Depends(has_permission("route", "read")),
 ):
     service = RouteService(db)
-    return await service.get_all()
+    return trusted_json(RouteResponseList, await service.get_all())
 
 
 @router.get("/indi/{route_id}", response_model=RouteResponse)
@@ -43,6 +45,8 @@ async def get_route(
 
 
 @router.get("/my-routes", response_model=list[RouteResponse])
+@query_budget(10)
+@read_only
 async def get_my_routes(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("route", "read")),
@@ -57,7 +61,9 @@ async def get_my_routes(
         role = await roles.get_by_name(role_name)
         if role:
             user_role_ids.append(role.role_id)
-    return await service.get_routes_by_role_ids(user_role_ids)
+    return trusted_json(
+        RouteResponseList, await service.get_routes_by_role_ids(user_role_ids)
+    )
 
 
 @router.put("/{route_id}", response_model=RouteResponse)
@@ -86,6 +92,66 @@ async def delete_route(
         raise HTTPException(status_code=404, detail="Route not found")
 
 
+@router.patch("/{route_id}/roles", response_model=AssociationBatchResult[int])
+async def update_route_roles(
+    route_id: int,
+    batch: AssociationBatch[int],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(has_permission("route", "update")),
+):
+    service = RouteService(db)
+    change = await service.update_roles(route_id, batch)
+    if change.changed:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return change
+
+
+@router.post("/{route_id}/roles/{role_id}", response_model=AssociationLinkResult)
+async def add_role_to_route(
+    route_id: int,
+    role_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(has_permission("route", "update")),
+):
+    service = RouteService(db)
+    affected = await service.add_role(route_id, role_id)
+    if affected:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return AssociationLinkResult(affected=affected)
+
+
+@router.delete("/{route_id}/roles/{role_id}", response_model=AssociationLinkResult)
+async def remove_role_from_route(
+    route_id: int,
+    role_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(has_permission("route", "update")),
+):
+    service = RouteService(db)
+    affected = await service.remove_role(route_id, role_id)
+    if affected:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return AssociationLinkResult(affected=affected)
+
+
+@router.patch("/{route_id}/components", response_model=AssociationBatchResult[str])
+async def update_route_components(
+    route_id: int,
+    batch: AssociationBatch[str],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(has_permission("route", "update")),
+):
+    service = RouteService(db)
+    change = await service.update_components(route_id, batch)
+    if change.changed:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return change
+
+
 @router.post("/add-component", response_model=RouteComponentAdd)
 async def add_component_to_route(
     data: RouteComponentAdd,
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.core.db import get_db
+from src.core.db import get_db, query_budget, read_only
 from src.app.services.sidebar import SidebarService
 from src.app.schemas.sidebar import SidebarModuleItem
 from src.app.models import User
@@ -10,6 +10,8 @@ router = APIRouter()
 
 
 @router.get("/sidebar", response_model=list[SidebarModuleItem])
+@query_budget(12)
+@read_only
 async def get_sidebar(
     role: str = Query(None, description="Role name to filter routes"),
     is_active: bool = Query(None, description="Filter by isActive flag (True/False)"),
@@ -1,11 +1,14 @@
 """User endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import or_, func
-from src.core.db import get_db
+from src.core.cache import RBAC_CACHE_NAMESPACE, invalidate_cache
+from src.core.db import get_db, query_budget, read_only
 from src.app.services import UserService, RoleService
 from src.app.schemas import (
+    AssociationBatch,
+    AssociationBatchResult,
     UserResponse,
     UserWithRoles,
     UserComponentAdd,
@@ -15,7 +18,12 @@ from src.app.schemas import (
     UserRouteCreate,
     UserRoutesList,
 )
-from src.app.api import get_current_user, has_permission
+from src.app.api import (
+    AuthorizedQuery,
+    get_current_user,
+    has_permission,
+    permission_filter,
+)
 from src.app.models import User, Role
 
 router = APIRouter()
@@ -32,9 +40,10 @@ async def get_current_user_info(
 
 
 @router.get("/")
+@read_only
 async def get_all_users(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(has_permission("users", "read")),
+    authorized: AuthorizedQuery = Depends(permission_filter("users", "read", User)),
     search: str = Query(None, description="Search text"),
     status: bool = Query(None, description="Filter by active status"),
     roles: list[int] = Query(None, description="Filter by role ids"),
@@ -51,34 +60,78 @@ async def get_all_users(
         limit=limit,
         offset=offset,
         all_roles=all_roles,
+        where=authorized.where,
     )
 
 
+@router.patch("/{user_id}/roles", response_model=AssociationBatchResult[int])
+async def update_user_roles(
+    user_id: str,
+    batch: AssociationBatch[int],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(has_permission("users", "update")),
+):
+    service = UserService(db)
+    change = await service.update_roles(user_id, batch)
+    if change.changed:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return change
+
+
+@router.patch("/{user_id}/components", response_model=AssociationBatchResult[str])
+async def update_user_components(
+    user_id: str,
+    batch: AssociationBatch[str],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(has_permission("users", "update")),
+):
+    service = UserService(db)
+    change = await service.update_components(user_id, batch)
+    if change.changed:
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return change
+
+
 @router.post("/{user_id}/roles/{role_id}", response_model=UserWithRoles)
 async def add_role_to_user(
     user_id: str,
     role_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("users", "update")),
 ):
     service = UserService(db)
-    user = await service.add_role(user_id, role_id)
-    return UserWithRoles.from_orm(user)
+    affected = await service.add_role(user_id, role_id)
+    user = await service.get_by_id(user_id)
+    if affected:
+        # The roles may already be loaded in this session, e.g. for the caller
+        await db.refresh(user, ["roles"])
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return UserWithRoles.model_validate(user)
 
 
 @router.delete("/{user_id}/roles/{role_id}", response_model=UserWithRoles)
 async def remove_role_from_user(
     user_id: str,
     role_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(has_permission("users", "update")),
 ):
     service = UserService(db)
-    user = await service.remove_role(user_id, role_id)
-    return UserWithRoles.from_orm(user)
+    affected = await service.remove_role(user_id, role_id)
+    user = await service.get_by_id(user_id)
+    if affected:
+        # The roles may already be loaded in this session, e.g. for the caller
+        await db.refresh(user, ["roles"])
+        background_tasks.add_task(invalidate_cache, RBAC_CACHE_NAMESPACE)
+    return UserWithRoles.model_validate(user)
 
 
 @router.get("/user/{user_id}", response_model=UserResponse)
+@query_budget(8)
 async def get_user_by_id(
     user_id: str,
     db: AsyncSession = Depends(get_db),
@@ -92,18 +145,7 @@ async def get_user_by_id(
         user = await service.get_by_username(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    roles = [role.name for role in user.roles]
-    return UserResponse(
-        id=user.id,
-        name=user.name,
-        phoneNumber=user.phoneNumber,
-        email=user.email,
-        username=user.username,
-        is_active=user.is_active,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-        roles=roles,
-    )
+    return UserResponse.model_validate(user)
 
 
 @router.get("/filters")
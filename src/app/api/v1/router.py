@@ -10,6 +10,7 @@ from src.app.api.v1.endpoints import (
     module_router,
     route_router,
     sidebar_router,
+    debug_router,
 )
 
 # Create API router
@@ -23,3 +24,4 @@ router.include_router(rbac_router, prefix="/rbac", tags=["rbac"])
 router.include_router(module_router, prefix="/module", tags=["module"])
 router.include_router(route_router, prefix="/route", tags=["route"])
 router.include_router(sidebar_router, prefix="/sidebar", tags=["sidebar"])
+router.include_router(debug_router, prefix="/debug", tags=["debug"])
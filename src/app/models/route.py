@@ -40,3 +40,8 @@ class Route(Base):
     roles: Mapped[list["Role"]] = relationship(
         "Role", secondary=route_role, back_populates="routes"
     )
+
+    @property
+    def role_ids(self) -> list[int]:
+        """Ids of the route's roles, which must be loaded."""
+        return [role.role_id for role in self.roles]
@@ -1,10 +1,21 @@
 """Schemas package."""
 
+from src.app.schemas.association import (
+    AssociationBatch,
+    AssociationBatchResult,
+    AssociationLinkResult,
+)
+from src.app.schemas.authorization import (
+    AuthorizationBatch,
+    AuthorizationBatchResult,
+    AuthorizationCheck,
+)
 from src.app.schemas.auth import Login, RefreshToken, Token, TokenPayload
 from src.app.schemas.permission import (
     Permission,
     PermissionCreate,
     PermissionInDB,
+    PermissionList,
     PermissionUpdate,
     PermissionWithSelected,
 )
@@ -16,10 +27,16 @@ from src.app.schemas.module import (
     ModuleResponse,
     ModuleUpdate,
 )
-from src.app.schemas.route import RouteBase, RouteCreate, RouteResponse, RouteUpdate, RouteComponentAdd, RouteComponentRemove, RouteComponentList
+from src.app.schemas.route import RouteBase, RouteCreate, RouteResponse, RouteResponseList, RouteUpdate, RouteComponentAdd, RouteComponentRemove, RouteComponentList
 from src.app.schemas.sidebar import SidebarModuleItem, SidebarRouteItem, SidebarComponentItem
 
 __all__ = [
+    "AssociationBatch",
+    "AssociationBatchResult",
+    "AssociationLinkResult",
+    "AuthorizationBatch",
+    "AuthorizationBatchResult",
+    "AuthorizationCheck",
     "User",
     "UserBase",
     "UserCreate",
@@ -47,6 +64,7 @@ __all__ = [
     "PermissionCreate",
     "PermissionUpdate",
     "PermissionInDB",
+    "PermissionList",
     "PermissionWithSelected",
     "Token",
     "TokenPayload",
@@ -60,6 +78,7 @@ __all__ = [
     "RouteCreate",
     "RouteUpdate",
     "RouteResponse",
+    "RouteResponseList",
     "RouteComponentAdd",
     "RouteComponentRemove",
     "RouteComponentList",
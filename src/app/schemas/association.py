@@ -0,0 +1,37 @@
+"""Association batch schemas."""
+
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+MemberId = TypeVar("MemberId", int, str)
+
+
+# Association batch request schema
+class AssociationBatch(BaseModel, Generic[MemberId]):
+    """Members to link to or unlink from one owner."""
+
+    add: List[MemberId] = []
+    remove: List[MemberId] = []
+    replace: Optional[List[MemberId]] = None  # full set, overrides add/remove
+
+
+# Single association change response schema
+class AssociationLinkResult(BaseModel):
+    """Rows affected by linking or unlinking one member."""
+
+    affected: int
+
+
+# Association batch response schema
+class AssociationBatchResult(BaseModel, Generic[MemberId]):
+    """Applied association batch."""
+
+    added: List[MemberId]
+    removed: List[MemberId]
+    current: List[MemberId]
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
@@ -0,0 +1,28 @@
+"""Authorization check schemas."""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+# Single authorization check schema
+class AuthorizationCheck(BaseModel):
+    """Action on a resource to authorize for the current user."""
+
+    resource: str
+    action: str
+    target: dict = {}
+
+
+# Authorization batch request schema
+class AuthorizationBatch(BaseModel):
+    """Checks to authorize in one call."""
+
+    checks: List[AuthorizationCheck] = Field(..., max_length=1000)
+
+
+# Authorization batch response schema
+class AuthorizationBatchResult(BaseModel):
+    """Decisions of an authorization batch, in request order."""
+
+    allowed: List[bool]
@@ -18,10 +18,12 @@ class ModuleUpdate(BaseModel):
     label: Optional[str] = None
     icon: Optional[str] = None
     is_active: Optional[bool] = None
+    version: Optional[int] = None  # rejects the update if the module changed
 
 
 class ModuleResponse(ModuleBase):
     id: int
+    version: int
 
     class Config:
         from_attributes = True
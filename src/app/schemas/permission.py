@@ -1,9 +1,9 @@
 """Permission schemas."""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 # Base Permission schema
@@ -33,6 +33,7 @@ class PermissionUpdate(BaseModel):
     resource: Optional[str] = None
     action: Optional[str] = None
     expression: Optional[dict] = None
+    version: Optional[int] = None  # rejects the update if the permission changed
 
 
 # Permission in DB schema
@@ -40,6 +41,7 @@ class PermissionInDB(PermissionBase):
     """Permission in DB schema."""
 
     permission_id: int
+    version: int
     created_at: datetime
     updated_at: datetime
 
@@ -56,6 +58,10 @@ class Permission(PermissionInDB):
     pass
 
 
+# Reused for lists instead of building an adapter per request
+PermissionList = TypeAdapter(List[Permission])
+
+
 class PermissionWithSelected(BaseModel):
     permission_id: int
     name: str
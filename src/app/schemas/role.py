@@ -27,6 +27,7 @@ class RoleUpdate(BaseModel):
 
     name: Optional[str] = None
     description: Optional[str] = None
+    version: Optional[int] = None  # rejects the update if the role changed
 
 
 # Role in DB schema
@@ -34,6 +35,7 @@ class RoleInDB(RoleBase):
     """Role in DB schema."""
 
     role_id: int
+    version: int
     created_at: datetime
     updated_at: datetime
 
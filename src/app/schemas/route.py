@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional
 
 
@@ -25,16 +25,22 @@ class RouteUpdate(BaseModel):
     parent_id: Optional[int] = None
     role_ids: Optional[List[int]] = []
     icon: Optional[str] = None
+    version: Optional[int] = None  # rejects the update if the route changed
 
 
 class RouteResponse(RouteBase):
     id: int
+    version: int = 1
     role_ids: List[int] = []
 
     class Config:
         from_attributes = True
 
 
+# Reused for lists instead of building an adapter per request
+RouteResponseList = TypeAdapter(List[RouteResponse])
+
+
 class RouteComponentAdd(BaseModel):
     route_id: int
     component_id: str
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # Base User schema
@@ -66,6 +66,14 @@ class UserResponse(User):
         default=None, description="Roles assigned to the user"
     )
 
+    @field_validator("roles", mode="before")
+    @classmethod
+    def role_names(cls, roles):
+        """Accept the loaded Role objects of a user."""
+        if roles is None:
+            return None
+        return [getattr(role, "name", role) for role in roles]
+
 
 class UserRole(BaseModel):
     role_id: Optional[int]
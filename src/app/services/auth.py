@@ -11,8 +11,10 @@ from src.app.models import User
 from src.app.schemas import TokenPayload
 from src.app.services.user import UserService
 from src.core import create_access_token, create_refresh_token, settings
+from src.core.tracing import trace_service
 
 
+@trace_service
 class AuthService:
     """Authentication service."""
 
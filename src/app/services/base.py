@@ -1,12 +1,71 @@
 """Base service class with common database operations."""
 
-from typing import Generic, List, Optional, Type, TypeVar
-from sqlalchemy import select
+from typing import Any, Generic, List, Optional, Type, TypeVar
+from fastapi import HTTPException
+from sqlalchemy import Column, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.db.associations import AssociationChange, apply_association_batch
+from src.core.db.writes import (
+    delete_returning,
+    insert_returning,
+    primary_key,
+    update_returning,
+)
+from src.core.tracing import trace_service
 
 ModelType = TypeVar("ModelType")
 
 
+async def batch_associations(
+    db: AsyncSession,
+    owner: Column,
+    owner_id: Any,
+    link: Column,
+    batch: Any,
+    member: Optional[Column] = None,
+    owner_name: str = "Owner",
+    member_name: str = "Member",
+) -> AssociationChange:
+    """
+    Apply an AssociationBatch request to one owner's association rows.
+
+    Args:
+        db: Database session
+        owner: Primary key column of the owning table
+        owner_id: Owner primary key value
+        link: Association column holding member ids
+        batch: Batch with ``add``, ``remove`` and ``replace`` member ids
+        member: Primary key column of the member table, validates added ids
+        owner_name: Owner label used in error messages
+        member_name: Member label used in error messages
+
+    Returns:
+        Applied change
+
+    Raises:
+        HTTPException: If the owner or any added member does not exist
+    """
+    change = await apply_association_batch(
+        db,
+        owner,
+        owner_id,
+        link,
+        add=batch.add,
+        remove=batch.remove,
+        replace=batch.replace,
+        member=member,
+    )
+    if change is None:
+        raise HTTPException(status_code=404, detail=f"{owner_name} not found")
+    if change.unknown:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{member_name} not found: {', '.join(map(str, change.unknown))}",
+        )
+    return change
+
+
+@trace_service
 class BaseService(Generic[ModelType]):
     """Base class for all services."""
 
@@ -16,7 +75,7 @@ class BaseService(Generic[ModelType]):
 
     async def get(self, id: int) -> Optional[ModelType]:
         """Get by id."""
-        query = select(self.model).where(self.model.id == id)
+        query = select(self.model).where(primary_key(self.model) == id)
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
@@ -28,27 +87,16 @@ class BaseService(Generic[ModelType]):
 
     async def create(self, **kwargs) -> ModelType:
         """Create new record."""
-        db_obj = self.model(**kwargs)
-        self.db.add(db_obj)
-        await self.db.commit()
-        await self.db.refresh(db_obj)
-        return db_obj
-
-    async def update(self, id: int, **kwargs) -> Optional[ModelType]:
-        """Update record."""
-        db_obj = await self.get(id)
-        if db_obj:
-            for key, value in kwargs.items():
-                setattr(db_obj, key, value)
-            await self.db.commit()
-            await self.db.refresh(db_obj)
-        return db_obj
+        return await insert_returning(self.db, self.model, kwargs)
+
+    async def update(
+        self, id: int, expected_version: Optional[int] = None, **kwargs
+    ) -> Optional[ModelType]:
+        """Update record, checking its version when one is expected."""
+        return await update_returning(
+            self.db, self.model, id, kwargs, expected_version
+        )
 
     async def delete(self, id: int) -> bool:
         """Delete record."""
-        db_obj = await self.get(id)
-        if db_obj:
-            await self.db.delete(db_obj)
-            await self.db.commit()
-            return True
-        return False
+        return await delete_returning(self.db, self.model, id)
@@ -1,8 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from src.app.models.module import Module
+from src.core.db import read_only
+from src.core.db.writes import delete_returning, insert_returning, update_returning
+from src.core.tracing import trace_service
 
 
+@trace_service
 class ModuleService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -10,6 +14,7 @@ class ModuleService:
     async def get(self, module_id: int):
         return await self.db.get(Module, module_id)
 
+    @read_only
     async def get_all(self):
         result = await self.db.execute(select(Module))
         return result.scalars().all()
@@ -17,26 +22,17 @@ class ModuleService:
     async def create(
         self, name: str, label: str, icon: str = None, is_active: bool = True
     ):
-        module = Module(name=name, label=label, icon=icon, is_active=is_active)
-        self.db.add(module)
-        await self.db.commit()
-        await self.db.refresh(module)
-        return module
+        return await insert_returning(
+            self.db,
+            Module,
+            {"name": name, "label": label, "icon": icon, "is_active": is_active},
+        )
 
     async def update(self, module_id: int, **kwargs):
-        module = await self.get(module_id)
-        if not module:
-            return None
-        for key, value in kwargs.items():
-            setattr(module, key, value)
-        await self.db.commit()
-        await self.db.refresh(module)
-        return module
+        expected_version = kwargs.pop("version", None)
+        return await update_returning(
+            self.db, Module, module_id, kwargs, expected_version
+        )
 
     async def delete(self, module_id: int):
-        module = await self.get(module_id)
-        if not module:
-            return None
-        await self.db.delete(module)
-        await self.db.commit()
-        return module
+        return await delete_returning(self.db, Module, module_id)
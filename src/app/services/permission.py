@@ -1,16 +1,52 @@
 """Permission service."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.app.models import Permission, Role
+from src.app.models.role import role_permission
 from src.app.schemas import PermissionCreate, PermissionUpdate
+from src.core.db import read_only
+from src.core.db.writes import (
+    delete_returning,
+    insert_returning,
+    is_unique_violation,
+    update_returning,
+)
+from src.core.tracing import trace_service
 
+WILDCARD = "*"
 
+
+def wildcard_patterns(value: str) -> List[str]:
+    """
+    List the patterns that match a resource or action.
+
+    ``users.profile`` is matched by itself, ``users.profile.*``,
+    ``users.*`` and ``*``.
+
+    Args:
+        value: Concrete resource or action
+
+    Returns:
+        Patterns, most specific first
+    """
+    parts = value.split(".")
+    prefixes = [".".join(parts[:i]) + ".*" for i in range(len(parts), 0, -1)]
+    return [value, *prefixes, WILDCARD]
+
+
+def wildcard_match(pattern: str, value: str) -> bool:
+    """Whether a permission's resource or action pattern covers a value."""
+    return pattern in wildcard_patterns(value)
+
+
+@trace_service
 class PermissionService:
     """Permission service."""
 
@@ -24,25 +60,74 @@ class PermissionService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    def _granted(self, role_names: list[str]):
+        """Ids of the permissions granted to any of the roles."""
+        return (
+            select(role_permission.c.permission_id)
+            .join(Role, Role.role_id == role_permission.c.role_id)
+            .where(Role.name.in_(role_names))
+        )
+
     async def get_policies(self, role_names: list[str], resource: str, action: str):
+        """Get the policies of the roles matching a resource and action."""
         stmt = (
             select(Permission)
-            .join(Permission.roles)
             .where(
-                Role.name.in_(role_names),
-                Permission.resource == resource,
-                Permission.action == action,
+                Permission.permission_id.in_(self._granted(role_names)),
+                Permission.resource.in_(wildcard_patterns(resource)),
+                Permission.action.in_(wildcard_patterns(action)),
             )
+            .order_by(Permission.permission_id)
         )
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_policies_for(
+        self, role_names: list[str], pairs: Iterable[Tuple[str, str]]
+    ) -> List[Permission]:
+        """
+        Get the policies of several resource/action pairs in one query.
+
+        Args:
+            role_names: Names of the actor's roles
+            pairs: (resource, action) pairs to authorize
+
+        Returns:
+            Permissions matching any pair, each once even if several roles
+            grant it
+        """
+        pairs = set(pairs)
+        if not role_names or not pairs:
+            return []
+        resources = {p for resource, _ in pairs for p in wildcard_patterns(resource)}
+        actions = {p for _, action in pairs for p in wildcard_patterns(action)}
+        stmt = (
+            select(Permission)
+            .where(
+                Permission.permission_id.in_(self._granted(role_names)),
+                Permission.resource.in_(resources),
+                Permission.action.in_(actions),
+            )
+            .order_by(Permission.permission_id)
+        )
+        result = await self.db.execute(stmt)
+        return [
+            permission
+            for permission in result.scalars().all()
+            if any(
+                wildcard_match(permission.resource, resource)
+                and wildcard_match(permission.action, action)
+                for resource, action in pairs
+            )
+        ]
+
     async def get_by_name(self, name: str) -> Optional[Permission]:
         """Get permission by name."""
         query = select(Permission).where(Permission.name == name)
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    @read_only
     async def get_multi(self, skip: int = 0, limit: int = 300) -> List[Permission]:
         """Get multiple permissions."""
         query = select(Permission).offset(skip).limit(limit)
@@ -51,38 +136,39 @@ class PermissionService:
 
     async def create(self, permission_in: PermissionCreate) -> Permission:
         """Create permission."""
-        # Check if permission exists
-        permission = await self.get_by_name(permission_in.name)
-        if permission:
+        # The unique name constraint replaces a lookup round trip
+        try:
+            return await insert_returning(
+                self.db, Permission, permission_in.model_dump()
+            )
+        except IntegrityError as e:
+            if not is_unique_violation(e, Permission.name):
+                raise
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Permission with this name already exists",
             )
 
-        # Create permission
-        permission = Permission(**permission_in.model_dump())
-        self.db.add(permission)
-        await self.db.commit()
-        await self.db.refresh(permission)
-        return permission
-
     async def update(
-        self, permission: Permission, permission_in: PermissionUpdate
-    ) -> Permission:
-        """Update permission."""
-        for field, value in permission_in.model_dump(exclude_unset=True).items():
-            setattr(permission, field, value)
-        await self.db.commit()
-        await self.db.refresh(permission)
-        return permission
-
-    async def delete(self, permission_id: int) -> None:
-        """Delete permission."""
-        permission = await self.get(permission_id)
-        if permission:
-            await self.db.delete(permission)
-            await self.db.commit()
+        self, permission_id: int, permission_in: PermissionUpdate
+    ) -> Optional[Permission]:
+        """Update permission, None if it does not exist."""
+        values = permission_in.model_dump(exclude_unset=True)
+        expected_version = values.pop("version", None)
+        return await update_returning(
+            self.db, Permission, permission_id, values, expected_version
+        )
+
+    async def delete(self, permission_id: int) -> bool:
+        """Delete permission, False if it does not exist."""
+        await self.db.execute(
+            delete(role_permission).where(
+                role_permission.c.permission_id == permission_id
+            )
+        )
+        return await delete_returning(self.db, Permission, permission_id)
 
+    @read_only
     async def get_all_with_role_selected(self, role_id: int):
         # Get all permissions
         all_permissions_query = select(Permission)
@@ -3,15 +3,28 @@
 from typing import List, Optional, Union
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.app.models import Role, Permission
-from src.app.schemas import RoleCreate, RoleUpdate
-from src.core.db import get_db
-
-
+from src.app.models import Role, Permission, route_role
+from src.app.models.role import role_permission
+from src.app.models.user import user_role
+from src.app.schemas import AssociationBatch, RoleCreate, RoleUpdate
+from src.app.services.base import batch_associations
+from src.core.db import get_db, read_only
+from src.core.db.associations import AssociationChange, link_member, unlink_member
+from src.core.db.writes import (
+    delete_returning,
+    insert_returning,
+    is_unique_violation,
+    update_returning,
+)
+from src.core.tracing import trace_service
+
+
+@trace_service
 class RoleService:
     """Role service."""
 
@@ -73,62 +86,69 @@ class RoleService:
         Raises:
             HTTPException: If role with name already exists
         """
-        # Check if role with name already exists
-        role = await self.get_by_name(role_in.name)
-        if role:
+        # The unique name constraint replaces a lookup round trip
+        try:
+            return await insert_returning(
+                self.db,
+                Role,
+                {"name": role_in.name, "description": role_in.description},
+            )
+        except IntegrityError as e:
+            if not is_unique_violation(e, Role.name):
+                raise
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Role with this name already exists",
             )
 
-        # Create role
-        role = Role(
-            name=role_in.name,
-            description=role_in.description,
-        )
-        self.db.add(role)
-        await self.db.commit()
-        await self.db.refresh(role)
-        return role
-
-    async def update(self, role: Role, role_in: Union[RoleUpdate, dict]) -> Role:
+    async def update(
+        self, role_id: int, role_in: Union[RoleUpdate, dict]
+    ) -> Optional[Role]:
         """
         Update role.
 
         Args:
-            role: Role to update
-            role_in: Role update data
+            role_id: Role ID
+            role_in: Role update data, ``version`` is checked when given
 
         Returns:
-            Updated role
+            Updated role, or None if it does not exist
+
+        Raises:
+            StaleVersionError: If the role changed since ``version``
         """
         # Convert to dict if not already
         update_data = (
-            role_in
+            dict(role_in)
             if isinstance(role_in, dict)
             else role_in.model_dump(exclude_unset=True)
         )
+        expected_version = update_data.pop("version", None)
+        values = {
+            field: value
+            for field, value in update_data.items()
+            if hasattr(Role, field) and value is not None
+        }
+        return await update_returning(
+            self.db, Role, role_id, values, expected_version
+        )
 
-        # Update role
-        for field, value in update_data.items():
-            if hasattr(role, field) and value is not None:
-                setattr(role, field, value)
-
-        self.db.add(role)
-        await self.db.commit()
-        await self.db.refresh(role)
-        return role
-
-    async def delete(self, role: Role) -> None:
+    async def delete(self, role_id: int) -> bool:
         """
         Delete role.
 
         Args:
-            role: Role to delete
+            role_id: Role ID
+
+        Returns:
+            True if the role existed
         """
-        await self.db.delete(role)
-        await self.db.commit()
+        # Association rows go first, one statement per table
+        for table in (user_role, role_permission, route_role):
+            await self.db.execute(delete(table).where(table.c.role_id == role_id))
+        return await delete_returning(self.db, Role, role_id)
 
+    @read_only
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Role]:
         """
         Get all roles.
@@ -148,10 +168,36 @@ class RoleService:
         )
         result = await self.db.execute(query)
         roles = result.scalars().all()
-        print(roles)
         return list(roles)
 
-    async def add_permission(self, role_id: int, permission_id: int) -> Role:
+    async def update_permissions(
+        self, role_id: int, batch: AssociationBatch[int]
+    ) -> AssociationChange:
+        """
+        Add, remove or replace the permissions of a role in one batch.
+
+        Args:
+            role_id: Role ID
+            batch: Permission IDs to add, remove or replace with
+
+        Returns:
+            Applied change
+
+        Raises:
+            HTTPException: If the role or an added permission is not found
+        """
+        return await batch_associations(
+            self.db,
+            Role.role_id,
+            role_id,
+            role_permission.c.permission_id,
+            batch,
+            member=Permission.permission_id,
+            owner_name="Role",
+            member_name="Permission",
+        )
+
+    async def add_permission(self, role_id: int, permission_id: int) -> int:
         """
         Add a permission to a role.
 
@@ -160,32 +206,24 @@ class RoleService:
             permission_id: Permission ID
 
         Returns:
-            Updated role
+            Number of links created, 0 if the role already had the permission
 
         Raises:
             HTTPException: If role or permission not found
         """
-        # Fetch the role and permission
-        role = await self.get_by_id(role_id)
-        if not role:
-            raise HTTPException(status_code=404, detail="Role not found")
-        permission_query = select(Permission).where(
-            Permission.permission_id == permission_id
+        count = await link_member(
+            self.db,
+            Role.role_id,
+            role_id,
+            role_permission.c.permission_id,
+            Permission.permission_id,
+            permission_id,
         )
-        result = await self.db.execute(permission_query)
-        permission = result.scalar_one_or_none()
-        if not permission:
-            raise HTTPException(status_code=404, detail="Permission not found")
-
-        # Add permission if not already present
-        if permission not in role.permissions:
-            role.permissions.append(permission)
-            self.db.add(role)
-            await self.db.commit()
-            await self.db.refresh(role)
-        return role
+        if count is None:
+            raise HTTPException(status_code=404, detail="Role or Permission not found")
+        return count
 
-    async def remove_permission(self, role_id: int, permission_id: int) -> Role:
+    async def remove_permission(self, role_id: int, permission_id: int) -> int:
         """
         Remove a permission from a role.
 
@@ -194,27 +232,19 @@ class RoleService:
             permission_id: Permission ID
 
         Returns:
-            Updated role
+            Number of links removed, 0 if the role did not have the permission
 
         Raises:
             HTTPException: If role or permission not found
         """
-        # Fetch the role and permission
-        role = await self.get_by_id(role_id)
-        if not role:
-            raise HTTPException(status_code=404, detail="Role not found")
-        permission_query = select(Permission).where(
-            Permission.permission_id == permission_id
+        count = await unlink_member(
+            self.db,
+            Role.role_id,
+            role_id,
+            role_permission.c.permission_id,
+            Permission.permission_id,
+            permission_id,
         )
-        result = await self.db.execute(permission_query)
-        permission = result.scalar_one_or_none()
-        if not permission:
-            raise HTTPException(status_code=404, detail="Permission not found")
-
-        # Remove permission if present
-        if permission in role.permissions:
-            role.permissions.remove(permission)
-            self.db.add(role)
-            await self.db.commit()
-            await self.db.refresh(role)
-        return role
+        if count is None:
+            raise HTTPException(status_code=404, detail="Role or Permission not found")
+        return count
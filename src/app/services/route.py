@@ -1,10 +1,17 @@
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert, delete
+from sqlalchemy import select, insert, delete, literal
 from sqlalchemy.orm import selectinload
-from src.app.schemas import RouteResponse
-from src.app.models import Route, Role, route_component
+from src.app.schemas import AssociationBatch, RouteResponse, RouteResponseList
+from src.app.services.base import batch_associations
+from src.app.models import Route, Role, route_component, route_role
+from src.core.db import read_only
+from src.core.db.associations import AssociationChange, link_member, unlink_member
+from src.core.db.writes import insert_returning, update_returning
+from src.core.tracing import trace_service
 
 
+@trace_service
 class RouteService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -15,39 +22,35 @@ class RouteService:
         )
         return result.scalar_one_or_none()
 
+    async def _assign_roles(self, route_id: int, role_ids) -> list:
+        """Link existing roles to a route, returning the linked role ids."""
+        if not role_ids:
+            return []
+        # INSERT ... SELECT skips unknown role ids like the former ORM lookup did
+        result = await self.db.execute(
+            insert(route_role)
+            .from_select(
+                ["route_id", "role_id"],
+                select(literal(route_id), Role.role_id).where(
+                    Role.role_id.in_(role_ids)
+                ),
+            )
+            .returning(route_role.c.role_id)
+        )
+        return list(result.scalars().all())
+
     async def get(self, route_id: int):
         route = await self._get_orm(route_id)
         if not route:
             return None
-        return RouteResponse(
-            id=route.id,
-            path=route.path,
-            label=route.label,
-            icon=route.icon,
-            is_active=route.is_active,
-            is_sidebar=route.is_sidebar,
-            module_id=route.module_id,
-            parent_id=route.parent_id,
-            role_ids=[role.role_id for role in getattr(route, "roles", [])],
-        )
+        return RouteResponse.model_validate(route)
 
+    @read_only
     async def get_all(self):
         result = await self.db.execute(select(Route).options(selectinload(Route.roles)))
-        routes = result.scalars().all()
-        return [
-            RouteResponse(
-                id=route.id,
-                path=route.path,
-                label=route.label,
-                icon=route.icon,
-                is_active=route.is_active,
-                is_sidebar=route.is_sidebar,
-                module_id=route.module_id,
-                parent_id=route.parent_id,
-                role_ids=[role.role_id for role in getattr(route, "roles", [])],
-            )
-            for route in routes
-        ]
+        return RouteResponseList.validate_python(
+            result.scalars().all(), from_attributes=True
+        )
 
     async def create(
         self,
@@ -60,26 +63,20 @@ class RouteService:
         parent_id: int = None,
         role_ids=None,
     ):
-        route = Route(
-            path=path,
-            label=label,
-            icon=icon,
-            is_sidebar=is_sidebar,
-            is_active=is_active,
-            module_id=module_id,
-            parent_id=parent_id,
+        route = await insert_returning(
+            self.db,
+            Route,
+            {
+                "path": path,
+                "label": label,
+                "icon": icon,
+                "is_sidebar": is_sidebar,
+                "is_active": is_active,
+                "module_id": module_id,
+                "parent_id": parent_id,
+            },
         )
-        roles = []
-        if role_ids:
-            roles = (
-                (await self.db.execute(select(Role).where(Role.role_id.in_(role_ids))))
-                .scalars()
-                .all()
-            )
-            route.roles = roles
-        self.db.add(route)
-        await self.db.commit()
-        await self.db.refresh(route)
+        role_ids = await self._assign_roles(route.id, role_ids)
         return RouteResponse(
             id=route.id,
             path=route.path,
@@ -89,29 +86,28 @@ class RouteService:
             is_sidebar=route.is_sidebar,
             module_id=route.module_id,
             parent_id=route.parent_id,
-            role_ids=[role.role_id for role in roles],
+            version=route.version,
+            role_ids=role_ids,
         )
 
     async def update(self, route_id: int, **kwargs):
-        route = await self._get_orm(route_id)
+        expected_version = kwargs.pop("version", None)
+        new_role_ids = kwargs.pop("role_ids", None)
+        route = await update_returning(
+            self.db, Route, route_id, kwargs, expected_version
+        )
         if not route:
             return None
-        if "role_ids" in kwargs and kwargs["role_ids"] is not None:
-            roles = (
-                (
-                    await self.db.execute(
-                        select(Role).where(Role.role_id.in_(kwargs["role_ids"]))
-                    )
-                )
-                .scalars()
-                .all()
+        if new_role_ids is not None:
+            await self.db.execute(
+                delete(route_role).where(route_role.c.route_id == route_id)
             )
-            route.roles = roles
-            del kwargs["role_ids"]
-        for key, value in kwargs.items():
-            setattr(route, key, value)
-        await self.db.commit()
-        await self.db.refresh(route)
+            role_ids = await self._assign_roles(route_id, new_role_ids)
+        else:
+            result = await self.db.execute(
+                select(route_role.c.role_id).where(route_role.c.route_id == route_id)
+            )
+            role_ids = list(result.scalars().all())
         return RouteResponse(
             id=route.id,
             path=route.path,
@@ -121,7 +117,8 @@ class RouteService:
             is_sidebar=route.is_sidebar,
             module_id=route.module_id,
             parent_id=route.parent_id,
-            role_ids=[role.role_id for role in getattr(route, "roles", [])],
+            version=route.version,
+            role_ids=role_ids,
         )
 
     async def delete(self, route_id: int):
@@ -132,6 +129,7 @@ class RouteService:
         await self.db.commit()
         return True
 
+    @read_only
     async def get_routes_by_role_ids(
         self, role_ids, is_active: bool = None, is_sidebar: bool = None
     ):
@@ -147,20 +145,53 @@ class RouteService:
             for route in routes
             if any(role.role_id in role_ids for role in getattr(route, "roles", []))
         ]
-        return [
-            RouteResponse(
-                id=route.id,
-                path=route.path,
-                label=route.label,
-                icon=route.icon,
-                is_active=route.is_active,
-                is_sidebar=route.is_sidebar,
-                module_id=route.module_id,
-                parent_id=route.parent_id,
-                role_ids=[role.role_id for role in getattr(route, "roles", [])],
-            )
-            for route in filtered_routes
-        ]
+        return RouteResponseList.validate_python(filtered_routes, from_attributes=True)
+
+    async def update_roles(
+        self, route_id: int, batch: AssociationBatch[int]
+    ) -> AssociationChange:
+        """Add, remove or replace the roles of a route in one batch."""
+        return await batch_associations(
+            self.db,
+            Route.id,
+            route_id,
+            route_role.c.role_id,
+            batch,
+            member=Role.role_id,
+            owner_name="Route",
+            member_name="Role",
+        )
+
+    async def add_role(self, route_id: int, role_id: int) -> int:
+        """Add a role to a route, returning the number of links created."""
+        count = await link_member(
+            self.db, Route.id, route_id, route_role.c.role_id, Role.role_id, role_id
+        )
+        if count is None:
+            raise HTTPException(status_code=404, detail="Route or Role not found")
+        return count
+
+    async def remove_role(self, route_id: int, role_id: int) -> int:
+        """Remove a role from a route, returning the number of links removed."""
+        count = await unlink_member(
+            self.db, Route.id, route_id, route_role.c.role_id, Role.role_id, role_id
+        )
+        if count is None:
+            raise HTTPException(status_code=404, detail="Route or Role not found")
+        return count
+
+    async def update_components(
+        self, route_id: int, batch: AssociationBatch[str]
+    ) -> AssociationChange:
+        """Add, remove or replace the components of a route in one batch."""
+        return await batch_associations(
+            self.db,
+            Route.id,
+            route_id,
+            route_component.c.component_id,
+            batch,
+            owner_name="Route",
+        )
 
     async def add_component_to_route(self, route_id: int, component_id: str):
         await self.db.execute(
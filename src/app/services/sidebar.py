@@ -3,12 +3,16 @@ from sqlalchemy import select
 from src.app.models import Module, Role, route_role, route_component, user_component
 from src.app.schemas import SidebarModuleItem, SidebarRouteItem, SidebarComponentItem
 from src.app.services import RouteService, RoleService
+from src.core.db import read_only
+from src.core.tracing import trace_service
 
 
+@trace_service
 class SidebarService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @read_only
     async def get_sidebar(self, user_id: str, role: str = None, is_active: bool = None):
         # Fetch all modules
         modules_result = await self.db.execute(select(Module))
@@ -5,13 +5,21 @@ from sqlalchemy import or_, func, select, insert, delete
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException
 from src.app.models import User, Role, user_component,user_page,route_role
-from src.app.schemas import UserWithRoles, UserRoutesList, UserRouteResponse, UserRouteCreate
+from src.app.models.user import user_role
+from src.app.schemas import AssociationBatch, UserWithRoles, UserRoutesList, UserRouteResponse, UserRouteCreate
 from src.core.security import verify_password, get_password_hash
-from src.app.services.base import BaseService
+from src.app.services.base import BaseService, batch_associations
+from src.core.debug import authz_trace
+from src.core.db import read_only
+from src.core.db.associations import AssociationChange, link_member, unlink_member
+from src.core.db.writes import insert_returning
+from src.core.tracing import trace_service
 
 
+@trace_service
 class UserService(BaseService[User]):
     """User service."""
 
@@ -76,38 +84,52 @@ class UserService(BaseService[User]):
         """Async create method for User with optional roles."""
         if roles is None:
             roles = []
-        user = User(
-            id=id,
-            name=name,
-            phoneNumber=phoneNumber,
-            email=email,
-            username=username,
-            hashed_password=hashed_password,
-            is_active=is_active,
-            is_superuser=is_superuser,
-            roles=roles,
+        user = await insert_returning(
+            self.db,
+            User,
+            {
+                "id": id,
+                "name": name,
+                "phoneNumber": phoneNumber,
+                "email": email,
+                "username": username,
+                "hashed_password": hashed_password,
+                "is_active": is_active,
+                "is_superuser": is_superuser,
+            },
         )
-        self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self._link_roles(user, roles)
         return user
 
+    async def _link_roles(self, user: User, roles) -> None:
+        """Insert the user_role rows of a new user in one statement."""
+        if roles:
+            await self.db.execute(
+                insert(user_role),
+                [{"user_id": user.id, "role_id": role.role_id} for role in roles],
+            )
+        # The collection is known, so callers never trigger a lazy load
+        set_committed_value(user, "roles", list(roles))
+
     async def create_user_if_not_exists(self, user: UserWithRoles) -> User:
         """Create new user if not exists."""
         existing_user = await self.get_by_id(user["id"])
         if existing_user is not None:
             return existing_user
         roles = []
-        print(f"Creating user with ID: {user['id']}")
-        print(f"User details: {user['roles']}")
         if "roles" in user and user["roles"]:
             for name in user["roles"]:
-                print(f"Creating role for user: {name}")
                 result = await self.db.execute(select(Role).where(Role.name == name))
                 role_obj = result.scalar_one_or_none()
-                print(f"Role object: {role_obj}")
                 if role_obj:
                     roles.append(role_obj)
+        if authz_trace.enabled:
+            authz_trace.event(
+                "user.provisioned",
+                user_id=user["id"],
+                requested_roles=user.get("roles") or [],
+                assigned_roles=[role.name for role in roles],
+            )
         user_obj = await self.create(
             id=user["id"],
             name=user["name"],
@@ -143,10 +165,12 @@ class UserService(BaseService[User]):
         # Ensure roles are eagerly loaded
         user = await self.get_by_id(user.id)
         if not user.roles or len(user.roles) == 0:
-            print(f"User {user.id} has no roles assigned.")
+            if authz_trace.enabled:
+                authz_trace.event("user.no_roles", user_id=user.id)
             return False
         return True
 
+    @read_only
     async def get_all_with_all_roles(self):
         """Get all users with their roles and all available roles."""
         # Get all users with their roles
@@ -184,36 +208,53 @@ class UserService(BaseService[User]):
             )
         return user_list
 
-    async def add_role(self, user_id: str, role_id: int):
-        """Add a role to a user."""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id).options(selectinload(User.roles))
+    async def update_roles(
+        self, user_id: str, batch: AssociationBatch[int]
+    ) -> AssociationChange:
+        """Add, remove or replace the roles of a user in one batch."""
+        return await batch_associations(
+            self.db,
+            User.id,
+            user_id,
+            user_role.c.role_id,
+            batch,
+            member=Role.role_id,
+            owner_name="User",
+            member_name="Role",
+        )
+
+    async def update_components(
+        self, user_id: str, batch: AssociationBatch[str]
+    ) -> AssociationChange:
+        """Add, remove or replace the components of a user in one batch."""
+        return await batch_associations(
+            self.db,
+            User.id,
+            user_id,
+            user_component.c.component_id,
+            batch,
+            owner_name="User",
         )
-        user = result.scalar_one_or_none()
-        role = await self.db.get(Role, role_id)
-        if not user or not role:
+
+    async def add_role(self, user_id: str, role_id: int) -> int:
+        """Add a role to a user, returning the number of links created."""
+        count = await link_member(
+            self.db, User.id, user_id, user_role.c.role_id, Role.role_id, role_id
+        )
+        if count is None:
             raise HTTPException(status_code=404, detail="User or Role not found")
-        if role not in user.roles:
-            user.roles.append(role)
-            await self.db.commit()
-            await self.db.refresh(user)
-        return user
+        return count
 
-    async def remove_role(self, user_id: str, role_id: int):
-        """Remove a role from a user."""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id).options(selectinload(User.roles))
+    async def remove_role(self, user_id: str, role_id: int) -> int:
+        """Remove a role from a user, returning the number of links removed."""
+        count = await unlink_member(
+            self.db, User.id, user_id, user_role.c.role_id, Role.role_id, role_id
         )
-        user = result.scalar_one_or_none()
-        role = await self.db.get(Role, role_id)
-        if not user or not role:
+        if count is None:
             raise HTTPException(status_code=404, detail="User or Role not found")
-        if role in user.roles:
-            user.roles.remove(role)
-            await self.db.commit()
-            await self.db.refresh(user)
-        return user
+        return count
 
+    @read_only
     async def get_all_users_with_filters(
         self,
         search: str = None,
@@ -222,9 +263,14 @@ class UserService(BaseService[User]):
         limit: int = 10,
         offset: int = 0,
         all_roles: list[Role] = None,
+        where=None,
     ):
         query = select(User).options(selectinload(User.roles))
 
+        # Rows the caller is authorized to see
+        if where is not None:
+            query = query.where(where)
+
         # Text search
         if search:
             search_pattern = f"%{search.lower()}%"
@@ -280,21 +326,22 @@ class UserService(BaseService[User]):
         return {"total_count": total_count, "users": user_list}
 
     async def create_user_with_role(self, user_data, role_id: int):
-        user = User(
-            id=str(uuid.uuid4()),
-            name=user_data.name,
-            phoneNumber=user_data.phoneNumber,
-            email=user_data.email,
-            username=user_data.username,
-            hashed_password=get_password_hash(user_data.password),
-            is_active=True,
-        )
         role = await self.db.execute(select(Role).where(Role.role_id == role_id))
         role_obj = role.scalar_one()
-        user.roles.append(role_obj)
-        self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        user = await insert_returning(
+            self.db,
+            User,
+            {
+                "id": str(uuid.uuid4()),
+                "name": user_data["name"],
+                "phoneNumber": user_data["phoneNumber"],
+                "email": user_data["email"],
+                "username": user_data["username"],
+                "hashed_password": get_password_hash(user_data["password"]),
+                "is_active": True,
+            },
+        )
+        await self._link_roles(user, [role_obj])
         return user
 
     async def add_component_to_user(self, user_id: str, component_id: str):
@@ -3,17 +3,22 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from loguru import logger
-from redis import asyncio as aioredis
 from sqlalchemy import text
 
 from src.app.api import api_router
-from src.core.cache.client import init_redis_cache
+from src.app.api.abac.index import policy_index
+from src.core.cache.client import create_redis, init_redis_cache
 from src.core.config import settings
-from src.core.db.session import engine
+from src.core.db.session import engine, replica_router
 from src.core.err import setup_exception_handlers
+from src.core.jobs import job_runner
 from src.core.log import setup_logging
+from src.core.metrics import mark_worker_dead, metrics_endpoint
 from src.core.middleware import setup_middleware
+from src.core.tracing import setup_tracing, tracer
+from src.core.utils import image_processing_service
 
 
 @asynccontextmanager
@@ -33,11 +38,7 @@ async def lifespan(app: FastAPI):
 
     try:
         # Connect to Redis
-        redis = aioredis.from_url(
-            str(settings.REDIS_URL),
-            encoding="utf8",
-            decode_responses=True,
-        )
+        redis = create_redis()
         # Test Redis connection
         await redis.ping()
         logger.info("Successfully connected to Redis")
@@ -50,18 +51,41 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to connect to Redis: {str(e)}")
         raise
 
+    # Watch replica lag so lagging replicas leave the rotation
+    replica_router.start(settings.REPLICA_LAG_CHECK_INTERVAL)
+
+    # Load ABAC policies into memory
+    if settings.POLICY_INDEX_ENABLED:
+        await policy_index.start(settings.POLICY_INDEX_RELOAD_SECONDS)
+
+    # Start background jobs and the image encoder pool they use
+    await job_runner.start(redis)
+    await image_processing_service.start()
+
     # Yield control to FastAPI
     yield
 
     # Cleanup
     try:
+        # Let queued jobs finish, then stop the image encoder pool
+        await job_runner.stop()
+        await image_processing_service.stop()
+        await policy_index.stop()
+
         # Close Redis connection
         await redis.close()
         logger.info("Redis connection closed")
 
         # Close PostgreSQL connection pool
         await engine.dispose()
+        await replica_router.stop()
         logger.info("PostgreSQL connection pool closed")
+
+        # Release this worker's metrics
+        mark_worker_dead()
+
+        # Flush pending spans
+        tracer.shutdown()
     except Exception as e:
         logger.error(f"Error during cleanup: {str(e)}")
 
@@ -78,12 +102,17 @@ def create_app() -> FastAPI:
         title=settings.PROJECT_NAME,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        # orjson encodes responses several times faster than the json module
+        default_response_class=ORJSONResponse,
         # Disable docs in production
         docs_url="/docs" if settings.APP_ENV == "development" else None,
         redoc_url="/redoc" if settings.APP_ENV == "development" else None,
         openapi_url="/openapi.json" if settings.APP_ENV == "development" else None,
     )
 
+    # Configure span export before any request is traced
+    setup_tracing()
+
     # Setup middleware
     setup_middleware(app)
 
@@ -93,6 +122,10 @@ def create_app() -> FastAPI:
     # Include API router
     app.include_router(api_router)
 
+    # Prometheus scrape endpoint
+    if settings.METRICS_ENABLED:
+        app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
     # Root endpoint with environment-specific response
     @app.get("/")
     async def root():
@@ -1,8 +1,16 @@
-from src.core.cache.client import init_redis_cache
+from src.core.cache.client import (
+    RBAC_CACHE_NAMESPACE,
+    create_redis,
+    init_redis_cache,
+    invalidate_cache,
+)
 from src.core.cache.utils import cached, user_specific_cache_key
 
 __all__ = [
+    "RBAC_CACHE_NAMESPACE",
+    "create_redis",
     "init_redis_cache",
+    "invalidate_cache",
     "cached",
     "user_specific_cache_key",
 ]
@@ -1,17 +1,49 @@
 """Redis cache client."""
 
+from typing import Optional
+
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 from redis import asyncio as aioredis
 
 from src.core.config import settings
+from src.core.metrics import InstrumentedRedis
 
+# Namespace of cached responses derived from roles, permissions and routes
+RBAC_CACHE_NAMESPACE = "rbac"
 
-async def init_redis_cache() -> None:
-    """Initialize Redis cache."""
-    redis = aioredis.from_url(
+
+def create_redis() -> aioredis.Redis:
+    """
+    Create a Redis client.
+
+    Returns:
+        Redis client, instrumented when metrics or tracing are enabled
+    """
+    instrumented = settings.METRICS_ENABLED or settings.TRACING_ENABLED
+    redis_class = InstrumentedRedis if instrumented else aioredis.Redis
+    return redis_class.from_url(
         str(settings.REDIS_URL),
         encoding="utf8",
         decode_responses=True,
     )
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache:")
\ No newline at end of file
+
+
+async def init_redis_cache() -> None:
+    """Initialize Redis cache."""
+    redis = create_redis()
+    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache:")
+
+async def invalidate_cache(namespace: Optional[str] = None) -> int:
+    """
+    Drop cached responses.
+
+    Args:
+        namespace: Cache namespace, all entries when None
+
+    Returns:
+        Number of removed keys, 0 when the cache is not initialized
+    """
+    if getattr(FastAPICache, "_backend", None) is None:
+        return 0
+    return await FastAPICache.clear(namespace=namespace)
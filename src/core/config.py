@@ -1,6 +1,6 @@
 """Application configuration module."""
 
-from typing import List, Union
+from typing import List, Optional, Union
 
 from pydantic import PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -41,9 +41,55 @@ class Settings(BaseSettings):
     DB_USER: str = "postgres"
     DB_PASSWORD: str = "postgres"
 
+    # Read replica settings
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL: float = 5.0
+    REPLICA_STICKY_SECONDS: int = 10  # reads stay on the primary after a write
+    REPLICA_STICKY_COOKIE: str = "db_primary_until"
+
+    # Connection pool settings
+    DB_ECHO: bool = False  # SQL logging
+    WEB_CONCURRENCY: int = 1  # worker processes, also read by uvicorn
+    DB_MAX_CONNECTIONS: int = 30  # server connections shared by all workers
+    DB_POOL_SIZE: Optional[int] = None  # per worker, derived when unset; 0 = NullPool
+    DB_MAX_OVERFLOW: Optional[int] = None  # per worker, derived when unset
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False  # False: optimistic disconnect handling
+    DB_PGBOUNCER: bool = False  # transaction pooling, disables statement caches
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
     # Redis settings
     REDIS_URL: RedisDsn
 
+    # Access log settings
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_SINK: Optional[str] = None  # file path, defaults to stdout
+
+    # Metrics settings
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+
+    # Query profiler settings (development and CI)
+    SQL_PROFILER_ENABLED: bool = False
+    SQL_PROFILER_STRICT: bool = False  # raise when an endpoint exceeds its budget
+    SQL_SLOW_QUERY_MS: float = 100.0
+    SQL_N_PLUS_ONE_THRESHOLD: int = 3
+    SQL_EXPLAIN_ENABLED: bool = True
+
+    # Tracing settings
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: str = "memory"  # "memory" or "otlp"
+    TRACING_SAMPLE_RATE: float = 1.0
+    TRACING_SERVICE_NAME: Optional[str] = None  # defaults to PROJECT_NAME
+    OTLP_ENDPOINT: str = "http://localhost:4318"
+
+    # Authorization trace settings
+    AUTHZ_TRACE_ENABLED: bool = False
+    AUTHZ_TRACE_BUFFER_SIZE: int = 1000
+
     # Rate limiting
     RATE_LIMIT_ENABLED: bool = False
     RATE_LIMIT_DEFAULT: str = "100/minute"
@@ -55,6 +101,8 @@ class Settings(BaseSettings):
     # File upload settings
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10485760
+    UPLOAD_SHARD_DEPTH: int = 2  # hashed-prefix directory levels, 0 disables
+    UPLOAD_SHARD_WIDTH: int = 2
     ALLOWED_EXTENSIONS: List[str] = [
         ".jpg",
         ".jpeg",
@@ -76,6 +124,46 @@ class Settings(BaseSettings):
         ".ogg",
     ]
 
+    # Storage settings
+    STORAGE_BACKEND: str = "local"  # "local", "s3" or "memory"
+    S3_BUCKET: Optional[str] = None
+    S3_ENDPOINT_URL: Optional[str] = None
+    S3_REGION: Optional[str] = None
+    S3_ACCESS_KEY_ID: Optional[str] = None
+    S3_SECRET_ACCESS_KEY: Optional[str] = None
+    S3_PREFIX: str = ""
+    S3_MULTIPART_PART_SIZE: int = 8388608
+    S3_MULTIPART_CONCURRENCY: int = 4
+    S3_PRESIGNED_URL_EXPIRE_SECONDS: int = 3600
+
+    # Background job settings
+    JOBS_ENABLED: bool = True
+    JOBS_BACKEND: str = "local"  # "local" or "redis" (Redis Streams)
+    JOBS_WORKERS: int = 4
+    JOBS_QUEUE_SIZE: int = 1000  # local backend only
+    JOBS_MAX_RETRIES: int = 3
+    JOBS_RETRY_BACKOFF: float = 1.0  # seconds, doubled on every attempt
+    JOBS_RETRY_BACKOFF_MAX: float = 60.0
+    JOBS_DRAIN_TIMEOUT: float = 10.0  # shutdown wait for queued jobs
+    JOBS_STREAM: str = "jobs"
+    JOBS_STREAM_MAXLEN: int = 100000
+    JOBS_CLAIM_IDLE_SECONDS: float = 300.0  # take over jobs of dead workers
+
+    # Policy index settings
+    POLICY_INDEX_ENABLED: bool = True
+    POLICY_INDEX_RELOAD_SECONDS: float = 300.0  # full reload, 0 disables
+
+    # ABAC evaluation limits
+    ABAC_REGEX_MAX_LENGTH: int = 256  # regexMatch pattern characters
+    ABAC_REGEX_MAX_INPUT: int = 4096  # longer values never match
+    ABAC_POLICY_BUDGET_MS: float = 10.0  # slower evaluations deny, 0 disables
+
+    # Image processing settings
+    IMAGE_PROCESSING_ENABLED: bool = True
+    IMAGE_PROCESSING_WORKERS: int = 2  # encoder processes
+    IMAGE_THUMBNAIL_SIZES: List[int] = [64, 128, 256, 512]
+    IMAGE_WEBP_QUALITY: int = 80
+
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 
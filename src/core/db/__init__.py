@@ -1,6 +1,26 @@
 """Database package."""
 
 from src.core.db.base import Base
+from src.core.db.profiler import (
+    QueryBudgetExceeded,
+    QueryProfile,
+    profile_queries,
+    query_budget,
+)
+from src.core.db.replica import read_only, use_primary
 from src.core.db.session import get_db
+from src.core.db.unit_of_work import UnitOfWorkSession
+from src.core.db.writes import StaleVersionError
 
-__all__ = ["Base", "get_db"]
+__all__ = [
+    "Base",
+    "get_db",
+    "QueryBudgetExceeded",
+    "QueryProfile",
+    "StaleVersionError",
+    "UnitOfWorkSession",
+    "profile_queries",
+    "query_budget",
+    "read_only",
+    "use_primary",
+]
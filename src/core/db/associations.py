@@ -0,0 +1,219 @@
+"""Set-based edits of many-to-many association tables."""
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional, Set
+
+from sqlalchemy import Column, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass
+class AssociationChange:
+    """Outcome of a batch applied to one owner's association rows."""
+
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    current: List[Any] = field(default_factory=list)
+    unknown: List[Any] = field(default_factory=list)  # ids with no member row
+
+    @property
+    def changed(self) -> bool:
+        """Whether any association row was written."""
+        return bool(self.added or self.removed)
+
+
+def owner_column(link: Column, owner: Column) -> Column:
+    """
+    Find the association column referencing the owner key.
+
+    Args:
+        link: Association column holding member ids
+        owner: Primary key column of the owning table
+
+    Returns:
+        Column of the association table with a foreign key to ``owner``
+    """
+    for column in link.table.c:
+        if column is not link and column.references(owner):
+            return column
+    raise ValueError(f"{link.table.name} has no foreign key to {owner}")
+
+
+async def apply_association_batch(
+    db: AsyncSession,
+    owner: Column,
+    owner_id: Any,
+    link: Column,
+    *,
+    add: Iterable[Any] = (),
+    remove: Iterable[Any] = (),
+    replace: Optional[Iterable[Any]] = None,
+    member: Optional[Column] = None,
+) -> Optional[AssociationChange]:
+    """
+    Add, remove or replace the members linked to one owner.
+
+    The current links are read in a single query, then the difference is
+    written with at most one multi-row INSERT and one DELETE. Links added
+    concurrently are skipped by ``ON CONFLICT DO NOTHING``, so ``added`` and
+    ``removed`` only list the rows actually written.
+
+    Args:
+        db: Database session
+        owner: Primary key column of the owning table, e.g. ``Role.role_id``
+        owner_id: Owner primary key value
+        link: Association column holding member ids
+        add: Member ids to link
+        remove: Member ids to unlink, ignored for ids also in ``add``
+        replace: Complete set of member ids, overrides ``add`` and ``remove``
+        member: Primary key column of the member table; when given, ids
+            without a member row are skipped and reported as unknown
+
+    Returns:
+        Applied change, or None if the owner does not exist
+    """
+    owner_link = owner_column(link, owner)
+
+    # Owner existence and its current links in one round trip
+    rows = await db.execute(
+        select(owner, link)
+        .select_from(owner.table)
+        .outerjoin(link.table, owner_link == owner)
+        .where(owner == owner_id)
+    )
+    rows = rows.all()
+    if not rows:
+        return None
+    current: Set[Any] = {row[1] for row in rows if row[1] is not None}
+
+    if replace is not None:
+        target = set(replace)
+        to_add = target - current
+        to_remove = current - target
+    else:
+        to_add = set(add) - current
+        to_remove = (set(remove) - set(add)) & current
+
+    change = AssociationChange()
+    if to_add:
+        if member is not None:
+            # INSERT ... SELECT drops ids that have no member row
+            statement = pg_insert(link.table).from_select(
+                [owner_link.name, link.name],
+                select(literal(owner_id), member).where(member.in_(to_add)),
+            )
+        else:
+            statement = pg_insert(link.table).values(
+                [{owner_link.name: owner_id, link.name: value} for value in to_add]
+            )
+        # Links added concurrently since the read are skipped, not errors
+        result = await db.execute(statement.on_conflict_do_nothing().returning(link))
+        change.added = sorted(result.scalars().all())
+        skipped = to_add - set(change.added)
+        if skipped and member is not None:
+            # Only a short insert pays the query telling conflicts from unknown ids
+            existing = await db.execute(select(member).where(member.in_(skipped)))
+            change.unknown = sorted(skipped - set(existing.scalars().all()))
+    if to_remove:
+        result = await db.execute(
+            delete(link.table)
+            .where(owner_link == owner_id, link.in_(to_remove))
+            .returning(link)
+        )
+        change.removed = sorted(result.scalars().all())
+
+    # Conflicting ids were linked by someone else, so they are current too
+    linked = to_add - set(change.unknown)
+    change.current = sorted((current - to_remove) | linked)
+    return change
+
+
+async def _both_exist(
+    db: AsyncSession, owner: Column, owner_id: Any, member: Column, member_id: Any
+) -> bool:
+    """Check the owner and member rows exist, in one query."""
+    result = await db.execute(
+        select(
+            select(owner).where(owner == owner_id).exists(),
+            select(member).where(member == member_id).exists(),
+        )
+    )
+    return all(result.one())
+
+
+async def link_member(
+    db: AsyncSession,
+    owner: Column,
+    owner_id: Any,
+    link: Column,
+    member: Column,
+    member_id: Any,
+) -> Optional[int]:
+    """
+    Link one member to an owner without loading either collection.
+
+    Runs ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``, so the cost does
+    not depend on how many members the owner already has.
+
+    Args:
+        db: Database session
+        owner: Primary key column of the owning table
+        owner_id: Owner primary key value
+        link: Association column holding member ids
+        member: Primary key column of the member table
+        member_id: Member primary key value
+
+    Returns:
+        Inserted row count (0 if already linked), or None if the owner or
+        the member does not exist
+    """
+    owner_link = owner_column(link, owner)
+    result = await db.execute(
+        pg_insert(link.table)
+        .from_select(
+            [owner_link.name, link.name],
+            select(owner, member).where(owner == owner_id, member == member_id),
+        )
+        .on_conflict_do_nothing()
+    )
+    # Only a no-op pays the round trip telling "linked" from "missing"
+    if result.rowcount == 0 and not await _both_exist(
+        db, owner, owner_id, member, member_id
+    ):
+        return None
+    return result.rowcount
+
+
+async def unlink_member(
+    db: AsyncSession,
+    owner: Column,
+    owner_id: Any,
+    link: Column,
+    member: Column,
+    member_id: Any,
+) -> Optional[int]:
+    """
+    Unlink one member from an owner with a targeted DELETE.
+
+    Args:
+        db: Database session
+        owner: Primary key column of the owning table
+        owner_id: Owner primary key value
+        link: Association column holding member ids
+        member: Primary key column of the member table
+        member_id: Member primary key value
+
+    Returns:
+        Deleted row count (0 if not linked), or None if the owner or the
+        member does not exist
+    """
+    owner_link = owner_column(link, owner)
+    result = await db.execute(
+        delete(link.table).where(owner_link == owner_id, link == member_id)
+    )
+    if result.rowcount == 0 and not await _both_exist(
+        db, owner, owner_id, member, member_id
+    ):
+        return None
+    return result.rowcount
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Dict
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Integer
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase
 
@@ -21,6 +21,13 @@ class Base(DeclarativeBase):
     updated_at = Column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
+    # Optimistic concurrency, incremented by every update
+    version = Column(Integer, default=1, server_default="1", nullable=False)
+
+    @declared_attr
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        """Let ORM flushes check and bump the version column too."""
+        return {"version_id_col": cls.version}
 
     def dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
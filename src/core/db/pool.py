@@ -0,0 +1,108 @@
+"""Connection pool configuration."""
+
+import math
+import uuid
+from typing import Any, Dict, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from src.core.config import settings
+from src.core.metrics import InstrumentedAsyncQueuePool
+
+
+def recommended_pool_size(max_connections: int, workers: int) -> Tuple[int, int]:
+    """
+    Split a server connection budget between worker processes.
+
+    Each worker gets an equal share; two thirds of it are kept open as the
+    steady pool and the rest is overflow opened only under bursts.
+
+    Args:
+        max_connections: Server connections the application may use in total
+        workers: Worker processes sharing them
+
+    Returns:
+        Pool size and max overflow for one worker
+    """
+    share = max(1, max_connections // max(1, workers))
+    pool_size = max(1, math.ceil(share * 2 / 3))
+    return pool_size, share - pool_size
+
+
+def _unique_statement_name() -> str:
+    # pgbouncer may hand each transaction a different server connection, so
+    # prepared statement names must never collide across clients
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def engine_options() -> Dict[str, Any]:
+    """
+    Build ``create_async_engine`` pool and driver arguments from settings.
+
+    Returns:
+        Keyword arguments for ``create_async_engine``
+    """
+    default_size, default_overflow = recommended_pool_size(
+        settings.DB_MAX_CONNECTIONS, settings.WEB_CONCURRENCY
+    )
+    pool_size = default_size if settings.DB_POOL_SIZE is None else settings.DB_POOL_SIZE
+    max_overflow = (
+        default_overflow if settings.DB_MAX_OVERFLOW is None else settings.DB_MAX_OVERFLOW
+    )
+
+    connect_args: Dict[str, Any] = {
+        # SQLAlchemy's per-connection cache of asyncpg prepared statements
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # asyncpg's own statement cache
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_PGBOUNCER:
+        # Transaction pooling cannot keep prepared statements between queries
+        connect_args.update(
+            prepared_statement_cache_size=0,
+            statement_cache_size=0,
+            prepared_statement_name_func=_unique_statement_name,
+        )
+
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "connect_args": connect_args,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if pool_size == 0:
+        # pgbouncer owns the pooling, every checkout opens a client connection
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,  # Measures checkout wait time
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_use_lifo=True,  # Lets idle surplus connections age out
+        )
+    return options
+
+
+def handle_disconnects(engine: Engine) -> None:
+    """
+    Optimistic disconnect handling, the alternative to ``pool_pre_ping``.
+
+    Instead of a round trip on every checkout, the statement that hits a
+    dropped connection fails and every pooled connection opened before it
+    is invalidated, so the next checkouts reconnect.
+
+    Args:
+        engine: Sync engine, i.e. ``AsyncEngine.sync_engine``
+    """
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(context):
+        if context.is_disconnect:
+            context.invalidate_pool_on_disconnect = True
+            logger.warning(
+                f"Database connection lost, invalidating pool: {context.original_exception}"
+            )
@@ -0,0 +1,188 @@
+"""SQL query profiler and N+1 detector."""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, TypeVar
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.metrics.fingerprint import Fingerprint, fingerprint
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Endpoint attribute holding the budget declared with @query_budget
+BUDGET_ATTRIBUTE = "__query_budget__"
+
+
+class QueryRecord(NamedTuple):
+    """One statement executed while profiling."""
+
+    statement: str
+    parameters: Any
+    duration_ms: float
+    shape: Fingerprint
+    executemany: bool
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when an endpoint runs more queries than declared."""
+
+
+class QueryProfile:
+    """Statements executed within one profiling scope, usually a request."""
+
+    def __init__(self):
+        self.queries: List[QueryRecord] = []
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_ms(self) -> float:
+        """Time spent in the database, in milliseconds."""
+        return sum(query.duration_ms for query in self.queries)
+
+    def repeated(self, threshold: int) -> Dict[str, List[QueryRecord]]:
+        """
+        Group statements whose shape ran at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum number of executions of one shape
+
+        Returns:
+            Executions keyed by fingerprint id
+        """
+        groups: Dict[str, List[QueryRecord]] = defaultdict(list)
+        for query in self.queries:
+            groups[query.shape.id].append(query)
+        return {key: group for key, group in groups.items() if len(group) >= threshold}
+
+    def slow(self, threshold_ms: float) -> List[QueryRecord]:
+        """
+        Statements that took longer than a threshold.
+
+        Args:
+            threshold_ms: Latency threshold in milliseconds
+
+        Returns:
+            Slow statements in execution order
+        """
+        return [query for query in self.queries if query.duration_ms >= threshold_ms]
+
+
+# Profile collecting statements for the current task, None when not profiling
+query_profile_var: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "query_profile", default=None
+)
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """
+    Collect the statements executed inside the block.
+
+    Only engines passed to ``profile_engine`` report statements.
+
+    Yields:
+        Profile filled in as statements run
+    """
+    profile = QueryProfile()
+    token = query_profile_var.set(profile)
+    try:
+        yield profile
+    finally:
+        query_profile_var.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if query_profile_var.get() is not None:
+        conn.info.setdefault("profile_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = query_profile_var.get()
+    starts = conn.info.get("profile_start")
+    if profile is None or not starts:
+        return
+    duration_ms = (time.perf_counter() - starts.pop()) * 1000
+    shape = fingerprint(statement)
+    profile.queries.append(
+        QueryRecord(statement, parameters, duration_ms, shape, executemany)
+    )
+
+
+def _handle_error(context):
+    # after_cursor_execute is skipped for failed statements
+    starts = context.connection.info.get("profile_start") if context.connection else None
+    if starts:
+        starts.pop()
+
+
+def profile_engine(engine: Engine) -> None:
+    """
+    Report statements of an engine to the active ``QueryProfile``.
+
+    Args:
+        engine: Sync engine, i.e. ``AsyncEngine.sync_engine``
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declare how many statements an endpoint may run.
+
+    Place it under the route decorator::
+
+        @router.get("/sidebar")
+        @query_budget(8)
+        async def get_sidebar(...):
+
+    Args:
+        max_queries: Statement budget, dependencies included
+
+    Returns:
+        Decorator returning the endpoint unchanged
+    """
+
+    def decorator(func: F) -> F:
+        setattr(func, BUDGET_ATTRIBUTE, max_queries)
+        return func
+
+    return decorator
+
+
+def get_query_budget(endpoint: Any) -> Optional[int]:
+    """Budget declared on an endpoint with ``query_budget``, if any."""
+    return getattr(endpoint, BUDGET_ATTRIBUTE, None)
+
+
+async def explain(engine: AsyncEngine, query: QueryRecord) -> Optional[str]:
+    """
+    Fetch the plan of a profiled SELECT statement.
+
+    Args:
+        engine: Engine the statement ran on
+        query: Profiled statement
+
+    Returns:
+        Plan text, or None for statements that are not plain SELECTs
+    """
+    if query.shape.operation != "SELECT" or query.executemany:
+        return None
+    try:
+        async with engine.connect() as conn:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN {query.statement}", query.parameters
+            )
+            return "\n".join(str(row[0]) for row in result)
+    except Exception as e:
+        logger.debug(f"EXPLAIN failed for {query.shape.id}: {e}")
+        return None
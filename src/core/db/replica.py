@@ -0,0 +1,218 @@
+"""Read replica routing."""
+
+import asyncio
+import functools
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from src.core.config import settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+# Set on functions marked with read_only
+READ_ONLY_ATTRIBUTE = "__read_only__"
+
+# Where reads of the current request go: None uses the primary but lets
+# @read_only functions opt into a replica, PRIMARY pins everything to the
+# primary (read-your-writes), REPLICA, set by @read_only, sends reads to a
+# replica.
+db_route_var: ContextVar[Optional[str]] = ContextVar("db_route", default=None)
+
+_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class ReplicaRouter:
+    """
+    Round-robin pool of replica engines skipping those that lag behind.
+
+    Replication lag is polled in the background; a replica whose lag exceeds
+    ``max_lag`` or whose check fails is taken out of rotation until it
+    catches up. With no usable replica, reads fall back to the primary.
+    """
+
+    def __init__(self, engines: List[AsyncEngine], max_lag: float):
+        """
+        Initialize router.
+
+        Args:
+            engines: Replica engines
+            max_lag: Replication lag in seconds above which a replica is skipped
+        """
+        self.engines = engines
+        self.max_lag = max_lag
+        self.lag: Dict[AsyncEngine, Optional[float]] = {engine: 0.0 for engine in engines}
+        self._cycle = itertools.cycle(engines) if engines else None
+        self._monitor: Optional[asyncio.Task] = None
+
+    def healthy(self, engine: AsyncEngine) -> bool:
+        """Whether a replica is in rotation."""
+        lag = self.lag.get(engine)
+        return lag is not None and lag <= self.max_lag
+
+    def pick(self) -> Optional[AsyncEngine]:
+        """
+        Choose the replica for a new session.
+
+        Returns:
+            Replica engine, or None when every replica lags or is down
+        """
+        if self._cycle is None:
+            return None
+        for _ in range(len(self.engines)):
+            engine = next(self._cycle)
+            if self.healthy(engine):
+                return engine
+        return None
+
+    async def check_lag(self) -> None:
+        """Measure the replication lag of every replica."""
+        for engine in self.engines:
+            try:
+                async with engine.connect() as conn:
+                    lag = (await conn.execute(_LAG_QUERY)).scalar()
+                self.lag[engine] = float(lag or 0.0)
+            except Exception as e:
+                self.lag[engine] = None
+                logger.warning(f"Replica {engine.url.host} unavailable: {e}")
+
+    async def _monitor_lag(self, interval: float) -> None:
+        while True:
+            await self.check_lag()
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float) -> None:
+        """
+        Start polling replication lag.
+
+        Args:
+            interval: Seconds between checks
+        """
+        if self.engines and self._monitor is None:
+            self._monitor = asyncio.create_task(
+                self._monitor_lag(interval), name="replica-lag-monitor"
+            )
+
+    async def stop(self) -> None:
+        """Stop polling and close replica connections."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            await asyncio.gather(self._monitor, return_exceptions=True)
+            self._monitor = None
+        for engine in self.engines:
+            await engine.dispose()
+
+
+class RoutingSession(Session):
+    """
+    Session sending reads to a replica when the request allows it.
+
+    Flushes, DML statements and ``SELECT ... FOR UPDATE`` always go to the
+    primary, and once a session has written, all of its later reads do too.
+    Raw ``text()`` statements count as reads, so write through the ORM or
+    Core DML constructs in handlers routed to replicas.
+    """
+
+    router: Optional[ReplicaRouter] = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+            return primary
+        if (
+            self.router is None
+            or self.info.get("wrote")
+            or db_route_var.get() != REPLICA
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            return primary
+
+        # Keep one replica per session so its reads share a snapshot
+        replica = self.info.get("replica")
+        if replica is None:
+            replica = self.router.pick()
+            if replica is None:
+                return primary
+            self.info["replica"] = replica
+        return replica.sync_engine
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """Pin every read in the block to the primary."""
+    token = db_route_var.set(PRIMARY)
+    try:
+        yield
+    finally:
+        db_route_var.reset(token)
+
+
+def read_only(func: F) -> F:
+    """
+    Mark a service method or an endpoint as safe to serve from a replica.
+
+    Reads inside the function go to a replica unless the request is pinned
+    to the primary after a recent write. On an endpoint, placed under the
+    route decorator, it also lets ``get_db`` run GET requests in autocommit
+    mode, so the handler must not write.
+
+    Args:
+        func: Async service method or endpoint
+
+    Returns:
+        Wrapped function
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if db_route_var.get() is not None:
+            return await func(*args, **kwargs)
+        token = db_route_var.set(REPLICA)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            db_route_var.reset(token)
+
+    setattr(wrapper, READ_ONLY_ATTRIBUTE, True)
+    return wrapper  # type: ignore[return-value]
+
+
+def is_read_only(endpoint: Any) -> bool:
+    """Whether a function was marked with ``read_only``."""
+    return getattr(endpoint, READ_ONLY_ATTRIBUTE, False)
+
+
+def primary_until(value: Optional[str]) -> float:
+    """
+    Parse a read-your-writes marker.
+
+    Args:
+        value: Cookie or header value, a unix timestamp
+
+    Returns:
+        Time until which reads stick to the primary, 0 if absent or invalid
+    """
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+def sticky_marker() -> str:
+    """Read-your-writes marker for a request that just wrote."""
+    return f"{time.time() + settings.REPLICA_STICKY_SECONDS:.3f}"
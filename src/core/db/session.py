@@ -2,43 +2,85 @@
 
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from fastapi import Request
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
+from src.core.db.pool import engine_options, handle_disconnects
+from src.core.db.profiler import profile_engine
+from src.core.db.replica import ReplicaRouter, RoutingSession, is_read_only
+from src.core.db.unit_of_work import UnitOfWorkSession
+from src.core.metrics import instrument_engine
+from src.core.tracing.sqlalchemy import trace_engine
 
-# Create async engine
+# Create async engine, pool sizing and driver options come from settings
 engine = create_async_engine(
     str(settings.DATABASE_URL),
-    echo=settings.DEBUG,  # SQL logging
     future=True,  # Enable future SQLAlchemy features
-    pool_pre_ping=True,  # Enable connection health checks
-    pool_size=20,  # Maximum number of connections in the pool
-    max_overflow=10,  # Maximum number of connections that can be created beyond pool_size
-    pool_timeout=30,  # Timeout for getting connection from pool
-    pool_recycle=1800,  # Recycle connections after 30 minutes
+    **engine_options(),
+)
+
+# Read replicas, only used when DATABASE_REPLICA_URLS is set
+replica_router = ReplicaRouter(
+    [
+        create_async_engine(url, future=True, **engine_options())
+        for url in settings.DATABASE_REPLICA_URLS
+    ],
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
 )
+RoutingSession.router = replica_router
+
+for _engine in [engine, *replica_router.engines]:
+    # Recover from dropped connections without pinging on every checkout
+    if not settings.DB_POOL_PRE_PING:
+        handle_disconnects(_engine.sync_engine)
+
+    # Query and pool metrics, pool gauges track the primary
+    if settings.METRICS_ENABLED:
+        instrument_engine(_engine.sync_engine, pool_metrics=_engine is engine)
+
+    # Statement spans
+    if settings.TRACING_ENABLED:
+        trace_engine(_engine.sync_engine)
+
+    # Per-request statement profiling
+    if settings.SQL_PROFILER_ENABLED:
+        profile_engine(_engine.sync_engine)
 
 # Create async session factory
 async_session_factory = async_sessionmaker(
     engine,
-    class_=AsyncSession,
+    class_=UnitOfWorkSession,
+    # Routes reads to replicas when there are any
+    sync_session_class=RoutingSession if replica_router.engines else Session,
     expire_on_commit=False,  # Don't expire objects after commit
     autoflush=False,  # Don't auto flush changes
     autocommit=False,  # Don't auto commit transactions
 )
 
+# Read-only endpoints read without BEGIN/COMMIT round trips
+read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[UnitOfWorkSession, None]:
     """
     Get database session.
 
+    The session is a unit of work: service-level ``commit()`` calls only
+    flush and everything is committed once when the handler returns, or not
+    at all if nothing was written. GET, HEAD and OPTIONS requests to
+    endpoints marked with ``read_only`` run in autocommit mode, without
+    transaction round trips; every other request gets a transaction.
+
+    Args:
+        request: FastAPI request
+
     Yields:
-        AsyncSession: Database session
+        UnitOfWorkSession: Database session
 
     Example:
         async def my_endpoint(db: AsyncSession = Depends(get_db)):
@@ -46,10 +88,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(query)
             user = result.scalar_one_or_none()
     """
-    async with async_session_factory() as session:
+    # Writes through the autocommit bind are not atomic, so it is opt-in
+    read = request.method in SAFE_METHODS and is_read_only(
+        request.scope.get("endpoint")
+    )
+    bind = read_engine if read else engine
+    async with async_session_factory(bind=bind) as session:
+        session.begin_unit_of_work()
         try:
             yield session
-            await session.commit()
+            await session.complete()
         except Exception:
             await session.rollback()
             raise
@@ -63,7 +111,7 @@ def create_test_engine():
 
     return create_async_engine(
         str(settings.DATABASE_URL),
-        echo=settings.DEBUG,
+        echo=settings.DB_ECHO,
         future=True,
         poolclass=NullPool,  # Disable connection pooling for tests
     )
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""Request-scoped unit of work."""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+# Session.info keys
+DEFERRED = "defer_commit"
+WROTE = "wrote"
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    session.info[WROTE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state):
+    # Raw SQL may write too, so it counts as a write
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+        or isinstance(orm_execute_state.statement, TextClause)
+    ):
+        orm_execute_state.session.info[WROTE] = True
+
+
+class UnitOfWorkSession(AsyncSession):
+    """
+    Session committing once, at the end of the unit of work.
+
+    While ``begin_unit_of_work`` is in effect, ``commit()`` only flushes, so
+    services can keep calling it after each write: their changes reach the
+    database (generated keys, constraint errors) but are committed together
+    by ``complete()``. Sessions that never wrote skip the commit entirely.
+    Outside a unit of work the session behaves like a plain ``AsyncSession``.
+    """
+
+    def begin_unit_of_work(self) -> None:
+        """Defer commits until ``complete()``."""
+        self.info[DEFERRED] = True
+
+    @property
+    def wrote(self) -> bool:
+        """Whether the session has written or holds pending changes."""
+        return bool(self.info.get(WROTE) or self.new or self.dirty or self.deleted)
+
+    async def commit(self) -> None:
+        """Commit, or only flush while a unit of work is open."""
+        if self.info.get(DEFERRED):
+            await self.flush()
+            return
+        await super().commit()
+
+    async def complete(self) -> None:
+        """Close the unit of work, committing if anything was written."""
+        self.info[DEFERRED] = False
+        if self.wrote:
+            await super().commit()
+        self.info[WROTE] = False
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        """
+        Open a SAVEPOINT inside the unit of work.
+
+        Use it where a failure should undo only part of the request::
+
+            async with db.savepoint():
+                await service.add_role(user_id, role_id)
+
+        Returns:
+            Nested transaction, rolled back to the savepoint on error
+        """
+        return self.begin_nested()
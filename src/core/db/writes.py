@@ -0,0 +1,157 @@
+"""Single-statement writes using RETURNING."""
+
+from typing import Any, Dict, Optional, Set, Type, TypeVar
+
+from sqlalchemy import Column, UniqueConstraint, delete, insert, inspect, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelType = TypeVar("ModelType")
+
+# SQLSTATE of a unique constraint or unique index violation
+UNIQUE_VIOLATION = "23505"
+
+
+class StaleVersionError(Exception):
+    """Raised when a row changed since the version the client last read."""
+
+    def __init__(self, model: type, ident: Any, expected_version: int):
+        self.model = model
+        self.ident = ident
+        self.expected_version = expected_version
+        super().__init__(
+            f"{model.__name__} {ident} is no longer at version {expected_version}"
+        )
+
+
+def primary_key(model: type) -> Any:
+    """Primary key column of a single-key model."""
+    return inspect(model).primary_key[0]
+
+
+def _unique_names(column: Column) -> Set[str]:
+    """Names of the unique indexes and constraints covering a column."""
+    table = column.table
+    names = {
+        index.name
+        for index in table.indexes
+        if index.unique and column.name in index.columns
+    }
+    names |= {
+        constraint.name
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+        and column.name in constraint.columns
+    }
+    names.discard(None)
+    return names
+
+
+def is_unique_violation(error: IntegrityError, column: Column) -> bool:
+    """
+    Tell whether an IntegrityError is a duplicate value of one column.
+
+    Args:
+        error: Error raised by the statement
+        column: Column with a unique index or constraint, e.g. ``Role.name``
+
+    Returns:
+        True only for a unique violation on a constraint covering ``column``
+    """
+    orig = error.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if code != UNIQUE_VIOLATION:
+        return False
+    names = _unique_names(column)
+    # asyncpg chains its own error, psycopg exposes the diagnostics
+    constraint = getattr(orig.__cause__, "constraint_name", None) or getattr(
+        getattr(orig, "diag", None), "constraint_name", None
+    )
+    if constraint is not None:
+        return constraint in names
+    return any(f'"{name}"' in str(orig) for name in names)
+
+
+async def insert_returning(
+    db: AsyncSession, model: Type[ModelType], values: Dict[str, Any]
+) -> ModelType:
+    """
+    Insert a row and load it back in the same statement.
+
+    Args:
+        db: Database session
+        model: Mapped class
+        values: Column values
+
+    Returns:
+        Persisted instance, attached to the session
+    """
+    result = await db.execute(insert(model).values(**values).returning(model))
+    return result.scalar_one()
+
+
+async def update_returning(
+    db: AsyncSession,
+    model: Type[ModelType],
+    ident: Any,
+    values: Dict[str, Any],
+    expected_version: Optional[int] = None,
+) -> Optional[ModelType]:
+    """
+    Update a row by primary key and load it back in the same statement.
+
+    The row's version is incremented. When ``expected_version`` is given the
+    update only applies if the row is still at that version.
+
+    Args:
+        db: Database session
+        model: Mapped class with a ``version`` column
+        ident: Primary key value
+        values: Column values to set
+        expected_version: Version the caller based its changes on
+
+    Returns:
+        Updated instance, or None if no row has that primary key
+
+    Raises:
+        StaleVersionError: If the row exists at another version
+    """
+    pk = primary_key(model)
+    statement = update(model).where(pk == ident)
+    if expected_version is not None:
+        statement = statement.where(model.version == expected_version)
+    statement = (
+        statement.values(**values, version=model.version + 1)
+        .returning(model)
+        .execution_options(populate_existing=True, synchronize_session=False)
+    )
+    instance = (await db.execute(statement)).scalar_one_or_none()
+
+    # Only the failure path pays a second round trip to tell the cases apart
+    if instance is None and expected_version is not None:
+        exists = await db.scalar(pk.table.select().with_only_columns(pk).where(pk == ident))
+        if exists is not None:
+            raise StaleVersionError(model, ident, expected_version)
+    return instance
+
+
+async def delete_returning(db: AsyncSession, model: type, ident: Any) -> bool:
+    """
+    Delete a row by primary key.
+
+    Args:
+        db: Database session
+        model: Mapped class
+        ident: Primary key value
+
+    Returns:
+        True if a row was deleted
+    """
+    pk = primary_key(model)
+    result = await db.execute(
+        delete(model)
+        .where(pk == ident)
+        .returning(pk)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none() is not None
@@ -0,0 +1,5 @@
+"""Debug tracing package."""
+
+from src.core.debug.trace import AuthzTrace, authz_trace
+
+__all__ = ["AuthzTrace", "authz_trace"]
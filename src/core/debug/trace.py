@@ -0,0 +1,130 @@
+"""In-process trace buffer for authorization decisions."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from src.core.config import settings
+from src.core.log.context import request_id_var
+
+
+class AuthzTrace:
+    """
+    Ring buffer of recent authorization decisions and debug events.
+
+    Callers check ``enabled`` before building a record, so a disabled trace
+    costs one attribute lookup per decision. The buffer is per process:
+    with several workers each one keeps its own history.
+    """
+
+    def __init__(self, maxlen: int = 1000, enabled: bool = False):
+        """
+        Initialize trace buffer.
+
+        Args:
+            maxlen: Number of records kept before the oldest are dropped
+            enabled: Whether records are collected
+        """
+        self.enabled = enabled
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        record["ts"] = time.time()
+        record["request_id"] = request_id_var.get()
+        with self._lock:
+            self._records.append(record)
+
+    def decision(
+        self,
+        *,
+        user_id: Optional[str],
+        resource: str,
+        action: str,
+        policy_id: Optional[int],
+        expression: Any,
+        outcome: bool,
+        duration_ms: float,
+        steps: Optional[List[Dict[str, Any]]] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Record the evaluation of one policy.
+
+        Args:
+            user_id: Acting user
+            resource: Requested resource
+            action: Requested action
+            policy_id: Permission that was evaluated, None for shortcuts
+            expression: ABAC expression of the permission
+            outcome: Whether the policy granted access
+            duration_ms: Evaluation time in milliseconds
+            steps: Sub-expression results in evaluation order
+            reason: Why no policy was evaluated, if applicable
+        """
+        self._append(
+            {
+                "kind": "decision",
+                "user_id": user_id,
+                "resource": resource,
+                "action": action,
+                "policy_id": policy_id,
+                "expression": expression,
+                "outcome": outcome,
+                "duration_ms": round(duration_ms, 4),
+                "steps": steps or [],
+                "reason": reason,
+            }
+        )
+
+    def event(self, name: str, **fields: Any) -> None:
+        """
+        Record a free-form debug event.
+
+        Args:
+            name: Event name
+            fields: Event attributes
+        """
+        self._append({"kind": "event", "name": name, **fields})
+
+    def records(
+        self,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the most recent records, newest first.
+
+        Args:
+            limit: Maximum number of records
+            user_id: Only records of this user
+            request_id: Only records of this request
+
+        Returns:
+            List of records
+        """
+        with self._lock:
+            snapshot = list(self._records)
+        result = []
+        for record in reversed(snapshot):
+            if user_id is not None and record.get("user_id") != user_id:
+                continue
+            if request_id is not None and record["request_id"] != request_id:
+                continue
+            result.append(record)
+            if len(result) >= limit:
+                break
+        return result
+
+    def clear(self) -> None:
+        """Drop all records."""
+        with self._lock:
+            self._records.clear()
+
+
+# Global instance
+authz_trace = AuthzTrace(
+    maxlen=settings.AUTHZ_TRACE_BUFFER_SIZE, enabled=settings.AUTHZ_TRACE_ENABLED
+)
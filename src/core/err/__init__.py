@@ -3,6 +3,7 @@
 from src.core.err.handlers import (
     http_exception_handler,
     internal_exception_handler,
+    stale_version_handler,
     validation_exception_handler,
 )
 from src.core.err.models import ErrorResponse
@@ -11,6 +12,7 @@ __all__ = [
     "ErrorResponse",
     "http_exception_handler",
     "internal_exception_handler",
+    "stale_version_handler",
     "validation_exception_handler",
     "setup_exception_handlers",
 ]
@@ -26,11 +28,16 @@ def setup_exception_handlers(app):
     from fastapi.exceptions import RequestValidationError
     from starlette.exceptions import HTTPException as StarletteHTTPException
 
+    from src.core.db.writes import StaleVersionError
+
     # Handle specific HTTP exceptions
     app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 
     # Handle validation errors
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
+    # Handle optimistic concurrency conflicts
+    app.add_exception_handler(StaleVersionError, stale_version_handler)
+
     # Handle all other unhandled exceptions
     app.add_exception_handler(Exception, internal_exception_handler)
@@ -8,6 +8,8 @@ from fastapi.responses import JSONResponse
 from loguru import logger  # type: ignore
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from src.core.db.writes import StaleVersionError
+
 
 async def http_exception_handler(
     request: Request, exc: StarletteHTTPException
@@ -67,6 +69,30 @@ async def validation_exception_handler(
     )
 
 
+async def stale_version_handler(
+    request: Request, exc: StaleVersionError
+) -> JSONResponse:
+    """
+    Handle optimistic concurrency conflicts.
+
+    Args:
+        request: FastAPI request
+        exc: Stale version error
+
+    Returns:
+        JSON response asking the client to reload before retrying
+    """
+    logger.warning(f"Version conflict on {request.url.path}: {exc}")
+
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "detail": str(exc),
+            "status_code": status.HTTP_409_CONFLICT,
+        },
+    )
+
+
 async def internal_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
     Handle internal server errors.
@@ -0,0 +1,12 @@
+"""Background jobs package."""
+
+from src.core.jobs.queues import Job, LocalJobQueue, RedisStreamJobQueue
+from src.core.jobs.runner import JobRunner, job_runner
+
+__all__ = [
+    "Job",
+    "JobRunner",
+    "LocalJobQueue",
+    "RedisStreamJobQueue",
+    "job_runner",
+]
@@ -0,0 +1,178 @@
+"""Job queue backends."""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from redis import asyncio as aioredis
+from redis.exceptions import ResponseError
+
+
+@dataclass
+class Job:
+    """A queued call of a registered job function."""
+
+    name: str
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempt: int = 0
+    traceparent: Optional[str] = None  # links the job span to its producer
+    receipt: Optional[str] = field(default=None, compare=False)  # backend handle
+
+    def dumps(self) -> str:
+        """Serialize the job, arguments must be JSON compatible."""
+        data = asdict(self)
+        del data["receipt"]
+        return json.dumps(data)
+
+    @classmethod
+    def loads(cls, payload: str, receipt: Optional[str] = None) -> "Job":
+        """Rebuild a job serialized with ``dumps``."""
+        return cls(**json.loads(payload), receipt=receipt)
+
+    def retry(self) -> "Job":
+        """Copy of the job for its next attempt."""
+        return Job(
+            name=self.name,
+            args=self.args,
+            kwargs=self.kwargs,
+            id=self.id,
+            attempt=self.attempt + 1,
+            traceparent=self.traceparent,
+        )
+
+
+class LocalJobQueue:
+    """Bounded in-process queue, jobs are lost when the process exits."""
+
+    durable = False
+
+    def __init__(self, maxsize: int):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def setup(self) -> None:
+        """Nothing to prepare for an in-process queue."""
+
+    async def put(self, job: Job) -> bool:
+        """Queue a job without waiting, False when the queue is full."""
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def get(self, timeout: float) -> Optional[Job]:
+        """Wait up to ``timeout`` seconds for the next job."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def ack(self, job: Job) -> None:
+        """Mark a job as handled."""
+        self._queue.task_done()
+
+    def empty(self) -> bool:
+        """Whether no job is waiting."""
+        return self._queue.empty()
+
+
+class RedisStreamJobQueue:
+    """
+    Redis Streams queue shared by every worker process.
+
+    Jobs are read through a consumer group and only removed once handled,
+    so jobs held by a process that died are claimed by another consumer
+    after ``claim_idle`` seconds.
+    """
+
+    durable = True
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        stream: str,
+        group: str = "workers",
+        maxlen: Optional[int] = None,
+        claim_idle: float = 300.0,
+    ):
+        self.redis = redis
+        self.stream = stream
+        self.group = group
+        self.maxlen = maxlen
+        self.claim_idle = claim_idle
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._claimed: List[Job] = []
+        self._next_claim = 0.0
+
+    async def setup(self) -> None:
+        """Create the consumer group, and the stream with it."""
+        try:
+            await self.redis.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def put(self, job: Job) -> bool:
+        """Append a job to the stream."""
+        await self.redis.xadd(
+            self.stream,
+            {"job": job.dumps()},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+        return True
+
+    async def _claim_abandoned(self) -> None:
+        """Take over jobs other consumers left unacknowledged for too long."""
+        self._next_claim = time.monotonic() + self.claim_idle / 2
+        result = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=int(self.claim_idle * 1000),
+            count=100,
+        )
+        for message in result[1]:
+            # Entries trimmed from the stream come back empty
+            if message and message[1]:
+                self._claimed.append(Job.loads(message[1]["job"], message[0]))
+        if self._claimed:
+            logger.warning(f"Claimed {len(self._claimed)} abandoned jobs")
+
+    async def get(self, timeout: float) -> Optional[Job]:
+        """Wait up to ``timeout`` seconds for the next job."""
+        if time.monotonic() >= self._next_claim:
+            await self._claim_abandoned()
+        if self._claimed:
+            return self._claimed.pop()
+
+        response = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream: ">"},
+            count=1,
+            block=int(timeout * 1000),
+        )
+        if not response:
+            return None
+        message_id, fields = response[0][1][0]
+        return Job.loads(fields["job"], message_id)
+
+    async def ack(self, job: Job) -> None:
+        """Acknowledge and drop a handled job."""
+        await self.redis.xack(self.stream, self.group, job.receipt)
+        await self.redis.xdel(self.stream, job.receipt)
+
+    def empty(self) -> bool:
+        """Queued jobs outlive the process, so there is nothing to drain."""
+        return True
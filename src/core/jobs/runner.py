@@ -0,0 +1,259 @@
+"""In-process runner for background jobs."""
+
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Union
+
+from loguru import logger
+from redis import asyncio as aioredis
+
+from src.core.config import settings
+from src.core.jobs.queues import Job, LocalJobQueue, RedisStreamJobQueue
+from src.core.metrics import JOB_DURATION, JOBS_PROCESSED
+from src.core.tracing import (
+    current_span_var,
+    format_traceparent,
+    parse_traceparent,
+    tracer,
+)
+
+JobQueue = Union[LocalJobQueue, RedisStreamJobQueue]
+
+# Seconds a worker waits for a job before re-checking for shutdown
+POLL_INTERVAL = 1.0
+
+
+class JobHandler(NamedTuple):
+    """Registered job function."""
+
+    func: Callable[..., Any]
+    max_retries: int
+
+
+class JobRunner:
+    """
+    Run side effects outside the request path.
+
+    Handlers and services enqueue registered jobs by name; worker tasks
+    started in the application lifespan run them, retrying failures with
+    exponential backoff. ``stop`` lets queued jobs finish before cancelling.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+    ):
+        self.enabled = settings.JOBS_ENABLED
+        self.backend = settings.JOBS_BACKEND
+        self.workers = max(1, workers or settings.JOBS_WORKERS)
+        self.max_retries = (
+            settings.JOBS_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.retry_backoff = (
+            settings.JOBS_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        )
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[JobQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._retries: Set[asyncio.Task] = set()
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker tasks have been started."""
+        return bool(self._workers)
+
+    def register(
+        self, name: Optional[str] = None, max_retries: Optional[int] = None
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Register a job function under a name.
+
+        Jobs are enqueued by name so the Redis backend can hand them to any
+        worker process; their arguments must therefore be JSON compatible.
+        Sync functions run in a thread.
+
+        Args:
+            name: Job name, defaults to the function's module and name
+            max_retries: Retry limit, defaults to ``JOBS_MAX_RETRIES``
+
+        Returns:
+            Decorator returning the function unchanged
+        """
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            job_name = name or f"{func.__module__}.{func.__qualname__}"
+            retries = self.max_retries if max_retries is None else max_retries
+            self._handlers[job_name] = JobHandler(func, retries)
+            return func
+
+        return decorator
+
+    async def start(self, redis: Optional[aioredis.Redis] = None) -> None:
+        """
+        Start the queue consumers.
+
+        Args:
+            redis: Redis client, required for the "redis" backend
+        """
+        if not self.enabled or self.running:
+            return
+        if self.backend == "redis":
+            if redis is None:
+                raise ValueError("Redis client required for the redis job queue")
+            self._queue = RedisStreamJobQueue(
+                redis,
+                settings.JOBS_STREAM,
+                maxlen=settings.JOBS_STREAM_MAXLEN,
+                claim_idle=settings.JOBS_CLAIM_IDLE_SECONDS,
+            )
+        else:
+            self._queue = LocalJobQueue(settings.JOBS_QUEUE_SIZE)
+        await self._queue.setup()
+
+        self._closing = False
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Job runner started ({self.backend}, {self.workers} workers)")
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Drain the queue and stop the workers.
+
+        Args:
+            timeout: Seconds to wait for queued jobs, defaults to
+                ``JOBS_DRAIN_TIMEOUT``; unfinished jobs are then cancelled
+        """
+        if not self.running:
+            return
+        self._closing = True
+        timeout = settings.JOBS_DRAIN_TIMEOUT if timeout is None else timeout
+
+        _, pending = await asyncio.wait(self._workers, timeout=timeout)
+        abandoned = pending | self._retries
+        for task in abandoned:
+            task.cancel()
+        await asyncio.gather(*abandoned, return_exceptions=True)
+        if pending:
+            logger.warning("Job runner stopped before the queue drained")
+
+        self._workers = []
+        self._retries.clear()
+        self._queue = None
+        logger.info("Job runner stopped")
+
+    async def enqueue(self, job_name: str, /, *args: Any, **kwargs: Any) -> bool:
+        """
+        Schedule a registered job without waiting for it.
+
+        Args:
+            job_name: Registered job name
+            *args: Positional arguments of the job function
+            **kwargs: Keyword arguments of the job function
+
+        Returns:
+            True if the job was queued
+
+        Raises:
+            KeyError: If no job is registered under ``job_name``
+        """
+        if job_name not in self._handlers:
+            raise KeyError(f"Unknown job: {job_name}")
+        if not self.running or self._closing:
+            logger.warning(f"Job runner not running, dropping {job_name}")
+            return False
+
+        span = current_span_var.get()
+        job = Job(
+            name=job_name,
+            args=list(args),
+            kwargs=kwargs,
+            traceparent=format_traceparent(span.context) if span else None,
+        )
+        if not await self._queue.put(job):  # type: ignore[union-attr]
+            logger.warning(f"Job queue full, dropping {job_name}")
+            return False
+        return True
+
+    def _drained(self) -> bool:
+        """Whether a closing runner has nothing left to run."""
+        return not self._retries and self._queue.empty()  # type: ignore[union-attr]
+
+    async def _work(self) -> None:
+        """Run queued jobs until closing and drained."""
+        while not (self._closing and self._drained()):
+            try:
+                job = await self._queue.get(POLL_INTERVAL)  # type: ignore[union-attr]
+                if job is not None:
+                    await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # A lost Redis connection must not kill the worker
+                logger.error(f"Job queue error: {e}")
+                await asyncio.sleep(POLL_INTERVAL)
+
+    async def _run(self, job: Job) -> None:
+        """Run one job, scheduling a retry if it fails."""
+        handler = self._handlers.get(job.name)
+        if handler is None:
+            logger.error(f"No handler for job {job.name}, dropping it")
+            await self._queue.ack(job)  # type: ignore[union-attr]
+            return
+
+        start = time.perf_counter()
+        try:
+            with tracer.start_span(
+                f"job {job.name}",
+                {"job.id": job.id, "job.attempt": job.attempt},
+                kind="consumer",
+                parent=parse_traceparent(job.traceparent),
+            ):
+                if inspect.iscoroutinefunction(handler.func):
+                    await handler.func(*job.args, **job.kwargs)
+                else:
+                    await asyncio.to_thread(handler.func, *job.args, **job.kwargs)
+        except Exception as e:
+            if job.attempt < handler.max_retries:
+                outcome = "retry"
+                delay = min(
+                    self.retry_backoff * 2**job.attempt,
+                    settings.JOBS_RETRY_BACKOFF_MAX,
+                )
+                logger.warning(
+                    f"Job {job.name} failed (attempt {job.attempt + 1}), "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                task = asyncio.create_task(self._retry(job, delay))
+                self._retries.add(task)
+                task.add_done_callback(self._retries.discard)
+            else:
+                outcome = "failed"
+                logger.error(
+                    f"Job {job.name} failed after {job.attempt + 1} attempts: {e}"
+                )
+                await self._queue.ack(job)  # type: ignore[union-attr]
+        else:
+            outcome = "success"
+            await self._queue.ack(job)  # type: ignore[union-attr]
+        finally:
+            JOB_DURATION.labels(job=job.name).observe(time.perf_counter() - start)
+
+        JOBS_PROCESSED.labels(job=job.name, outcome=outcome).inc()
+
+    async def _retry(self, job: Job, delay: float) -> None:
+        """Requeue a failed job after its backoff delay."""
+        await asyncio.sleep(delay)
+        if not await self._queue.put(job.retry()):  # type: ignore[union-attr]
+            logger.error(f"Job queue full, dropping retry of {job.name}")
+        # Acknowledged only now, so a durable queue keeps the job if we die
+        await self._queue.ack(job)  # type: ignore[union-attr]
+
+
+# Global instance
+job_runner = JobRunner()
@@ -1,5 +1,6 @@
 """Logging package."""
 
 from src.core.log.config import InterceptHandler, setup_logging
+from src.core.log.context import request_id_var
 
-__all__ = ["InterceptHandler", "setup_logging"]
+__all__ = ["InterceptHandler", "setup_logging", "request_id_var"]
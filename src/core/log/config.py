@@ -6,6 +6,7 @@ import sys
 from loguru import logger
 
 from src.core.config import settings
+from src.core.tracing import current_span_var
 
 
 class InterceptHandler(logging.Handler):
@@ -40,6 +41,18 @@ class InterceptHandler(logging.Handler):
         )
 
 
+def add_trace_context(record: dict) -> None:
+    """
+    Attach the active trace and span ids to a log record.
+
+    Args:
+        record: Loguru record
+    """
+    span = current_span_var.get()
+    record["extra"]["trace_id"] = span.trace_id if span else ""
+    record["extra"]["span_id"] = span.span_id if span else ""
+
+
 def setup_logging() -> None:
     """Configure logging with loguru."""
     # Remove default handlers
@@ -51,15 +64,34 @@ def setup_logging() -> None:
         logging.getLogger(name).handlers = []
         logging.getLogger(name).propagate = True
 
+    console_format = (
+        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
+        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+        "<level>{message}</level>"
+    )
+    if settings.TRACING_ENABLED:
+        console_format += " <dim>trace={extra[trace_id]}</dim>"
+
     # Configure loguru
     logger.configure(
         handlers=[
             {
                 "sink": sys.stdout,
                 "level": settings.LOG_LEVEL,
-                "format": "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            }
-        ]
+                "format": console_format,
+                "filter": lambda record: "access_log" not in record["extra"],
+            },
+            {
+                # Access records are preformatted JSON lines; enqueue hands
+                # them to a writer thread so requests never block on I/O
+                "sink": settings.ACCESS_LOG_SINK or sys.stdout,
+                "level": "INFO",
+                "format": "{message}",
+                "filter": lambda record: "access_log" in record["extra"],
+                "enqueue": True,
+            },
+        ],
+        patcher=add_trace_context,
     )
 
     # Add specific loggers
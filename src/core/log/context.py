@@ -0,0 +1,7 @@
+"""Per-request logging context."""
+
+from contextvars import ContextVar
+from typing import Optional
+
+# Identifier of the request being handled, set by LoggingMiddleware
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
@@ -0,0 +1,46 @@
+"""Metrics package."""
+
+from src.core.metrics.collectors import (
+    ABAC_EVALUATION_DURATION,
+    ABAC_EVALUATION_FAILURES,
+    ABAC_EVALUATIONS,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_OVERFLOW,
+    DB_QUERY_DURATION,
+    HTTP_REQUEST_DURATION,
+    JOB_DURATION,
+    JOBS_PROCESSED,
+    PASSWORD_HASH_DURATION,
+    REDIS_COMMAND_DURATION,
+    record_abac_evaluation,
+    record_abac_failure,
+)
+from src.core.metrics.endpoint import mark_worker_dead, metrics_endpoint
+from src.core.metrics.fingerprint import Fingerprint, fingerprint
+from src.core.metrics.redis import InstrumentedRedis
+from src.core.metrics.sqlalchemy import InstrumentedAsyncQueuePool, instrument_engine
+
+__all__ = [
+    "ABAC_EVALUATIONS",
+    "ABAC_EVALUATION_DURATION",
+    "ABAC_EVALUATION_FAILURES",
+    "DB_POOL_CHECKED_OUT",
+    "DB_POOL_CHECKOUT_WAIT",
+    "DB_POOL_OVERFLOW",
+    "DB_QUERY_DURATION",
+    "HTTP_REQUEST_DURATION",
+    "JOB_DURATION",
+    "JOBS_PROCESSED",
+    "PASSWORD_HASH_DURATION",
+    "REDIS_COMMAND_DURATION",
+    "Fingerprint",
+    "InstrumentedAsyncQueuePool",
+    "InstrumentedRedis",
+    "fingerprint",
+    "instrument_engine",
+    "mark_worker_dead",
+    "metrics_endpoint",
+    "record_abac_evaluation",
+    "record_abac_failure",
+]
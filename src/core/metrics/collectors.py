@@ -0,0 +1,123 @@
+"""Metric definitions."""
+
+import os
+
+from src.core.config import settings
+
+# prometheus_client picks its value storage on import, so multiprocess mode
+# has to be switched on before the first import.
+if settings.METRICS_MULTIPROC_DIR:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.METRICS_MULTIPROC_DIR)
+
+from prometheus_client import Counter, Gauge, Histogram  # noqa: E402
+
+FAST_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement latency by statement fingerprint",
+    ["operation", "table", "fingerprint"],
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Database connections opened beyond pool_size",
+    multiprocess_mode="livesum",
+)
+
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency",
+    ["command"],
+    buckets=FAST_BUCKETS,
+)
+
+JOBS_PROCESSED = Counter(
+    "jobs_processed_total",
+    "Background job runs by outcome",
+    ["job", "outcome"],
+)
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Background job run time",
+    ["job"],
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hashing and verification time",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0),
+)
+
+ABAC_EVALUATIONS = Counter(
+    "abac_evaluations_total",
+    "ABAC policy evaluations",
+    ["permission", "outcome"],
+)
+ABAC_EVALUATION_DURATION = Histogram(
+    "abac_evaluation_duration_seconds",
+    "ABAC policy evaluation time",
+    ["permission"],
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05),
+)
+ABAC_EVALUATION_FAILURES = Counter(
+    "abac_evaluation_failures_total",
+    "ABAC policy evaluations denied for an error or an exceeded time budget",
+    ["permission", "reason"],
+)
+
+
+def record_abac_evaluation(permission: str, allowed: bool, seconds: float) -> None:
+    """
+    Record one ABAC policy evaluation.
+
+    Args:
+        permission: Permission name
+        allowed: Evaluation outcome
+        seconds: Evaluation time
+    """
+    ABAC_EVALUATIONS.labels(
+        permission=permission, outcome="allow" if allowed else "deny"
+    ).inc()
+    ABAC_EVALUATION_DURATION.labels(permission=permission).observe(seconds)
+
+
+def record_abac_failure(permission: str, reason: str) -> None:
+    """
+    Record an ABAC policy evaluation that failed closed.
+
+    Args:
+        permission: Permission name
+        reason: "error" or "budget"
+    """
+    ABAC_EVALUATION_FAILURES.labels(permission=permission, reason=reason).inc()
@@ -0,0 +1,48 @@
+"""SQL statement fingerprinting."""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|\?|:\w+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|JOIN)\s+\"?([\w.]+)\"?", re.IGNORECASE)
+
+
+class Fingerprint(NamedTuple):
+    """Normalized shape of a SQL statement."""
+
+    id: str
+    operation: str
+    table: str
+    normalized: str
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> Fingerprint:
+    """
+    Reduce a SQL statement to its shape.
+
+    Bind placeholders are replaced by ``?`` and placeholder lists of any
+    length collapse to ``(...)``, so ``IN`` clauses with different numbers of
+    values share one fingerprint.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        Fingerprint with a short stable id, the operation and the first table
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    operation = normalized.split(" ", 1)[0].upper() if normalized else ""
+    table_match = _TABLE.search(normalized)
+    return Fingerprint(
+        id=hashlib.sha1(normalized.encode()).hexdigest()[:12],
+        operation=operation,
+        table=table_match.group(1) if table_match else "",
+        normalized=normalized,
+    )
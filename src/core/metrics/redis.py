@@ -0,0 +1,68 @@
+"""Redis instrumentation."""
+
+import time
+from typing import Any, List
+
+from redis.asyncio.client import Pipeline, Redis
+
+from src.core.metrics.collectors import REDIS_COMMAND_DURATION
+from src.core.tracing import tracer
+
+
+class InstrumentedPipeline(Pipeline):
+    """Pipeline recording the latency of each round trip."""
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        start = time.perf_counter()
+        span = tracer.start(
+            "redis PIPELINE",
+            {"db.system": "redis", "db.redis.commands": len(self.command_stack)},
+            kind="client",
+            allow_root=False,
+        )
+        error = None
+        try:
+            return await super().execute(raise_on_error)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            tracer.end(span, error)
+            REDIS_COMMAND_DURATION.labels(command="PIPELINE").observe(
+                time.perf_counter() - start
+            )
+
+
+class InstrumentedRedis(Redis):
+    """
+    Redis client recording command latency and client spans.
+
+    Create it with ``InstrumentedRedis.from_url`` in place of
+    ``aioredis.from_url``.
+    """
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        command = str(args[0]).upper()
+        start = time.perf_counter()
+        span = tracer.start(
+            f"redis {command}",
+            {"db.system": "redis", "db.operation": command},
+            kind="client",
+            allow_root=False,
+        )
+        error = None
+        try:
+            return await super().execute_command(*args, **options)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            tracer.end(span, error)
+            REDIS_COMMAND_DURATION.labels(command=command).observe(
+                time.perf_counter() - start
+            )
+
+    def pipeline(self, transaction: bool = True, shard_hint: Any = None) -> Pipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
@@ -1,9 +1,21 @@
 """Middleware package."""
 
+from src.core.config import settings
 from src.core.middleware.cors import setup_cors_middleware
 from src.core.middleware.logging import LoggingMiddleware
+from src.core.middleware.metrics import MetricsMiddleware
+from src.core.middleware.query_profiler import QueryProfilerMiddleware
+from src.core.middleware.replica import ReplicaRoutingMiddleware
+from src.core.middleware.tracing import TracingMiddleware
 
-__all__ = ["setup_middleware", "LoggingMiddleware"]
+__all__ = [
+    "setup_middleware",
+    "LoggingMiddleware",
+    "MetricsMiddleware",
+    "QueryProfilerMiddleware",
+    "ReplicaRoutingMiddleware",
+    "TracingMiddleware",
+]
 
 
 def setup_middleware(app):
@@ -11,5 +23,24 @@ def setup_middleware(app):
     # Setup CORS middleware
     setup_cors_middleware(app)
 
-    # Setup logging middleware
-    app.add_middleware(LoggingMiddleware)
+    # Setup metrics middleware
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    # Setup read replica routing middleware
+    if settings.DATABASE_REPLICA_URLS:
+        app.add_middleware(ReplicaRoutingMiddleware)
+
+    # Setup query profiler middleware
+    if settings.SQL_PROFILER_ENABLED:
+        from src.core.db.session import engine
+
+        app.add_middleware(QueryProfilerMiddleware, engine=engine)
+
+    # Setup access logging middleware
+    if settings.ACCESS_LOG_ENABLED:
+        app.add_middleware(LoggingMiddleware)
+
+    # Setup tracing middleware outermost so every log record gets a trace id
+    if settings.TRACING_ENABLED:
+        app.add_middleware(TracingMiddleware)
@@ -1,54 +1,127 @@
 """Logging middleware."""
 
-from typing import Callable
+import json
+import random
+import time
+import uuid
+from typing import Any, Dict, Optional
 
-from fastapi import Request, Response
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.core.config import settings
+from src.core.log.context import request_id_var
+from src.core.tracing import current_span_var
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging requests and responses."""
+# Records bound with this flag are routed to the access log sink only
+access_logger = logger.bind(access_log=True)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    """Read a request header from the raw ASGI scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware writing one structured access record per request.
+
+    Unlike ``BaseHTTPMiddleware`` it neither spawns a task nor copies the
+    response stream; it only observes the messages passing through ``send``.
+    Successful requests are sampled with ``ACCESS_LOG_SAMPLE_RATE`` while
+    4xx and 5xx responses are always recorded.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: Optional[float] = None):
         """
-        Process request and log details.
+        Initialize middleware.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware or endpoint
-
-        Returns:
-            Response
+            app: ASGI application
+            sample_rate: Fraction of successful requests to log
         """
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
+        self.app = app
+        self.sample_rate = (
+            settings.ACCESS_LOG_SAMPLE_RATE if sample_rate is None else sample_rate
         )
 
-        # Process request
-        response = await call_next(request)
-
-        # Log response
-        if response.status_code >= 400:
-            # Log 4xx and 5xx responses as errors
-            logger.error(
-                f"Error {response.status_code}: {request.method} {request.url.path}"
-            )
-        else:
-            # Log successful responses as info
-            logger.info(
-                f"Response: {response.status_code} for {request.method} {request.url.path}"
-            )
-
-        # Add rate limit headers if available
-        if hasattr(request.state, "rate_limit_info"):
-            rate_limit_info = request.state.rate_limit_info
-            response.headers["X-RateLimit-Limit"] = str(rate_limit_info["limit"])
-            response.headers["X-RateLimit-Remaining"] = str(
-                rate_limit_info["remaining"]
-            )
-            response.headers["X-RateLimit-Reset"] = str(rate_limit_info["reset"])
-
-        return response
\ No newline at end of file
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and log details.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Shared with request.state, which dependencies write into
+        state: Dict[str, Any] = scope.setdefault("state", {})
+        request_id = _header(scope, b"x-request-id") or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        start = time.perf_counter()
+        status_code = 500
+        bytes_sent = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, bytes_sent
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                # Add rate limit headers if available
+                rate_limit_info = state.get("rate_limit_info")
+                if rate_limit_info:
+                    headers["X-RateLimit-Limit"] = str(rate_limit_info["limit"])
+                    headers["X-RateLimit-Remaining"] = str(
+                        rate_limit_info["remaining"]
+                    )
+                    headers["X-RateLimit-Reset"] = str(rate_limit_info["reset"])
+            elif message["type"] == "http.response.body":
+                bytes_sent += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if status_code >= 400 or random.random() < self.sample_rate:
+                self._log(scope, state, request_id, status_code, bytes_sent, start)
+            request_id_var.reset(token)
+
+    def _log(
+        self,
+        scope: Scope,
+        state: Dict[str, Any],
+        request_id: str,
+        status_code: int,
+        bytes_sent: int,
+        start: float,
+    ) -> None:
+        """Emit the access record."""
+        route = scope.get("route")
+        client = scope.get("client")
+        span = current_span_var.get()
+        record = {
+            "ts": time.time(),
+            "request_id": request_id,
+            "trace_id": span.trace_id if span else None,
+            "method": scope["method"],
+            "route": getattr(route, "path", None),
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            "bytes": bytes_sent,
+            "client": client[0] if client else None,
+            "user_id": state.get("user_id"),
+            "rate_limit": state.get("rate_limit_info"),
+        }
+        level = "ERROR" if status_code >= 500 else "INFO"
+        access_logger.log(level, json.dumps(record, separators=(",", ":")))
@@ -0,0 +1,102 @@
+"""Query profiling middleware."""
+
+from typing import Optional, Set
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.db.profiler import (
+    QueryBudgetExceeded,
+    QueryProfile,
+    explain,
+    get_query_budget,
+    profile_queries,
+)
+
+
+class QueryProfilerMiddleware:
+    """
+    Pure ASGI middleware reporting the SQL each request runs.
+
+    Meant for development and CI. Per request it flags statement shapes
+    repeated ``SQL_N_PLUS_ONE_THRESHOLD`` times or more (N+1 patterns) and
+    statements slower than ``SQL_SLOW_QUERY_MS``, logs their EXPLAIN plans
+    once per shape, and checks the budget declared with ``@query_budget``.
+    In strict mode an exceeded budget raises ``QueryBudgetExceeded`` so the
+    test issuing the request fails.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        engine: Optional[AsyncEngine] = None,
+        strict: Optional[bool] = None,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application
+            engine: Engine used to run EXPLAIN, None skips plans
+            strict: Raise on exceeded budgets, defaults to SQL_PROFILER_STRICT
+        """
+        self.app = app
+        self.engine = engine
+        self.strict = settings.SQL_PROFILER_STRICT if strict is None else strict
+        self._explained: Set[str] = set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Profile the request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+            await self.app(scope, receive, send)
+        if profile.queries:
+            await self._report(scope, profile)
+
+    async def _report(self, scope: Scope, profile: QueryProfile) -> None:
+        """Log findings and enforce the endpoint's budget."""
+        route = scope.get("route")
+        label = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+        logger.debug(f"{label}: {len(profile)} queries in {profile.total_ms:.1f} ms")
+
+        flagged = {}
+        repeated = profile.repeated(settings.SQL_N_PLUS_ONE_THRESHOLD)
+        for shape_id, group in repeated.items():
+            logger.warning(
+                f"Possible N+1 in {label}: {len(group)}x {group[0].shape.normalized}"
+            )
+            flagged[shape_id] = group[0]
+        for query in profile.slow(settings.SQL_SLOW_QUERY_MS):
+            logger.warning(
+                f"Slow query in {label} ({query.duration_ms:.1f} ms): "
+                f"{query.shape.normalized}"
+            )
+            flagged.setdefault(query.shape.id, query)
+
+        if self.engine is not None and settings.SQL_EXPLAIN_ENABLED:
+            for shape_id, query in flagged.items():
+                if shape_id in self._explained:
+                    continue
+                self._explained.add(shape_id)
+                plan = await explain(self.engine, query)
+                if plan:
+                    logger.info(f"EXPLAIN {shape_id} ({label}):\n{plan}")
+
+        budget = get_query_budget(getattr(route, "endpoint", None))
+        if budget is not None and len(profile) > budget:
+            message = f"{label} ran {len(profile)} queries, budget is {budget}"
+            if self.strict:
+                raise QueryBudgetExceeded(message)
+            logger.error(message)
@@ -0,0 +1,81 @@
+"""Read replica routing middleware."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.db.replica import PRIMARY, db_route_var, primary_until, sticky_marker
+from src.core.middleware.logging import _header
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+STICKY_HEADER = "X-DB-Primary-Until"
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Pure ASGI middleware choosing the database a request reads from.
+
+    Reads go to a replica only inside ``@read_only`` service methods and
+    endpoints; all other reads use the primary. A successful write answers
+    with a short-lived ``REPLICA_STICKY_COOKIE`` cookie and
+    ``X-DB-Primary-Until`` header; while either is presented and unexpired,
+    even ``@read_only`` reads go to the primary so the client sees its own
+    writes.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+        self.cookie = settings.REPLICA_STICKY_COOKIE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Route the request's reads.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        writes = scope["method"] not in SAFE_METHODS
+        cookies = cookie_parser(_header(scope, b"cookie") or "")
+        until = max(
+            primary_until(cookies.get(self.cookie)),
+            primary_until(_header(scope, STICKY_HEADER.lower().encode())),
+        )
+        sticky = until > time.time()
+        # None leaves the choice to @read_only
+        token = db_route_var.set(PRIMARY if sticky else None)
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                writes
+                and message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                marker = sticky_marker()
+                headers = MutableHeaders(scope=message)
+                headers[STICKY_HEADER] = marker
+                headers.append(
+                    "set-cookie",
+                    f"{self.cookie}={marker}; Max-Age={settings.REPLICA_STICKY_SECONDS}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            db_route_var.reset(token)
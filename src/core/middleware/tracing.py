@@ -0,0 +1,62 @@
+"""Tracing middleware."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.middleware.logging import _header
+from src.core.tracing import parse_traceparent, tracer
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware opening the root span of each request.
+
+    An incoming W3C ``traceparent`` header makes the request part of the
+    caller's trace. Spans opened by dependencies, services, SQL statements
+    and Redis commands while handling the request become its children.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Trace the request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        parent = parse_traceparent(_header(scope, b"traceparent"))
+        with tracer.start_span(
+            f"{scope['method']} {scope['path']}",
+            {"http.method": scope["method"], "http.target": scope["path"]},
+            kind="server",
+            parent=parent,
+        ) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status = "error"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # Name the span after the route template once routing is done
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.name = f"{scope['method']} {route}"
+                    span.set_attribute("http.route", route)
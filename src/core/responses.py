@@ -0,0 +1,28 @@
+"""JSON responses."""
+
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+def trusted_json(adapter: TypeAdapter, value: Any, status_code: int = 200) -> Response:
+    """
+    Serialize service output without validating it again.
+
+    FastAPI validates whatever a handler returns against its
+    ``response_model`` before serializing it. Output already built through
+    the same schema can skip that: pydantic-core writes the JSON bytes
+    directly. Keep ``response_model`` on the route for the OpenAPI schema.
+
+    Args:
+        adapter: Adapter of the response schema
+        value: Validated output, e.g. from ``adapter.validate_python``
+        status_code: HTTP status code
+
+    Returns:
+        JSON response
+    """
+    return Response(
+        adapter.dump_json(value), status_code=status_code, media_type="application/json"
+    )
@@ -1,5 +1,6 @@
 """Security utilities."""
 
+import time
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 
@@ -7,6 +8,7 @@ from jose import jwt
 from passlib.context import CryptContext
 
 from src.core.config import settings
+from src.core.metrics import PASSWORD_HASH_DURATION
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -23,7 +25,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password is correct
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    start = time.perf_counter()
+    try:
+        return pwd_context.verify(plain_password, hashed_password)
+    finally:
+        PASSWORD_HASH_DURATION.labels(operation="verify").observe(
+            time.perf_counter() - start
+        )
 
 
 def get_password_hash(password: str) -> str:
@@ -36,7 +44,13 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    start = time.perf_counter()
+    try:
+        return pwd_context.hash(password)
+    finally:
+        PASSWORD_HASH_DURATION.labels(operation="hash").observe(
+            time.perf_counter() - start
+        )
 
 
 def create_access_token(
@@ -0,0 +1,56 @@
+"""File storage package."""
+
+from typing import Optional
+
+from src.core.config import settings
+from src.core.storage.base import (
+    StorageBackend,
+    StorageError,
+    normalize_key,
+    shard_key,
+)
+from src.core.storage.local import LocalStorage
+from src.core.storage.memory import MemoryStorage
+from src.core.storage.s3 import S3Storage
+
+__all__ = [
+    "StorageBackend",
+    "StorageError",
+    "LocalStorage",
+    "MemoryStorage",
+    "S3Storage",
+    "create_storage",
+    "normalize_key",
+    "shard_key",
+]
+
+
+def create_storage(backend: Optional[str] = None) -> StorageBackend:
+    """
+    Create the storage backend selected in settings.
+
+    Args:
+        backend: Backend name overriding ``STORAGE_BACKEND``
+
+    Returns:
+        Storage backend instance
+    """
+    backend = backend or settings.STORAGE_BACKEND
+    if backend == "local":
+        return LocalStorage(settings.UPLOAD_DIR or "uploads")
+    if backend == "memory":
+        return MemoryStorage()
+    if backend == "s3":
+        if not settings.S3_BUCKET:
+            raise StorageError("S3_BUCKET must be set for the s3 storage backend")
+        return S3Storage(
+            bucket=settings.S3_BUCKET,
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            region=settings.S3_REGION,
+            access_key_id=settings.S3_ACCESS_KEY_ID,
+            secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            prefix=settings.S3_PREFIX,
+            part_size=settings.S3_MULTIPART_PART_SIZE,
+            concurrency=settings.S3_MULTIPART_CONCURRENCY,
+        )
+    raise StorageError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,153 @@
+"""Storage backend interface."""
+
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+from typing import AsyncIterator, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class StorageError(Exception):
+    """Raised when a storage backend operation fails."""
+
+
+def normalize_key(key: str) -> str:
+    """
+    Normalize a storage key and reject keys escaping the storage root.
+
+    Args:
+        key: Slash separated object key
+
+    Returns:
+        Normalized key
+
+    Raises:
+        ValueError: If the key is empty, absolute or contains ".."
+    """
+    path = PurePosixPath(key.replace("\\", "/"))
+    if path.is_absolute() or ".." in path.parts or not path.parts:
+        raise ValueError(f"Invalid storage key: {key}")
+    return str(path)
+
+
+def shard_key(key: str, depth: int = 2, width: int = 2) -> str:
+    """
+    Spread a key over hashed-prefix subdirectories.
+
+    ``userphotos/<uuid>.jpg`` becomes ``userphotos/ab/cd/<uuid>.jpg`` so no
+    single directory grows unbounded. Only the part of the file name before
+    the first underscore is hashed, which keeps processed variants such as
+    ``<uuid>_64.webp`` in the same shard as their original.
+
+    Args:
+        key: Unsharded key of the form ``<folder>/<filename>``
+        depth: Number of shard directory levels, 0 disables sharding
+        width: Hex characters per shard directory
+
+    Returns:
+        Sharded key
+    """
+    path = PurePosixPath(normalize_key(key))
+    if depth <= 0:
+        return str(path)
+    base_id = path.stem.split("_", 1)[0]
+    digest = hashlib.sha1(base_id.encode()).hexdigest()
+    shards = [digest[i * width : (i + 1) * width] for i in range(depth)]
+    return str(path.parent.joinpath(*shards, path.name))
+
+
+async def iter_bytes(data: bytes) -> AsyncIterator[bytes]:
+    """Wrap an in-memory payload as an async chunk stream."""
+    yield data
+
+
+class StorageBackend(ABC):
+    """Base class for file storage backends."""
+
+    name: str = "base"
+
+    @abstractmethod
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ) -> int:
+        """
+        Store an object from a stream of chunks.
+
+        Args:
+            key: Object key
+            chunks: Async iterator yielding the object content
+            content_type: MIME type of the object
+
+        Returns:
+            Number of bytes written
+        """
+
+    async def save(
+        self, key: str, data: bytes, content_type: Optional[str] = None
+    ) -> int:
+        """
+        Store an object from bytes.
+
+        Args:
+            key: Object key
+            data: Object content
+            content_type: MIME type of the object
+
+        Returns:
+            Number of bytes written
+        """
+        return await self.save_stream(key, iter_bytes(data), content_type)
+
+    @abstractmethod
+    def open(
+        self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream an object.
+
+        Args:
+            key: Object key
+            chunk_size: Size of the yielded chunks
+
+        Returns:
+            Async iterator over the object content
+        """
+
+    async def read(self, key: str) -> bytes:
+        """Read a whole object into memory."""
+        return b"".join([chunk async for chunk in self.open(key)])
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check whether an object exists."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """
+        Delete an object.
+
+        Returns:
+            True if an object was deleted
+        """
+
+    async def presigned_url(self, key: str, expires_in: int = 3600) -> Optional[str]:
+        """
+        Create a time-limited download URL.
+
+        Returns:
+            URL, or None if the backend cannot serve files directly
+        """
+        return None
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """
+        Path of the object on the local filesystem.
+
+        Returns:
+            Path, or None if the backend is not filesystem based
+        """
+        return None
@@ -0,0 +1,78 @@
+"""Local filesystem storage backend."""
+
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+
+import aiofiles
+import aiofiles.os
+import aiofiles.ospath
+
+from src.core.storage.base import DEFAULT_CHUNK_SIZE, StorageBackend, normalize_key
+
+
+class LocalStorage(StorageBackend):
+    """
+    Storage backend writing objects below a local directory.
+
+    Filesystem metadata calls (stat, mkdir, rename, unlink) go through
+    ``aiofiles.os`` so they run in a worker thread instead of blocking the
+    event loop.
+    """
+
+    name = "local"
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def local_path(self, key: str) -> Path:
+        """Path of the object on the local filesystem."""
+        return self.root / normalize_key(key)
+
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ) -> int:
+        """
+        Store an object from a stream of chunks.
+
+        The content is written to a temporary file first and moved into
+        place, so readers never observe a partially written object.
+        """
+        path = self.local_path(key)
+        await aiofiles.os.makedirs(path.parent, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.part")
+        written = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    written += len(chunk)
+            await aiofiles.os.replace(tmp_path, path)
+        except BaseException:
+            if await aiofiles.ospath.exists(tmp_path):
+                await aiofiles.os.remove(tmp_path)
+            raise
+        return written
+
+    async def open(
+        self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream an object."""
+        async with aiofiles.open(self.local_path(key), "rb") as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+
+    async def exists(self, key: str) -> bool:
+        """Check whether an object exists."""
+        return await aiofiles.ospath.isfile(self.local_path(key))
+
+    async def delete(self, key: str) -> bool:
+        """Delete an object."""
+        try:
+            await aiofiles.os.remove(self.local_path(key))
+        except FileNotFoundError:
+            return False
+        return True
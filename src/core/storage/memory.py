@@ -0,0 +1,44 @@
+"""In-memory storage backend, intended for tests."""
+
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from src.core.storage.base import DEFAULT_CHUNK_SIZE, StorageBackend, normalize_key
+
+
+class MemoryStorage(StorageBackend):
+    """Storage backend keeping objects in a dictionary."""
+
+    name = "memory"
+
+    def __init__(self):
+        self.objects: Dict[str, Tuple[bytes, Optional[str]]] = {}
+
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ) -> int:
+        """Store an object from a stream of chunks."""
+        data = b"".join([chunk async for chunk in chunks])
+        self.objects[normalize_key(key)] = (data, content_type)
+        return len(data)
+
+    async def open(
+        self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream an object."""
+        key = normalize_key(key)
+        if key not in self.objects:
+            raise FileNotFoundError(key)
+        data = self.objects[key][0]
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset : offset + chunk_size]
+
+    async def exists(self, key: str) -> bool:
+        """Check whether an object exists."""
+        return normalize_key(key) in self.objects
+
+    async def delete(self, key: str) -> bool:
+        """Delete an object."""
+        return self.objects.pop(normalize_key(key), None) is not None
@@ -0,0 +1,218 @@
+"""S3-compatible object storage backend."""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.core.storage.base import (
+    DEFAULT_CHUNK_SIZE,
+    StorageBackend,
+    StorageError,
+    normalize_key,
+)
+
+# S3 rejects multipart parts below 5 MiB (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3Storage(StorageBackend):
+    """
+    Storage backend for S3 and S3-compatible object stores (MinIO, moto).
+
+    boto3 is blocking, so every call runs in the default thread pool.
+    Uploads larger than one part use multipart uploads whose parts are
+    sent concurrently.
+    """
+
+    name = "s3"
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        prefix: str = "",
+        part_size: int = 8 * 1024 * 1024,
+        concurrency: int = 4,
+        client: Any = None,
+    ):
+        """
+        Initialize S3 storage.
+
+        Args:
+            bucket: Bucket name
+            endpoint_url: Custom endpoint for S3-compatible stores
+            region: Bucket region
+            access_key_id: Access key, defaults to the boto3 credential chain
+            secret_access_key: Secret key, defaults to the boto3 credential chain
+            prefix: Key prefix applied to every object
+            part_size: Multipart part size in bytes
+            concurrency: Maximum number of parts uploaded in parallel
+            client: Preconfigured boto3 S3 client
+        """
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise StorageError(
+                    "The s3 storage backend requires boto3 (poetry install -E s3)"
+                ) from e
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url,
+                region_name=region,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+            )
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.concurrency = max(1, concurrency)
+
+    def _key(self, key: str) -> str:
+        key = normalize_key(key)
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    async def _call(self, method: str, **kwargs) -> Any:
+        return await asyncio.to_thread(getattr(self.client, method), **kwargs)
+
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ) -> int:
+        """
+        Store an object from a stream of chunks.
+
+        Small objects are written with a single PUT; anything larger than one
+        part becomes a multipart upload with up to ``concurrency`` parts in
+        flight.
+        """
+        object_key = self._key(key)
+        extra: Dict[str, str] = {"ContentType": content_type} if content_type else {}
+
+        buffer = bytearray()
+        stream = chunks.__aiter__()
+        # Fill the first part before deciding between PUT and multipart
+        async for chunk in stream:
+            buffer.extend(chunk)
+            if len(buffer) >= self.part_size:
+                break
+        else:
+            await self._call(
+                "put_object",
+                Bucket=self.bucket,
+                Key=object_key,
+                Body=bytes(buffer),
+                **extra,
+            )
+            return len(buffer)
+
+        upload = await self._call(
+            "create_multipart_upload", Bucket=self.bucket, Key=object_key, **extra
+        )
+        upload_id = upload["UploadId"]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: List[asyncio.Task] = []
+        total = 0
+
+        async def upload_part(number: int, body: bytes) -> Dict[str, Any]:
+            try:
+                response = await self._call(
+                    "upload_part",
+                    Bucket=self.bucket,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=body,
+                )
+            finally:
+                semaphore.release()
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        async def flush(body: bytes) -> None:
+            # Bound the parts held in memory, not just the requests in flight
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(upload_part(len(tasks) + 1, body)))
+
+        try:
+            while len(buffer) >= self.part_size:
+                await flush(bytes(buffer[: self.part_size]))
+                total += self.part_size
+                del buffer[: self.part_size]
+            async for chunk in stream:
+                buffer.extend(chunk)
+                while len(buffer) >= self.part_size:
+                    await flush(bytes(buffer[: self.part_size]))
+                    total += self.part_size
+                    del buffer[: self.part_size]
+            if buffer:
+                await flush(bytes(buffer))
+                total += len(buffer)
+
+            parts = await asyncio.gather(*tasks)
+            await self._call(
+                "complete_multipart_upload",
+                Bucket=self.bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._call(
+                "abort_multipart_upload",
+                Bucket=self.bucket,
+                Key=object_key,
+                UploadId=upload_id,
+            )
+            raise
+        return total
+
+    async def open(
+        self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream an object."""
+        try:
+            response = await self._call(
+                "get_object", Bucket=self.bucket, Key=self._key(key)
+            )
+        except self.client.exceptions.NoSuchKey as e:
+            raise FileNotFoundError(key) from e
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def exists(self, key: str) -> bool:
+        """Check whether an object exists."""
+        try:
+            await self._call("head_object", Bucket=self.bucket, Key=self._key(key))
+        except self.client.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete an object."""
+        if not await self.exists(key):
+            return False
+        await self._call("delete_object", Bucket=self.bucket, Key=self._key(key))
+        return True
+
+    async def presigned_url(self, key: str, expires_in: int = 3600) -> Optional[str]:
+        """Create a time-limited download URL."""
+        return await self._call(
+            "generate_presigned_url",
+            ClientMethod="get_object",
+            Params={"Bucket": self.bucket, "Key": self._key(key)},
+            ExpiresIn=expires_in,
+        )
@@ -0,0 +1,53 @@
+"""Tracing package."""
+
+from src.core.config import settings
+from src.core.tracing.exporters import (
+    InMemorySpanExporter,
+    OTLPSpanExporter,
+    SpanExporter,
+    encode_spans,
+)
+from src.core.tracing.tracer import (
+    Span,
+    SpanContext,
+    Tracer,
+    current_span_var,
+    format_traceparent,
+    parse_traceparent,
+    trace_service,
+    traced,
+    tracer,
+)
+
+__all__ = [
+    "InMemorySpanExporter",
+    "OTLPSpanExporter",
+    "Span",
+    "SpanContext",
+    "SpanExporter",
+    "Tracer",
+    "current_span_var",
+    "encode_spans",
+    "format_traceparent",
+    "parse_traceparent",
+    "setup_tracing",
+    "trace_service",
+    "traced",
+    "tracer",
+]
+
+
+def setup_tracing() -> None:
+    """Configure the global tracer from settings."""
+    tracer.sample_rate = settings.TRACING_SAMPLE_RATE
+    if not settings.TRACING_ENABLED:
+        tracer.set_exporter(None)
+    elif settings.TRACING_EXPORTER == "otlp":
+        tracer.set_exporter(
+            OTLPSpanExporter(
+                settings.OTLP_ENDPOINT,
+                service_name=settings.TRACING_SERVICE_NAME or settings.PROJECT_NAME,
+            )
+        )
+    else:
+        tracer.set_exporter(InMemorySpanExporter())
@@ -0,0 +1,211 @@
+"""Span exporters."""
+
+import json
+import queue
+import threading
+import urllib.request
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from src.core.tracing.tracer import Span
+
+_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3, "producer": 4, "consumer": 5}
+_STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+
+class SpanExporter:
+    """Destination for finished spans."""
+
+    def export(self, span: "Span") -> None:
+        """
+        Accept a finished span.
+
+        Called on the request path, so implementations must not block.
+
+        Args:
+            span: Finished span
+        """
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush pending spans and release resources."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a bounded buffer, for tests and debugging."""
+
+    def __init__(self, max_spans: int = 10000):
+        """
+        Initialize exporter.
+
+        Args:
+            max_spans: Number of spans kept before the oldest are dropped
+        """
+        self._spans: Deque["Span"] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: "Span") -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List["Span"]:
+        """Finished spans, oldest first."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop all collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Encode an attribute as an OTLP ``KeyValue``."""
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def encode_spans(spans: List["Span"], service_name: str) -> Dict[str, Any]:
+    """
+    Build an OTLP/JSON ``ExportTraceServiceRequest``.
+
+    Args:
+        spans: Finished spans
+        service_name: Value of the ``service.name`` resource attribute
+
+    Returns:
+        Request body
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", service_name)]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "src.core.tracing"},
+                        "spans": [
+                            {
+                                "traceId": span.trace_id,
+                                "spanId": span.span_id,
+                                "parentSpanId": span.parent_id or "",
+                                "name": span.name,
+                                "kind": _SPAN_KINDS.get(span.kind, 1),
+                                "startTimeUnixNano": str(span.start_time_ns),
+                                "endTimeUnixNano": str(span.end_time_ns),
+                                "attributes": [
+                                    _attribute(key, value)
+                                    for key, value in span.attributes.items()
+                                    if value is not None
+                                ],
+                                "status": {
+                                    "code": _STATUS_CODES[span.status],
+                                    "message": span.status_message or "",
+                                },
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class OTLPSpanExporter(SpanExporter):
+    """
+    Sends spans to an OTLP/HTTP collector in JSON encoding.
+
+    Spans are queued and posted in batches from a background thread, so
+    ``export`` never waits on the network. When the queue is full new spans
+    are dropped rather than slowing requests down.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        headers: Optional[Dict[str, str]] = None,
+        batch_size: int = 512,
+        flush_interval: float = 5.0,
+        max_queue_size: int = 8192,
+        timeout: float = 10.0,
+    ):
+        """
+        Initialize exporter.
+
+        Args:
+            endpoint: Collector base URL, e.g. ``http://localhost:4318``
+            service_name: Value of the ``service.name`` resource attribute
+            headers: Extra HTTP headers, e.g. for authentication
+            batch_size: Maximum spans per request
+            flush_interval: Seconds between flushes of a partial batch
+            max_queue_size: Spans buffered before new ones are dropped
+            timeout: HTTP timeout in seconds
+        """
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(max_queue_size)
+        self._dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="otlp-span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: "Span") -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self._dropped += 1
+
+    def shutdown(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(self.timeout)
+
+    def _run(self) -> None:
+        """Collect batches and post them until shut down."""
+        batch: List["Span"] = []
+        while True:
+            try:
+                span = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                span = False  # type: ignore[assignment]
+            if span:
+                batch.append(span)
+                if len(batch) < self.batch_size:
+                    continue
+            if batch:
+                self._post(batch)
+                batch = []
+            if span is None:
+                return
+
+    def _post(self, batch: List["Span"]) -> None:
+        """Send one batch, logging instead of raising on failure."""
+        body = json.dumps(encode_spans(batch, self.service_name)).encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers=self.headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except Exception as e:
+            logger.warning(f"Failed to export {len(batch)} spans: {e}")
+        if self._dropped:
+            logger.warning(f"Dropped {self._dropped} spans, export queue full")
+            self._dropped = 0
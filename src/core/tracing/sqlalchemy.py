@@ -0,0 +1,55 @@
+"""SQLAlchemy tracing."""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.metrics.fingerprint import fingerprint
+from src.core.tracing.tracer import tracer
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not tracer.enabled:
+        return
+    shape = fingerprint(statement)
+    span = tracer.start(
+        f"{shape.operation} {shape.table}".strip(),
+        {
+            "db.system": conn.dialect.name,
+            # Normalized text only, bind values never reach the exporter
+            "db.statement": shape.normalized,
+            "db.operation": shape.operation,
+            "db.sql.table": shape.table,
+            "db.fingerprint": shape.id,
+        },
+        kind="client",
+        allow_root=False,
+    )
+    conn.info.setdefault("trace_spans", []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get("trace_spans")
+    if spans:
+        span = spans.pop()
+        if span is not None and cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        tracer.end(span)
+
+
+def _handle_error(context):
+    # after_cursor_execute is skipped for failed statements
+    spans = context.connection.info.get("trace_spans") if context.connection else None
+    if spans:
+        tracer.end(spans.pop(), context.original_exception)
+
+
+def trace_engine(engine: Engine) -> None:
+    """
+    Open a client span around every statement sent by an engine.
+
+    Args:
+        engine: Sync engine, i.e. ``AsyncEngine.sync_engine``
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,347 @@
+"""Lightweight span tracer."""
+
+import functools
+import inspect
+import random
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, TypeVar, Union
+
+from src.core.tracing.exporters import SpanExporter
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class SpanContext(NamedTuple):
+    """Identifiers linking a span to its trace."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name",
+        "context",
+        "parent_id",
+        "kind",
+        "start_time_ns",
+        "end_time_ns",
+        "attributes",
+        "status",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        context: SpanContext,
+        parent_id: Optional[str] = None,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.status = "unset"
+        self.status_message: Optional[str] = None
+
+    @property
+    def trace_id(self) -> str:
+        """Trace the span belongs to."""
+        return self.context.trace_id
+
+    @property
+    def span_id(self) -> str:
+        """Identifier of the span."""
+        return self.context.span_id
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Elapsed time in milliseconds, None while the span is open."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Mark the span as failed by an exception."""
+        self.status = "error"
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def __repr__(self) -> str:
+        return f"<Span {self.name} {self.trace_id}/{self.span_id}>"
+
+
+# Span active in the current task, parent of any span started from it
+current_span_var: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """
+    Parse a W3C ``traceparent`` header.
+
+    Args:
+        value: Header value, e.g. ``00-<trace id>-<span id>-01``
+
+    Returns:
+        Remote span context, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return SpanContext(parts[1], parts[2], bool(flags & 1))
+
+
+def format_traceparent(context: SpanContext) -> str:
+    """Render a span context as a W3C ``traceparent`` header."""
+    flags = "01" if context.sampled else "00"
+    return f"00-{context.trace_id}-{context.span_id}-{flags}"
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to an exporter.
+
+    Without an exporter the tracer is disabled and every helper returns
+    before allocating anything, so instrumentation can stay in place in
+    production code paths.
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_rate: float = 1.0,
+    ):
+        """
+        Initialize tracer.
+
+        Args:
+            exporter: Destination of finished spans, None disables tracing
+            sample_rate: Fraction of new traces that are recorded
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are being recorded."""
+        return self.exporter is not None
+
+    def set_exporter(self, exporter: Optional[SpanExporter]) -> None:
+        """
+        Replace the exporter, shutting the previous one down.
+
+        Args:
+            exporter: New exporter, None disables tracing
+        """
+        if self.exporter is not None and self.exporter is not exporter:
+            self.exporter.shutdown()
+        self.exporter = exporter
+
+    def start(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "internal",
+        parent: Union[Span, SpanContext, None] = None,
+        allow_root: bool = True,
+    ) -> Optional[Span]:
+        """
+        Open a span without making it current.
+
+        Args:
+            name: Operation name
+            attributes: Initial attributes
+            kind: "server", "client", "producer", "consumer" or "internal"
+            parent: Parent span or remote context, defaults to the current span
+            allow_root: Whether the span may start a new trace; client spans
+                outside any request (e.g. background polling) are skipped
+
+        Returns:
+            Open span, or None when tracing is disabled or there is no parent
+            and ``allow_root`` is False
+        """
+        if not self.enabled:
+            return None
+        if parent is None:
+            parent = current_span_var.get()
+            if parent is None and not allow_root:
+                return None
+        if isinstance(parent, Span):
+            parent = parent.context
+
+        span_id = secrets.token_hex(8)
+        if parent is None:
+            sampled = random.random() < self.sample_rate
+            context = SpanContext(secrets.token_hex(16), span_id, sampled)
+            parent_id = None
+        else:
+            context = SpanContext(parent.trace_id, span_id, parent.sampled)
+            parent_id = parent.span_id
+        return Span(name, context, parent_id, kind, attributes)
+
+    def end(self, span: Optional[Span], exc: Optional[BaseException] = None) -> None:
+        """
+        Close a span and export it if its trace is sampled.
+
+        Args:
+            span: Span returned by ``start``
+            exc: Exception that ended the operation, if any
+        """
+        if span is None:
+            return
+        span.end_time_ns = time.time_ns()
+        if exc is not None:
+            span.record_exception(exc)
+        if span.context.sampled and self.exporter is not None:
+            self.exporter.export(span)
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "internal",
+        parent: Union[Span, SpanContext, None] = None,
+    ) -> Iterator[Optional[Span]]:
+        """
+        Open a span and make it current for the enclosed block.
+
+        Args:
+            name: Operation name
+            attributes: Initial attributes
+            kind: "server", "client", "producer", "consumer" or "internal"
+            parent: Parent span or remote context, defaults to the current span
+
+        Yields:
+            Open span, or None when tracing is disabled
+        """
+        span = self.start(name, attributes, kind, parent)
+        if span is None:
+            yield None
+            return
+        token = current_span_var.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            self.end(span, exc)
+            raise
+        else:
+            self.end(span)
+        finally:
+            current_span_var.reset(token)
+
+    def shutdown(self) -> None:
+        """Flush and close the exporter."""
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def traced(
+    name: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None
+) -> Callable[[F], F]:
+    """
+    Wrap a function in a span.
+
+    The wrapper keeps the original signature, so it can decorate FastAPI
+    dependencies.
+
+    Args:
+        name: Span name, defaults to the function's qualified name
+        attributes: Attributes set on every span
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with tracer.start_span(span_name, dict(attributes or {})):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.start_span(span_name, dict(attributes or {})):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _traced_method(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a service method in a span named after the concrete class."""
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return await func(self, *args, **kwargs)
+            with tracer.start_span(f"{type(self).__name__}.{func.__name__}"):
+                return await func(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not tracer.enabled:
+            return func(self, *args, **kwargs)
+        with tracer.start_span(f"{type(self).__name__}.{func.__name__}"):
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def trace_service(cls: type) -> type:
+    """
+    Class decorator wrapping every public method of a service in a span.
+
+    Args:
+        cls: Service class
+
+    Returns:
+        The same class with its public methods traced
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, _traced_method(value))
+    return cls
+
+
+# Global instance, configured from settings by setup_tracing
+tracer = Tracer()
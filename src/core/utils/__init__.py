@@ -1,9 +1,15 @@
 from src.core.utils.rate_limit import create_rate_limiter
 from src.core.utils.file_utils import FileUploadService, file_upload_service
 from src.core.utils.enum_helper import get_enum_key_from_value
+from src.core.utils.image_processing import (
+    ImageProcessingService,
+    image_processing_service,
+)
 __all__ = [
     "create_rate_limiter",
     "FileUploadService",
     "file_upload_service",
     "get_enum_key_from_value",  
+    "ImageProcessingService",
+    "image_processing_service",
 ]
@@ -1,20 +1,23 @@
 import uuid
 from pathlib import Path
+from typing import AsyncIterator, Optional
 from fastapi import UploadFile, HTTPException
-import aiofiles
 from src.core.config import settings
+from src.core.storage import StorageBackend, create_storage, shard_key
 import logging
 
 logger = logging.getLogger(__name__)
 DEFAULT_UPLOAD_DIR = Path(settings.UPLOAD_DIR or "uploads")
 DEFAULT_MAX_SIZE = settings.MAX_FILE_SIZE or 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class FileUploadService:
     """Service for handling file uploads."""
 
-    def __init__(self):
+    def __init__(self, storage: Optional[StorageBackend] = None):
         self.upload_dir = DEFAULT_UPLOAD_DIR
+        self.storage = storage or create_storage()
         self.max_file_size = settings.MAX_FILE_SIZE
         self.allowed_extensions = {
             "image": {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"},
@@ -23,12 +26,6 @@ class FileUploadService:
             "audio": {".mp3", ".wav", ".flac", ".aac", ".ogg"},
         }
 
-        # Create upload directory if it doesn't exist
-        self.upload_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create subdirectories for different services
-        (self.upload_dir / "files").mkdir(exist_ok=True)
-
     def _validate_file(self, file: UploadFile) -> bool:
         """Validate file type and size."""
         if not file.filename:
@@ -61,6 +58,43 @@ class FileUploadService:
         unique_id = str(uuid.uuid4())
         return f"{unique_id}{file_ext}"
 
+    def _build_key(self, subfolder: str, filename: str) -> str:
+        """Build the hashed-prefix storage key for a new file."""
+        return shard_key(
+            f"{subfolder}/{filename}",
+            depth=settings.UPLOAD_SHARD_DEPTH,
+            width=settings.UPLOAD_SHARD_WIDTH,
+        )
+
+    async def resolve_key(self, file_path: str) -> Optional[str]:
+        """
+        Find the stored key for a file path.
+
+        Paths handed out before sharding (``<folder>/<filename>``) are
+        looked up in their shard as well, so old URLs keep working after
+        the upload tree has been resharded.
+        """
+        if await self.storage.exists(file_path):
+            return file_path
+        if settings.UPLOAD_SHARD_DEPTH > 0 and file_path.count("/") == 1:
+            folder, filename = file_path.split("/")
+            sharded = self._build_key(folder, filename)
+            if await self.storage.exists(sharded):
+                return sharded
+        return None
+
+    async def _read_chunks(self, file: UploadFile) -> AsyncIterator[bytes]:
+        """Stream the upload, enforcing the size limit as bytes arrive."""
+        received = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_file_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size: {self.max_file_size/1024/1024:.1f}MB",
+                )
+            yield chunk
+
     async def save_file(self, file: UploadFile, subfolder: str = "files") -> dict:
         """Save uploaded file and return file info."""
         try:
@@ -70,31 +104,28 @@ class FileUploadService:
             # Generate unique filename
             unique_filename = self._generate_unique_filename(file.filename)
 
-            # Create file path
-            file_path = self.upload_dir / subfolder / unique_filename
+            # Create sharded storage key
+            file_key = self._build_key(subfolder, unique_filename)
 
-            # Ensure subfolder exists
-            (self.upload_dir / subfolder).mkdir(parents=True, exist_ok=True)
-
-            # Save file
-            async with aiofiles.open(file_path, "wb") as f:
-                content = await file.read()
-                await f.write(content)
-
-            # Get file size
-            file_size = len(content)
+            # Stream file to storage
+            file_size = await self.storage.save_stream(
+                file_key, self._read_chunks(file), content_type=file.content_type
+            )
 
-            logger.info(f"File saved: {file_path}")
+            logger.info(f"File saved: {file_key} ({self.storage.name})")
 
+            local_path = self.storage.local_path(file_key)
             return {
                 "original_filename": file.filename,
                 "saved_filename": unique_filename,
-                "file_path": str(file_path.relative_to(self.upload_dir)),
+                "file_path": file_key,
                 "file_size": file_size,
                 "mimetype": file.content_type,
-                "full_path": str(file_path),
+                "full_path": str(local_path) if local_path else file_key,
             }
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error saving file: {e}")
             raise HTTPException(status_code=500, detail="Failed to save file")
@@ -102,10 +133,9 @@ class FileUploadService:
     async def delete_file(self, file_path: str) -> bool:
         """Delete file from storage."""
         try:
-            full_path = self.upload_dir / file_path
-            if full_path.exists():
-                full_path.unlink()
-                logger.info(f"File deleted: {full_path}")
+            file_key = await self.resolve_key(file_path)
+            if file_key and await self.storage.delete(file_key):
+                logger.info(f"File deleted: {file_path}")
                 return True
             return False
         except Exception as e:
@@ -114,7 +144,7 @@ class FileUploadService:
 
     def get_file_url(self, file_path: str) -> str:
         """Generate URL for file access."""
-        return f"/api/v1/files{file_path}"
+        return f"{settings.API_V1_STR}/file/files/{file_path}"
 
 
 # Global instance
@@ -0,0 +1,192 @@
+"""Background image processing for uploaded photos."""
+
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import PurePosixPath
+from typing import Dict, Optional, Sequence
+
+from loguru import logger
+
+from src.core.config import settings
+from src.core.jobs import job_runner
+from src.core.storage import StorageBackend
+from src.core.utils.file_utils import file_upload_service
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
+VARIANT_FORMAT = "webp"
+PROCESS_JOB = "image.process"
+
+# Formats Pillow re-encodes losslessly enough to replace the stored original
+REENCODABLE_FORMATS = {"JPEG", "PNG", "WEBP", "BMP"}
+
+
+def variant_path(file_path: str, size: Optional[int] = None) -> str:
+    """
+    Build the storage path of a processed variant.
+
+    Args:
+        file_path: Storage key of the original file
+        size: Thumbnail edge length, or None for the full-size WebP variant
+
+    Returns:
+        Storage key of the variant
+    """
+    path = PurePosixPath(file_path)
+    # Suffixed even at full size, so a .webp original is never overwritten
+    suffix = f"_{size}" if size else "_full"
+    return str(path.with_name(f"{path.stem}{suffix}.{VARIANT_FORMAT}"))
+
+
+def process_image(data: bytes, sizes: Sequence[int], quality: int) -> Dict[str, bytes]:
+    """
+    Strip metadata and render thumbnail and WebP variants of an image.
+
+    Runs inside a worker process, so it only deals in bytes.
+
+    Args:
+        data: Raw bytes of the uploaded image
+        sizes: Thumbnail edge lengths to generate
+        quality: WebP encoder quality
+
+    Returns:
+        Mapping of variant name ("original", "webp" or the size) to encoded bytes
+    """
+    from PIL import Image, ImageOps
+
+    variants: Dict[str, bytes] = {}
+    with Image.open(io.BytesIO(data)) as source:
+        source_format = source.format
+        # Bake the EXIF orientation into the pixels before the metadata goes away
+        image = ImageOps.exif_transpose(source)
+
+        # Pillow only writes EXIF/ICC/text chunks when asked to, so a plain
+        # re-encode is enough to strip them from the stored original.
+        if source_format in REENCODABLE_FORMATS:
+            buffer = io.BytesIO()
+            original = image
+            options = {"optimize": True}
+            if source_format == "JPEG":
+                options["quality"] = 95
+                if original.mode not in ("RGB", "L"):
+                    original = original.convert("RGB")
+            original.save(buffer, format=source_format, **options)
+            variants["original"] = buffer.getvalue()
+
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=VARIANT_FORMAT, quality=quality, method=4)
+        variants["webp"] = buffer.getvalue()
+
+        for size in sizes:
+            thumbnail = image.copy()
+            thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            thumbnail.save(buffer, format=VARIANT_FORMAT, quality=quality, method=4)
+            variants[str(size)] = buffer.getvalue()
+
+    return variants
+
+
+class ImageProcessingService:
+    """Post-upload pipeline generating thumbnails and WebP variants."""
+
+    def __init__(self, storage: Optional[StorageBackend] = None):
+        self.storage = storage or file_upload_service.storage
+        self.enabled = settings.IMAGE_PROCESSING_ENABLED
+        self.sizes = sorted(set(settings.IMAGE_THUMBNAIL_SIZES))
+        self.quality = settings.IMAGE_WEBP_QUALITY
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the encoder process pool has been started."""
+        return self._pool is not None
+
+    async def start(self) -> None:
+        """Start the encoder process pool; jobs are queued on the job runner."""
+        if not self.enabled or self.running:
+            return
+        workers = max(1, settings.IMAGE_PROCESSING_WORKERS)
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+        logger.info(f"Image processing started ({workers} encoder processes)")
+
+    async def stop(self) -> None:
+        """Shut the process pool down."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        logger.info("Image processing stopped")
+
+    def is_image(self, file_path: str) -> bool:
+        """Check whether a stored file should go through the pipeline."""
+        return PurePosixPath(file_path).suffix.lower() in IMAGE_EXTENSIONS
+
+    async def enqueue(self, file_path: str) -> bool:
+        """
+        Schedule processing of an uploaded image.
+
+        Args:
+            file_path: Storage key of the original file
+
+        Returns:
+            True if the job was queued
+        """
+        if not self.running or not self.is_image(file_path):
+            return False
+        return await job_runner.enqueue(PROCESS_JOB, file_path)
+
+    async def process(self, file_path: str) -> None:
+        """
+        Generate the variants of a stored image.
+
+        Args:
+            file_path: Storage key of the original file
+        """
+        data = await self.storage.read(file_path)
+
+        loop = asyncio.get_running_loop()
+        variants = await loop.run_in_executor(
+            self._pool, process_image, data, self.sizes, self.quality
+        )
+
+        for name, content in variants.items():
+            if name == "original":
+                await self.storage.save(file_path, content)
+                continue
+            size = None if name == "webp" else int(name)
+            await self.storage.save(
+                variant_path(file_path, size), content, content_type="image/webp"
+            )
+
+        logger.info(f"Image processed: {file_path} ({len(variants)} variants)")
+
+    def resolve_size(self, size: int) -> Optional[int]:
+        """
+        Pick the precomputed thumbnail size serving a requested size.
+
+        Args:
+            size: Requested edge length
+
+        Returns:
+            Smallest configured size not below the request, else the largest,
+            or None when no thumbnail sizes are configured
+        """
+        if not self.sizes:
+            return None
+        for candidate in self.sizes:
+            if candidate >= size:
+                return candidate
+        return self.sizes[-1]
+
+
+# Global instance
+image_processing_service = ImageProcessingService()
+
+
+@job_runner.register(PROCESS_JOB)
+async def process_image_job(file_path: str) -> None:
+    """Job running the image pipeline on an uploaded file."""
+    await image_processing_service.process(file_path)
@@ -0,0 +1,107 @@
+"""Test compiled ABAC expression evaluation."""
+import pytest
+
+from src.app.api.abac.engine import ABACEngine
+
+
+class CountingDict(dict):
+    """Dict recording the keys read."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = []
+
+    def get(self, key, default=None):
+        self.reads.append(key)
+        return super().get(key, default)
+
+
+EXPRESSIONS = [
+    {"eq": [{"var": "actor.is_active"}, True]},
+    {"in": [{"var": "actor.roles"}, "member"]},
+    {"and": [{"startswith": [{"var": "actor.username"}, "user"]}, {"not": {"var": "target.locked"}}]},
+    {"or": [{"eq": [{"var": "target.owner"}, {"var": "actor.id"}]}, {"regexMatch": ["^user0", {"var": "actor.username"}]}]},
+    {"if": [{"gt": [{"len": {"var": "actor.roles"}}, 1]}, "many", "few"]},
+    {"if": [{"var": "target.locked"}, True]},
+    {"and": []},
+    {"or": [False, {"neq": [{"var": "target.owner"}, None]}]},
+    {"contains": [{"var": "actor.username"}, "00"]},
+]
+CONTEXTS = [
+    {"actor": {"id": "u1", "username": "user001", "is_active": True, "roles": ["member", "x"]}, "target": {"owner": "u1", "locked": False}},
+    {"actor": {"id": "u2", "username": "bob", "is_active": False, "roles": []}, "target": {"locked": True}},
+    {"actor": {"id": "u3", "username": "user3"}, "target": {}},
+]
+
+
+@pytest.mark.parametrize("expr", EXPRESSIONS)
+def test_compiled_matches_interpreter(expr) -> None:
+    """Test compiled expressions agree with the interpreter."""
+    run = ABACEngine.compile(expr).run
+    for context in CONTEXTS:
+        assert run(context) == ABACEngine(context).evaluate(expr)
+
+
+def test_constants_are_folded() -> None:
+    """Test sub-expressions without variables are computed at compile time."""
+    compiled = ABACEngine.compile(
+        {"or": [{"eq": [1, 2]}, {"and": [{"in": [["a", "b"], "a"]}, True]}]}
+    )
+    assert compiled.constant and compiled.value is True
+    assert ABACEngine.compile({"and": [False, {"var": "actor.id"}]}).value is False
+
+
+def test_cheapest_operand_decides_first() -> None:
+    """Test costly operands are skipped once a cheap one decides."""
+    expr = {
+        "and": [
+            {"regexMatch": ["^a.*z$", {"var": "actor.profile.bio"}]},
+            {"var": "actor.is_active"},
+        ]
+    }
+    actor = CountingDict(is_active=False, profile={"bio": "abcz"})
+    assert ABACEngine.compile(expr).run({"actor": actor}) is False
+    assert actor.reads == ["is_active"]
+
+
+GUARDED = [
+    # The guard must run before the comparison it protects
+    {"and": [{"neq": [{"var": "actor.level"}, None]}, {"gt": [{"var": "actor.level"}, 3]}]},
+    {"and": [{"not": {"eq": [{"var": "actor.level"}, None]}}, {"gt": [{"var": "actor.level"}, 3]}]},
+    # A deciding operand first hides the one that would raise
+    {"or": [{"var": "actor.is_active"}, {"lt": [{"var": "actor.level"}, 3]}]},
+    {"or": [{"var": "actor.is_active"}, {"lt": [{"var": "actor.level"}, 3]}, True]},
+    # The raising operand comes first, so both deny by raising
+    {"or": [{"lt": [{"var": "actor.level"}, 3]}, True]},
+    {"and": [{"lt": [{"var": "actor.level"}, 3]}, {"var": "actor.is_active"}]},
+]
+
+
+@pytest.mark.parametrize("expr", GUARDED)
+def test_operands_that_can_raise_keep_their_order(expr) -> None:
+    """Test reordering never changes whether an expression raises."""
+    context = {"actor": {"is_active": True}}
+
+    def outcome(evaluate):
+        try:
+            return evaluate()
+        except TypeError:
+            return "raised"
+
+    compiled = ABACEngine.compile(expr)
+    expected = outcome(lambda: ABACEngine(context).evaluate(expr))
+    assert outcome(lambda: compiled.run(context)) == expected
+
+
+def test_interpreter_short_circuits() -> None:
+    """Test the interpreter stops at the first deciding operand."""
+    actor = CountingDict(is_active=True, name="x")
+    expr = {"or": [{"var": "actor.is_active"}, {"var": "actor.name"}]}
+    assert ABACEngine({"actor": actor}).evaluate(expr) is True
+    assert actor.reads == ["is_active"]
+
+
+def test_unknown_operator_is_rejected() -> None:
+    """Test compiling an unknown operator fails like evaluating it."""
+    with pytest.raises(ValueError):
+        ABACEngine.compile({"xor": [True, False]})
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.app.api.abac import evaluator
+from src.app.api.abac.engine import ABACEngine
+from src.app.api.abac.regex import (
+    RegexError,
+    compile_pattern,
+    regex_match,
+    validate_pattern,
+)
+from src.app.api.v1.endpoints.rbac import validate_expression
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"^user\d+$",
+        r"[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}",
+        r"(foo|bar)+baz",
+        r"(ab){2,5}",
+        r"\s*\w+",
+        r"[a-z]+[0-9]+",
+        r"^.*\.example\.com$",
+        r"\d+\.\d+",
+    ],
+)
+def test_linear_patterns_are_accepted(pattern):
+    validate_pattern(pattern)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"(a+)+$",
+        r"(\w+\s?)*$",
+        r"(a|aa)*b",
+        r"(.*a){3}",
+        r"a*a*a*a*a*a*b",
+        r"\w+\d+$",
+        r"(a*)b?a*c",
+        r"(?i)a*A*b",
+        r"(a)\1",
+        r"(?=a)a",
+        r"a{5000}",
+        "(",
+        "a" * 1000,
+    ],
+)
+def test_backtracking_prone_patterns_are_rejected(pattern):
+    with pytest.raises(RegexError):
+        validate_pattern(pattern)
+
+
+def test_regex_match_anchors_at_start_and_bounds_input():
+    assert regex_match("user", "user1")
+    assert not regex_match("user", "a user")
+    assert not regex_match("a", None)
+    assert not regex_match("a", "a" * 5000)
+
+
+def test_adjacent_repeats_cannot_backtrack_polynomially():
+    with pytest.raises(RegexError):
+        compile_pattern("a*a*a*a*a*a*b")
+
+
+def test_compile_rejects_unsafe_literal_pattern():
+    with pytest.raises(ValueError):
+        ABACEngine.compile({"regexMatch": ["(a+)+$", {"var": "actor.name"}]})
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [{"regexMatch": ["a*a*b", {"var": "actor.name"}]}, {"eq": [{"var": 5}, 1]}],
+)
+def test_invalid_expressions_are_rejected_with_422(expression):
+    with pytest.raises(HTTPException) as exc:
+        validate_expression(expression)
+    assert exc.value.status_code == 422
+
+
+def test_failing_and_slow_policies_deny(monkeypatch):
+    failures = []
+    monkeypatch.setattr(evaluator, "record_abac_failure", lambda *a: failures.append(a))
+
+    def policy(name, expression):
+        return SimpleNamespace(name=name, permission_id=1, expression=expression)
+
+    invalid = policy("invalid", {"regexMatch": [{"var": "actor.pattern"}, "x"]})
+    context = {"actor": {"pattern": "(a+)+$"}}
+    assert not evaluator.ABAuthorizer._evaluate(invalid, context, "r", "a", "u")
+
+    monkeypatch.setattr(evaluator.settings, "ABAC_POLICY_BUDGET_MS", 1e-9)
+    slow = policy("slow", {"eq": [1, {"var": "actor.one"}]})
+    assert not evaluator.ABAuthorizer._evaluate(slow, {"actor": {"one": 1}}, "r", "a", "u")
+
+    assert failures == [("invalid", "error"), ("slow", "budget")]
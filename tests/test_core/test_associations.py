@@ -0,0 +1,139 @@
+"""Test set-based association batches."""
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.core.db.associations import (
+    apply_association_batch,
+    link_member,
+    unlink_member,
+)
+
+metadata = MetaData()
+owner = Table("owner", metadata, Column("id", Integer, primary_key=True))
+member = Table("member", metadata, Column("id", Integer, primary_key=True))
+link = Table(
+    "owner_member",
+    metadata,
+    Column("owner_id", Integer, ForeignKey("owner.id"), primary_key=True),
+    Column("member_id", Integer, ForeignKey("member.id"), primary_key=True),
+)
+
+
+class SyncSession:
+    """Await-able facade over a sync session that counts statements."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.statements = 0
+
+    async def execute(self, statement):
+        self.statements += 1
+        return self.session.execute(statement)
+
+
+@pytest.fixture
+def db():
+    """Owner 1 linked to members 1 and 2, members 1 to 4 exist."""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(owner.insert().values([{"id": 1}]))
+        session.execute(member.insert().values([{"id": i} for i in range(1, 5)]))
+        session.execute(
+            link.insert().values(
+                [{"owner_id": 1, "member_id": 1}, {"owner_id": 1, "member_id": 2}]
+            )
+        )
+        yield SyncSession(session)
+
+
+async def apply(db, **batch):
+    return await apply_association_batch(
+        db, owner.c.id, 1, link.c.member_id, member=member.c.id, **batch
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_diffs_and_writes_once(db) -> None:
+    """Test one read, one INSERT and one DELETE regardless of batch size."""
+    change = await apply(db, add=[2, 3, 4], remove=[1])
+
+    assert (change.added, change.removed, change.current) == ([3, 4], [1], [2, 3, 4])
+    assert db.statements == 3
+
+
+@pytest.mark.asyncio
+async def test_replace_and_unknown_members(db) -> None:
+    """Test replace computes the difference and reports missing members."""
+    change = await apply(db, replace=[2, 3, 99])
+
+    assert (change.added, change.removed, change.unknown) == ([3], [1], [99])
+
+
+@pytest.mark.asyncio
+async def test_missing_owner_and_noop(db) -> None:
+    """Test a missing owner returns None and a no-op batch writes nothing."""
+    assert await apply_association_batch(db, owner.c.id, 2, link.c.member_id) is None
+
+    db.statements = 0
+    change = await apply(db, add=[1], remove=[3])
+    assert not change.changed and db.statements == 1
+
+
+class Recorder:
+    """Session stand-in recording statements and reporting a row count."""
+
+    def __init__(self, rowcount: int, exists=(True, True)):
+        self.rowcount = rowcount
+        self.exists = exists
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        recorder = self
+
+        class Result:
+            rowcount = recorder.rowcount
+
+            def one(self):
+                return recorder.exists
+
+        return Result()
+
+
+@pytest.mark.asyncio
+async def test_link_member_is_a_single_upsert() -> None:
+    """Test linking issues one ON CONFLICT insert without loading collections."""
+    db = Recorder(rowcount=1)
+
+    assert await link_member(db, owner.c.id, 1, link.c.member_id, member.c.id, 3) == 1
+    assert len(db.statements) == 1
+    assert "ON CONFLICT DO NOTHING" in db.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_unlink_member_reports_missing_rows() -> None:
+    """Test a no-op tells an existing pair (0) from a missing member (None)."""
+    db = Recorder(rowcount=0)
+    assert await unlink_member(db, owner.c.id, 1, link.c.member_id, member.c.id, 3) == 0
+
+    db = Recorder(rowcount=0, exists=(True, False))
+    assert await unlink_member(db, owner.c.id, 1, link.c.member_id, member.c.id, 9) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_links_added_concurrently(db) -> None:
+    """Test a link inserted after the read is skipped, not counted or unknown."""
+
+    class RacingSession(SyncSession):
+        async def execute(self, statement):
+            if self.statements == 1:
+                self.session.execute(link.insert().values(owner_id=1, member_id=3))
+            return await super().execute(statement)
+
+    racing = RacingSession(db.session)
+    change = await apply(racing, add=[3, 4, 99])
+
+    assert (change.added, change.unknown, change.current) == ([4], [99], [1, 2, 3, 4])
@@ -0,0 +1,91 @@
+"""Test ABAC attribute providers."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.api.abac.attributes import AttributeRegistry, referenced_vars
+from src.app.api.abac.providers import load_users
+
+
+@pytest.fixture
+def registry():
+    """Registry with an owner provider recording its batches."""
+    registry = AttributeRegistry()
+    registry.batches = []
+
+    @registry.register("target.owner", key="target.owner_id")
+    async def load_owners(db, keys):
+        registry.batches.append(sorted(keys))
+        return {key: {"id": key, "team": f"team-{key % 2}"} for key in keys}
+
+    return registry
+
+
+def test_referenced_vars() -> None:
+    """Test every var path is collected."""
+    expr = {"and": [{"eq": [{"var": "target.owner.team"}, "a"]}, {"not": {"var": "actor.x"}}]}
+    assert referenced_vars(expr) == {"target.owner.team", "actor.x"}
+
+
+@pytest.mark.asyncio
+async def test_loads_are_batched_and_cached(registry) -> None:
+    """Test concurrent lookups share one batch and repeats hit the cache."""
+    db = SimpleNamespace(info={})
+    expr = {"eq": [{"var": "target.owner.team"}, "team-1"]}
+    providers = registry.required([expr])
+    contexts = [{"target": {"owner_id": i % 3}} for i in range(9)]
+
+    provided = await asyncio.gather(
+        *(registry.provide(db, context, providers) for context in contexts)
+    )
+    again = await registry.provide(db, {"target": {"owner_id": 1}}, providers)
+
+    assert registry.batches == [[0, 1, 2]]
+    assert provided[4]["target"]["owner"] == {"id": 1, "team": "team-1"}
+    assert again["target"]["owner"]["team"] == "team-1"
+    assert "owner" not in contexts[4]["target"]
+
+
+@pytest.mark.asyncio
+async def test_unreferenced_providers_are_skipped(registry) -> None:
+    """Test nothing loads when no policy reads a provided attribute."""
+    db = SimpleNamespace(info={})
+    context = {"target": {"owner_id": 1}}
+    providers = registry.required([{"eq": [{"var": "target.owner_id"}, 1]}, None])
+
+    assert providers == []
+    assert await registry.provide(db, context, providers) is context
+    assert registry.batches == []
+
+
+class UserResult:
+    """Query result yielding fixed users."""
+
+    def __init__(self, users):
+        self.users = users
+
+    def scalars(self):
+        return iter(self.users)
+
+
+@pytest.mark.asyncio
+async def test_users_are_keyed_by_requested_key() -> None:
+    """Test an int user id from a JSON body resolves to the string-keyed user."""
+    user = SimpleNamespace(
+        id="42",
+        username="user42",
+        email="u42@example.com",
+        is_active=True,
+        is_superuser=False,
+        roles=[SimpleNamespace(name="member")],
+    )
+
+    async def execute(statement):
+        return UserResult([user])
+
+    loaded = await load_users(SimpleNamespace(execute=execute), [42, "42", 7])
+
+    assert loaded[42]["username"] == "user42"
+    assert loaded["42"]["roles"] == ["member"]
+    assert loaded[7] is None
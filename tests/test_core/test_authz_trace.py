@@ -0,0 +1,87 @@
+"""Test the authorization trace buffer and its debug endpoints."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.api.abac import evaluator
+from src.app.api.v1.endpoints import debug
+from src.core.debug import AuthzTrace
+from src.core.log.context import request_id_var
+
+
+def decide(trace, user_id="u1", outcome=True):
+    trace.decision(
+        user_id=user_id,
+        resource="users",
+        action="read",
+        policy_id=1,
+        expression=None,
+        outcome=outcome,
+        duration_ms=0.5,
+    )
+
+
+def test_oldest_records_are_evicted() -> None:
+    """Test the buffer keeps the newest records, newest first."""
+    trace = AuthzTrace(maxlen=3, enabled=True)
+    for i in range(5):
+        decide(trace, user_id=f"u{i}")
+
+    assert [r["user_id"] for r in trace.records()] == ["u4", "u3", "u2"]
+    assert [r["user_id"] for r in trace.records(limit=1)] == ["u4"]
+
+
+def test_records_filter_by_user_and_request() -> None:
+    """Test records carry the request id and can be filtered by it."""
+    trace = AuthzTrace(enabled=True)
+    token = request_id_var.set("req-1")
+    try:
+        decide(trace, user_id="u1")
+    finally:
+        request_id_var.reset(token)
+    decide(trace, user_id="u2")
+
+    assert [r["user_id"] for r in trace.records(request_id="req-1")] == ["u1"]
+    assert [r["request_id"] for r in trace.records(user_id="u2")] == [None]
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_policy_evaluation_records_only_when_enabled(monkeypatch, enabled) -> None:
+    """Test a disabled trace records nothing and an enabled one keeps steps."""
+    trace = AuthzTrace(enabled=enabled)
+    monkeypatch.setattr(evaluator, "authz_trace", trace)
+    policy = SimpleNamespace(
+        name="p", permission_id=7, expression={"eq": [{"var": "actor.id"}, "u1"]}
+    )
+
+    assert evaluator.ABAuthorizer._evaluate(
+        policy, {"actor": {"id": "u1"}}, "users", "read", "u1"
+    )
+
+    records = trace.records()
+    if not enabled:
+        assert records == []
+    else:
+        assert [(r["policy_id"], r["outcome"]) for r in records] == [(7, True)]
+        assert records[0]["steps"]
+
+
+@pytest.mark.asyncio
+async def test_endpoint_reads_and_clears_buffer(monkeypatch) -> None:
+    """Test GET returns the filtered records and DELETE empties the buffer."""
+    trace = AuthzTrace(enabled=True)
+    monkeypatch.setattr(debug, "authz_trace", trace)
+    decide(trace, user_id="u1")
+    decide(trace, user_id="u2", outcome=False)
+
+    body = await debug.get_authz_trace(
+        limit=10, user_id="u2", request_id=None, current_user=None
+    )
+    assert body["enabled"] is True
+    assert [(r["user_id"], r["outcome"]) for r in body["records"]] == [("u2", False)]
+
+    await debug.clear_authz_trace(current_user=None)
+    body = await debug.get_authz_trace(
+        limit=10, user_id=None, request_id=None, current_user=None
+    )
+    assert body["records"] == []
@@ -0,0 +1,80 @@
+"""Test batch authorization."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.api.abac.evaluator import ABAuthorizer, target_vars
+
+OWNER_POLICY = SimpleNamespace(
+    permission_id=1,
+    name="route:update:owner",
+    resource="route",
+    action="update",
+    expression={"eq": [{"var": "target.owner"}, {"var": "actor.id"}]},
+)
+OPEN_POLICY = SimpleNamespace(
+    permission_id=2, name="route:read", resource="route", action="read", expression=None
+)
+
+
+class PolicyService:
+    """Policy lookups answered from memory, counting queries."""
+
+    def __init__(self, policies):
+        self.policies = policies
+        self.queries = 0
+
+    async def get_policies_for(self, role_names, pairs):
+        self.queries += 1
+        pairs = set(pairs)
+        return [p for p in self.policies if (p.resource, p.action) in pairs]
+
+
+@pytest.fixture
+def authorizer(monkeypatch):
+    """Authorizer counting policy evaluations."""
+    authorizer = ABAuthorizer(None)
+    authorizer.policy_service = PolicyService([OWNER_POLICY, OPEN_POLICY])
+    authorizer.evaluations = 0
+    evaluate = ABAuthorizer._evaluate
+
+    def counting(*args):
+        authorizer.evaluations += 1
+        return evaluate(*args)
+
+    monkeypatch.setattr(authorizer, "_evaluate", counting)
+    return authorizer
+
+
+ACTOR = SimpleNamespace(
+    id="u1",
+    name="User",
+    email="u1@example.com",
+    username="u1",
+    is_active=True,
+    is_superuser=False,
+    roles=[SimpleNamespace(name="member")],
+)
+
+
+def test_target_vars() -> None:
+    """Test only target paths are collected, whole-target reads give None."""
+    assert target_vars(OWNER_POLICY.expression) == {"owner"}
+    assert target_vars(None) == frozenset()
+    assert target_vars({"len": {"var": "target"}}) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_groups_targets(authorizer) -> None:
+    """Test one query and one evaluation per distinct target attribute set."""
+    rows = [{"id": i, "owner": "u1" if i % 2 else "u2"} for i in range(100)]
+    checks = [("route", "update", row) for row in rows]
+    checks += [("route", "read", rows[0]), ("route", "delete", rows[0])]
+
+    allowed = await authorizer.is_allowed_batch(ACTOR, checks)
+
+    assert allowed[:100] == [bool(i % 2) for i in range(100)]
+    assert allowed[100:] == [True, False]
+    assert authorizer.policy_service.queries == 1
+    # Two owners for update, one unconditional read
+    assert authorizer.evaluations == 3
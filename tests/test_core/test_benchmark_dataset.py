@@ -0,0 +1,35 @@
+"""Test the synthetic benchmark dataset."""
+from benchmarks.dataset import SCALES, Scale, generate, user_id, username
+
+SMALL = Scale(users=25, roles=5, permissions=40, modules=2, routes_per_module=6)
+
+
+def _tables(seed: int):
+    tables = {}
+    for table, rows in generate(SMALL, seed, chunk_size=10):
+        tables.setdefault(table.name, []).extend(rows)
+    return tables
+
+
+def test_generation_is_deterministic() -> None:
+    """Test the same seed yields the same rows and another seed does not."""
+    assert _tables(7) == _tables(7)
+    assert _tables(7) != _tables(8)
+
+
+def test_rows_are_consistent() -> None:
+    """Test row counts and foreign keys of a small dataset."""
+    tables = _tables(42)
+
+    assert len(tables["user"]) == SMALL.users
+    assert tables["user"][3]["id"] == user_id(3)
+    assert tables["user"][3]["username"] == username(3)
+    route_ids = {route["id"] for route in tables["route"]}
+    assert all(
+        route["parent_id"] is None or route["parent_id"] in route_ids
+        for route in tables["route"]
+    )
+    # Every user holds the member role the load scenario relies on
+    members = {row["user_id"] for row in tables["user_role"] if row["role_id"] == 2}
+    assert members == {user["id"] for user in tables["user"]}
+    assert set(SCALES) == {"1k", "10k", "100k", "1m"}
@@ -0,0 +1,27 @@
+"""Test connection pool configuration."""
+from sqlalchemy.pool import NullPool
+
+from src.core.config import settings
+from src.core.db.pool import engine_options, recommended_pool_size
+
+
+def test_recommended_pool_size_splits_budget_per_worker() -> None:
+    """Test the connection budget is shared between workers."""
+    assert recommended_pool_size(30, 1) == (20, 10)
+    assert recommended_pool_size(100, 4) == (17, 8)
+    assert recommended_pool_size(2, 8) == (1, 0)
+
+
+def test_pgbouncer_mode_disables_statement_caches(monkeypatch) -> None:
+    """Test pgbouncer mode turns prepared statement caching off."""
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", True)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 0)
+
+    options = engine_options()
+
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    name_func = options["connect_args"]["prepared_statement_name_func"]
+    assert name_func() != name_func()
@@ -0,0 +1,68 @@
+"""Test the upload image pipeline."""
+import io
+
+import pytest
+
+from src.core.storage import MemoryStorage
+from src.core.utils.image_processing import (
+    ImageProcessingService,
+    process_image,
+    variant_path,
+)
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def encode(format: str, size=(40, 20)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 10, 10)).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def test_variant_path() -> None:
+    assert variant_path("photos/a.jpg", 128) == "photos/a_128.webp"
+    assert variant_path("photos/a.jpg") == "photos/a_full.webp"
+    # A WebP original keeps its own key
+    assert variant_path("photos/a.webp") != "photos/a.webp"
+
+
+def test_resolve_size() -> None:
+    service = ImageProcessingService(storage=MemoryStorage())
+    service.sizes = [64, 128, 256]
+
+    assert service.resolve_size(10) == 64
+    assert service.resolve_size(128) == 128
+    assert service.resolve_size(200) == 256
+    assert service.resolve_size(1000) == 256
+    service.sizes = []
+    assert service.resolve_size(10) is None
+
+
+def test_process_image_variants() -> None:
+    variants = process_image(encode("PNG"), [8, 16], quality=80)
+
+    assert set(variants) == {"original", "webp", "8", "16"}
+    with Image.open(io.BytesIO(variants["16"])) as thumbnail:
+        assert thumbnail.format == "WEBP"
+        assert max(thumbnail.size) == 16
+
+
+@pytest.mark.asyncio
+async def test_process_keeps_webp_original() -> None:
+    storage = MemoryStorage()
+    service = ImageProcessingService(storage=storage)
+    service.sizes = [8]
+    await storage.save("photos/a.webp", encode("WEBP"))
+    saved = []
+    save = storage.save
+
+    async def record(key, content, **kwargs):
+        saved.append(key)
+        await save(key, content, **kwargs)
+
+    storage.save = record
+
+    await service.process("photos/a.webp")
+
+    # Only the re-encoded original is written back to the upload's key
+    assert sorted(saved) == ["photos/a.webp", "photos/a_8.webp", "photos/a_full.webp"]
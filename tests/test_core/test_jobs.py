@@ -0,0 +1,46 @@
+"""Test the background job runner."""
+import pytest
+
+from src.core.jobs import JobRunner
+
+
+@pytest.fixture
+def runner():
+    """Local runner retrying without delay."""
+    runner = JobRunner(workers=2, max_retries=2, retry_backoff=0)
+    runner.enabled = True
+    runner.backend = "local"
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_retried(runner) -> None:
+    """Test a job failing once succeeds on its retry."""
+    attempts = []
+
+    @runner.register("flaky")
+    async def flaky(value: int) -> None:
+        attempts.append(value)
+        if len(attempts) == 1:
+            raise RuntimeError("transient")
+
+    await runner.start()
+    assert await runner.enqueue("flaky", 7)
+    await runner.stop(timeout=5)
+
+    assert attempts == [7, 7]
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_jobs(runner) -> None:
+    """Test stop runs every queued job, including sync ones, first."""
+    done = []
+    runner.register("record")(done.append)
+
+    await runner.start()
+    for i in range(10):
+        await runner.enqueue("record", i)
+    await runner.stop(timeout=5)
+
+    assert sorted(done) == list(range(10))
+    assert not await runner.enqueue("record", 99)
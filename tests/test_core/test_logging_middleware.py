@@ -0,0 +1,67 @@
+"""Test access logging middleware."""
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+
+from src.core.middleware.logging import LoggingMiddleware
+
+
+@pytest.fixture
+def access_records():
+    """Capture access log records."""
+    records = []
+    handler_id = logger.add(
+        lambda message: records.append(json.loads(message.record["message"])),
+        filter=lambda record: "access_log" in record["extra"],
+        format="{message}",
+    )
+    yield records
+    logger.remove(handler_id)
+
+
+@pytest.mark.asyncio
+async def test_access_record_and_rate_limit_headers(access_records) -> None:
+    """Test one record per request and rate limit headers on the response."""
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, sample_rate=1.0)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int, request: Request):
+        request.state.rate_limit_info = {"limit": 5, "remaining": 4, "reset": 30}
+        request.state.user_id = "u1"
+        return {"id": item_id}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/items/7")
+
+    assert response.headers["X-RateLimit-Remaining"] == "4"
+    assert len(access_records) == 1
+    record = access_records[0]
+    assert record["route"] == "/items/{item_id}"
+    assert record["status"] == 200
+    assert record["user_id"] == "u1"
+    assert record["bytes"] == len(response.content)
+
+
+@pytest.mark.asyncio
+async def test_sampling_keeps_errors(access_records) -> None:
+    """Test sampled-out successes are dropped while errors are kept."""
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, sample_rate=0.0)
+
+    @app.get("/ok")
+    async def ok():
+        return {}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/ok")
+        await client.get("/missing")
+
+    assert [record["status"] for record in access_records] == [404]
@@ -0,0 +1,41 @@
+"""Test metrics instrumentation."""
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+
+from src.core.metrics import fingerprint
+from src.core.middleware.metrics import MetricsMiddleware
+
+
+def test_fingerprint_collapses_literals() -> None:
+    """Test statements differing only in bind values share a fingerprint."""
+    first = fingerprint("SELECT * FROM users WHERE id IN ($1, $2)")
+    second = fingerprint("SELECT *  FROM users\nWHERE id IN ($1, $2, $3)")
+
+    assert first.id == second.id
+    assert first.operation == "SELECT"
+    assert first.table == "users"
+
+
+@pytest.mark.asyncio
+async def test_request_duration_uses_route_template() -> None:
+    """Test request latency is labelled with the route template."""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics-test/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    labels = {"method": "GET", "route": "/metrics-test/{item_id}", "status": "200"}
+    before = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/metrics-test/1")
+        await client.get("/metrics-test/2")
+
+    after = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels)
+    assert after == before + 2
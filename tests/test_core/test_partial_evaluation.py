@@ -0,0 +1,91 @@
+"""Test partial evaluation of ABAC policies into SQL filters."""
+import pytest
+from sqlalchemy import Boolean, Column, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from src.app.api.abac.engine import ABACEngine
+from src.app.api.abac.partial import (
+    Residual,
+    Var,
+    partial_evaluate,
+    policy_filter,
+)
+
+Model = declarative_base()
+
+
+class Doc(Model):
+    __tablename__ = "doc"
+
+    id = Column(Integer, primary_key=True)
+    owner = Column(String, nullable=True)
+    title = Column(String, nullable=False)
+    locked = Column(Boolean, nullable=True)
+    level = Column(Integer, nullable=False)
+
+
+ROWS = [
+    {"id": 1, "owner": "u1", "title": "Plan", "locked": False, "level": 1},
+    {"id": 2, "owner": "u2", "title": "user guide", "locked": True, "level": 5},
+    {"id": 3, "owner": None, "title": "Draft_%", "locked": None, "level": 3},
+    {"id": 4, "owner": "u1", "title": "user0 notes", "locked": True, "level": 9},
+]
+CONTEXT = {"actor": {"id": "u1", "is_active": True, "roles": ["member"]}}
+
+POLICIES = [
+    {"eq": [{"var": "target.owner"}, {"var": "actor.id"}]},
+    {"and": [{"var": "actor.is_active"}, {"not": {"var": "target.locked"}}]},
+    {"or": [{"gt": [{"var": "target.level"}, 4]}, {"in": [["u2"], {"var": "target.owner"}]}]},
+    {"neq": [{"var": "target.owner"}, "u1"]},
+    {"startswith": [{"var": "target.title"}, "Draft_"]},
+    {"regexMatch": ["user0", {"var": "target.title"}]},
+    {"in": [{"var": "actor.roles"}, "admin"]},
+]
+
+
+@pytest.fixture(scope="module")
+def session():
+    """Session over the sample rows."""
+    engine = create_engine("sqlite://")
+    Model.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Doc(**row) for row in ROWS)
+        session.commit()
+        yield session
+
+
+def test_actor_conditions_fold_away() -> None:
+    """Test only target conditions are left in the residual."""
+    expr = {"and": [{"var": "actor.is_active"}, {"eq": [{"var": "target.owner"}, {"var": "actor.id"}]}]}
+    assert partial_evaluate(expr, CONTEXT) == Residual("eq", [Var("owner"), "u1"])
+    assert partial_evaluate({"in": [{"var": "actor.roles"}, "member"]}, CONTEXT) is True
+
+
+@pytest.mark.parametrize("expr", POLICIES)
+def test_filter_matches_engine(session, expr) -> None:
+    """Test SQL filtering selects exactly the rows full evaluation allows."""
+    expected = {
+        row["id"]
+        for row in ROWS
+        if ABACEngine({**CONTEXT, "target": row}).evaluate(expr)
+    }
+    where = policy_filter([expr], CONTEXT, Doc)
+    selected = set() if where is None else set(session.scalars(select(Doc.id).where(where)))
+    assert selected == expected
+
+
+def test_untranslatable_policies_fail_closed() -> None:
+    """Test a policy without SQL equivalent allows nothing."""
+    expr = {"gt": [{"len": {"var": "target.title"}}, 3]}
+    assert policy_filter([expr], CONTEXT, Doc) is None
+    assert policy_filter([expr, None], CONTEXT, Doc) is not None
+
+
+def test_list_policies_written_for_has_permission_still_apply(session) -> None:
+    """Test a baseline ``target.response == "all"`` policy allows every row."""
+    baseline = {"eq": [{"var": "target.response"}, "all"]}
+    mixed = {"or": [{"neq": [{"var": "target.response"}, "all"]}, {"eq": [{"var": "target.owner"}, {"var": "actor.id"}]}]}
+
+    for expr, expected in ((baseline, {1, 2, 3, 4}), (mixed, {1, 4})):
+        where = policy_filter([expr], CONTEXT, Doc)
+        assert set(session.scalars(select(Doc.id).where(where))) == expected
@@ -0,0 +1,94 @@
+"""Test the in-memory policy index."""
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from src.app.api.abac.index import PolicyIndex
+from src.app.services.permission import wildcard_patterns
+
+
+def row(role_id, role_name, permission_id=None, resource=None, action=None):
+    return SimpleNamespace(
+        role_id=role_id,
+        role_name=role_name,
+        permission_id=permission_id,
+        name=f"p{permission_id}",
+        resource=resource,
+        action=action,
+        expression=None,
+    )
+
+
+class FakeIndex(PolicyIndex):
+    """Index reading role rows from memory instead of the database."""
+
+    def __init__(self, rows):
+        super().__init__(engine=object())
+        self.rows = rows
+        self.fetches = []
+
+    async def _fetch(self, role_ids):
+        self.fetches.append(role_ids)
+        return [r for r in self.rows if role_ids is None or r.role_id in role_ids]
+
+
+@pytest_asyncio.fixture
+async def index():
+    """Loaded index with exact, prefix and global wildcard rules."""
+    index = FakeIndex(
+        [
+            row(1, "superuser", 1, "*", "*"),
+            row(2, "editor", 2, "users", "read"),
+            row(2, "editor", 3, "users.*", "update"),
+            row(3, "viewer", 4, "route", "read.*"),
+            row(4, "empty"),
+        ]
+    )
+    await index.load()
+    return index
+
+
+def ids(policies):
+    return [policy.permission_id for policy in policies]
+
+
+def test_wildcard_patterns() -> None:
+    """Test a value is matched by itself, its prefixes and the wildcard."""
+    assert wildcard_patterns("users.profile") == [
+        "users.profile",
+        "users.profile.*",
+        "users.*",
+        "*",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lookup_matches_wildcards(index) -> None:
+    """Test exact, prefix and global patterns without database access."""
+    assert ids(index.lookup(["superuser"], "anything", "delete")) == [1]
+    assert ids(index.lookup(["editor"], "users", "read")) == [2]
+    assert ids(index.lookup(["editor"], "users.profile", "update")) == [3]
+    assert ids(index.lookup(["editor"], "users", "update")) == [3]
+    assert ids(index.lookup(["editor"], "userspace", "update")) == []
+    assert ids(index.lookup(["viewer"], "route", "read.sidebar")) == [4]
+    assert ids(index.lookup(["editor", "superuser"], "users", "read")) == [1, 2]
+    assert index.fetches == [None]
+
+
+@pytest.mark.asyncio
+async def test_refresh_reloads_only_affected_roles(index) -> None:
+    """Test relinked, renamed and deleted roles are reloaded by id."""
+    assert ids(index.lookup(["viewer"], "route", "read")) == [4]
+    index.rows = [r for r in index.rows if r.role_id != 3] + [
+        row(3, "reader", 5, "module", "read"),
+    ]
+    index.rows = [r for r in index.rows if r.role_id != 2]
+
+    await index.refresh(role_ids=[2, 3])
+
+    assert index.fetches[-1] == {2, 3}
+    assert index.lookup(["viewer"], "route", "read") == ()
+    assert ids(index.lookup(["reader"], "module", "read")) == [5]
+    assert index.lookup(["editor"], "users", "read") == ()
+    assert ids(index.lookup(["superuser"], "users", "read")) == [1]
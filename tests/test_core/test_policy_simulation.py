@@ -0,0 +1,102 @@
+import time
+
+from src.app.api.abac import simulation
+from src.app.api.abac.simulation import apply_changes, corpus_from_trace, simulate
+
+CURRENT = [
+    {
+        "permission_id": 1,
+        "name": "users_read_own",
+        "resource": "users",
+        "action": "read",
+        "expression": {"eq": [{"var": "actor.id"}, {"var": "target.id"}]},
+        "roles": ["member"],
+    },
+    {
+        "permission_id": 2,
+        "name": "all",
+        "resource": "*",
+        "action": "*",
+        "expression": None,
+        "roles": ["admin"],
+    },
+]
+
+
+def request(actor_id, target_id, roles=("member",)):
+    return {
+        "actor": {"id": actor_id, "roles": list(roles)},
+        "resource": "users",
+        "action": "read",
+        "target": {"id": target_id},
+    }
+
+
+CORPUS = [request("a", "a"), request("a", "b"), request("x", "y", roles=["admin"])]
+
+replay_chunk = simulation._simulate_chunk
+
+
+def stuck_first_chunks(current, proposed, start, requests):
+    if start < 2:
+        time.sleep(30)
+    return replay_chunk(current, proposed, start, requests)
+
+
+def test_unchanged_policies_report_no_diffs():
+    report = simulate(CORPUS, CURRENT, CURRENT)
+
+    assert report["diffs"] == []
+    assert report["replayed"] == 3
+    assert report["latency"]["current"]["users_read_own"]["evaluations"] == 2
+    assert report["latency"]["current"]["all"]["evaluations"] == 1
+
+
+def test_changed_policy_reports_decision_diffs():
+    proposed = apply_changes(
+        CURRENT,
+        [{"name": "users_read_own", "expression": True}, {"name": "all", "deleted": True}],
+    )
+    report = simulate(CORPUS, CURRENT, proposed, workers=2, chunk_size=1)
+
+    assert [(d["index"], d["current"], d["proposed"]) for d in report["diffs"]] == [
+        (1, False, True),
+        (2, True, False),
+    ]
+    assert report["granted_to_denied"] == 1
+    assert report["denied_to_granted"] == 1
+
+
+def test_invalid_and_slow_policies_are_flagged():
+    proposed = apply_changes(
+        CURRENT, [{"name": "users_read_own", "expression": {"nope": []}}]
+    )
+    report = simulate(CORPUS, CURRENT, proposed, slow_ms=0)
+
+    assert "users_read_own" in report["invalid_policies"]["proposed"]
+    assert report["slow_policies"]["current"] == ["all", "users_read_own"]
+
+
+def test_corpus_from_trace_keeps_request_events_oldest_first():
+    records = [
+        {"kind": "event", "name": "authz.request", **request("a", "2")},
+        {"kind": "decision", "resource": "users", "action": "read"},
+        {"kind": "event", "name": "authz.request", **request("a", "1")},
+    ]
+
+    corpus = corpus_from_trace(records)
+
+    assert [r["target"]["id"] for r in corpus] == ["1", "2"]
+
+
+def test_stuck_chunks_time_out_without_holding_their_workers(monkeypatch):
+    monkeypatch.setattr(simulation, "_simulate_chunk", stuck_first_chunks)
+    corpus = CORPUS * 2
+    started = time.monotonic()
+
+    report = simulate(corpus, CURRENT, CURRENT, workers=2, chunk_size=1, timeout=1)
+
+    assert time.monotonic() - started < 10
+    assert [chunk["start"] for chunk in report["timed_out_chunks"]] == [0, 1]
+    assert report["replayed"] == len(corpus) - 2
+    assert report["latency"]["current"]["users_read_own"]["evaluations"] == 2
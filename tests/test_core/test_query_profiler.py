@@ -0,0 +1,49 @@
+"""Test the query profiler middleware."""
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.core.db.profiler import QueryBudgetExceeded, profile_engine, query_budget
+from src.core.middleware.query_profiler import QueryProfilerMiddleware
+
+
+@pytest.fixture
+def app():
+    """Application running one statement per requested item."""
+    engine = create_engine("sqlite://")
+    profile_engine(engine)
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware, strict=True)
+
+    @app.get("/items")
+    @query_budget(3)
+    async def list_items(count: int):
+        with engine.connect() as conn:
+            return [
+                conn.execute(text("SELECT :id"), {"id": i}).scalar_one()
+                for i in range(count)
+            ]
+
+    yield app
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_within_budget(app) -> None:
+    """Test requests within their budget pass."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/items", params={"count": 3})
+    assert response.json() == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_budget_exceeded_in_strict_mode(app) -> None:
+    """Test strict mode fails requests running more queries than declared."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        with pytest.raises(QueryBudgetExceeded, match="ran 4 queries, budget is 3"):
+            await client.get("/items", params={"count": 4})
@@ -0,0 +1,120 @@
+"""Test user registration and the URLs of uploaded files."""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.api.v1.endpoints import auth
+from src.app.main import app
+from src.app.services import user as user_module
+from src.app.services.user import UserService
+from src.core.storage import MemoryStorage
+from src.core.utils.file_utils import FileUploadService
+
+
+def test_file_url_is_served_by_file_route() -> None:
+    """Test get_file_url points at GET /file/files/{file_path:path}."""
+    url = FileUploadService(storage=MemoryStorage()).get_file_url(
+        "userphotos/ab/photo.png"
+    )
+
+    routes = [
+        route
+        for route in app.routes
+        if "GET" in getattr(route, "methods", ()) and route.path_regex.match(url)
+    ]
+    assert url == "/api/v1/file/files/userphotos/ab/photo.png"
+    assert [route.path for route in routes] == ["/api/v1/file/files/{file_path:path}"]
+
+
+class RoleResult:
+    def scalar_one(self):
+        return SimpleNamespace(role_id=2, name="user")
+
+
+@pytest.mark.asyncio
+async def test_create_user_with_role_reads_form_dict(monkeypatch) -> None:
+    """Test the registration form dict is read by key and the role linked."""
+    inserted, linked = [], []
+
+    async def insert_returning(db, model, values):
+        inserted.append(values)
+        return SimpleNamespace(**values)
+
+    async def execute(statement):
+        return RoleResult()
+
+    async def link_roles(self, user, roles):
+        linked.append([role.role_id for role in roles])
+
+    monkeypatch.setattr(user_module, "insert_returning", insert_returning)
+    monkeypatch.setattr(user_module, "get_password_hash", lambda password: "hashed")
+    monkeypatch.setattr(UserService, "_link_roles", link_roles)
+    service = UserService(SimpleNamespace(execute=execute))
+
+    user = await service.create_user_with_role(
+        {
+            "name": "User",
+            "phoneNumber": "555-0100",
+            "email": "u@example.com",
+            "username": "user1",
+            "password": "secret",
+            "photo": None,
+        },
+        role_id=2,
+    )
+
+    assert (user.username, user.hashed_password) == ("user1", "hashed")
+    assert "photo" not in inserted[0]
+    assert linked == [[2]]
+
+
+@pytest.mark.asyncio
+async def test_register_returns_uploaded_photo_url(monkeypatch) -> None:
+    """Test the response carries the photo URL, which has no user column."""
+    enqueued = []
+
+    class FakeUploads:
+        async def save_file(self, file, subfolder):
+            return {"file_path": f"{subfolder}/photo.png"}
+
+        def get_file_url(self, file_path):
+            return f"/api/v1/file/files/{file_path}"
+
+    class FakeImages:
+        async def enqueue(self, file_path):
+            enqueued.append(file_path)
+
+    class FakeUserService:
+        def __init__(self, db):
+            pass
+
+        async def create_user_with_role(self, user_data, role_id):
+            now = datetime(2024, 1, 1)
+            return SimpleNamespace(
+                id="u1",
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+                roles=[SimpleNamespace(name="user")],
+                **{k: v for k, v in user_data.items() if k not in ("password", "photo")},
+            )
+
+    monkeypatch.setattr(auth, "file_upload_service", FakeUploads())
+    monkeypatch.setattr(auth, "image_processing_service", FakeImages())
+    monkeypatch.setattr(auth, "UserService", FakeUserService)
+
+    response = await auth.register(
+        name="User",
+        phoneNumber="555-0100",
+        email="u@example.com",
+        username="user1",
+        password="secret",
+        photo=object(),
+        role_id=2,
+        db=None,
+    )
+
+    assert response.photo == "/api/v1/file/files/userphotos/photo.png"
+    assert response.roles == ["user"]
+    assert enqueued == ["userphotos/photo.png"]
@@ -0,0 +1,96 @@
+"""Test read replica routing."""
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert, select, table, text
+
+from src.core.db.replica import (
+    PRIMARY,
+    REPLICA,
+    ReplicaRouter,
+    RoutingSession,
+    db_route_var,
+    read_only,
+)
+from src.core.middleware.replica import ReplicaRoutingMiddleware
+
+
+class FakeEngine:
+    """Stand-in for an AsyncEngine exposing its sync engine."""
+
+    def __init__(self, name: str):
+        self.sync_engine = name
+
+
+@pytest.fixture
+def router(monkeypatch):
+    """Router over two replicas, the second lagging."""
+    replicas = [FakeEngine("replica-1"), FakeEngine("replica-2")]
+    router = ReplicaRouter(replicas, max_lag=1.0)
+    router.lag[replicas[1]] = 30.0
+    monkeypatch.setattr(RoutingSession, "router", router)
+    return router
+
+
+def test_routing_session_reads_replica_and_writes_primary(router) -> None:
+    """Test reads use a healthy replica until the session writes."""
+    session = RoutingSession(bind="primary")
+    token = db_route_var.set(REPLICA)
+    try:
+        assert session.get_bind(clause=select(text("1"))) == "replica-1"
+        assert session.get_bind(clause=select(text("1")).with_for_update()) == "primary"
+        assert session.get_bind(clause=insert(table("t"))) == "primary"
+        assert session.get_bind(clause=select(text("1"))) == "primary"
+    finally:
+        db_route_var.reset(token)
+
+    assert RoutingSession(bind="primary").get_bind(clause=select(text("1"))) == "primary"
+
+
+def test_lagging_replicas_fall_back_to_primary(router) -> None:
+    """Test reads go to the primary when every replica lags."""
+    router.lag[router.engines[0]] = None
+    assert router.pick() is None
+
+    session = RoutingSession(bind="primary")
+    token = db_route_var.set(REPLICA)
+    try:
+        assert session.get_bind(clause=select(text("1"))) == "primary"
+    finally:
+        db_route_var.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_cookie() -> None:
+    """Test a write pins the client's following reads to the primary."""
+    app = FastAPI()
+    app.add_middleware(ReplicaRoutingMiddleware)
+
+    @read_only
+    async def current_route():
+        return db_route_var.get()
+
+    @app.get("/items")
+    async def list_items():
+        return {"route": await current_route()}
+
+    @app.get("/plain")
+    async def plain_read():
+        return {"route": db_route_var.get()}
+
+    @app.post("/items")
+    async def create_item():
+        return {"route": await current_route()}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        assert (await client.get("/items")).json() == {"route": REPLICA}
+        # Reads outside @read_only stay on the primary
+        assert (await client.get("/plain")).json() == {"route": None}
+
+        response = await client.post("/items")
+        assert response.json() == {"route": REPLICA}
+        assert "db_primary_until" in response.cookies
+
+        assert (await client.get("/items")).json() == {"route": PRIMARY}
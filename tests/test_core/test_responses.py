@@ -0,0 +1,76 @@
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.app.models import Role, Route
+from src.app.schemas import PermissionList, RouteResponseList, UserResponse
+from src.core.responses import trusted_json
+
+
+def test_route_list_validates_from_loaded_roles_and_dumps_json():
+    route = Route(
+        id=1, path="/a", label="A", is_active=True, is_sidebar=False, module_id=1
+    )
+    route.version = 1
+    route.roles = [Role(role_id=2, name="member"), Role(role_id=5, name="editor")]
+
+    models = RouteResponseList.validate_python([route], from_attributes=True)
+    response = trusted_json(RouteResponseList, models)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [
+        {
+            "path": "/a",
+            "label": "A",
+            "icon": None,
+            "is_active": True,
+            "is_sidebar": False,
+            "module_id": 1,
+            "parent_id": None,
+            "id": 1,
+            "version": 1,
+            "role_ids": [2, 5],
+        }
+    ]
+
+
+def test_permission_list_from_attributes():
+    now = datetime(2024, 1, 1)
+    permission = SimpleNamespace(
+        permission_id=1,
+        name="users_read",
+        description=None,
+        resource="users",
+        action="read",
+        expression=None,
+        version=1,
+        created_at=now,
+        updated_at=now,
+    )
+
+    body = json.loads(
+        trusted_json(
+            PermissionList,
+            PermissionList.validate_python([permission], from_attributes=True),
+        ).body
+    )
+
+    assert body[0]["name"] == "users_read"
+    assert body[0]["created_at"] == "2024-01-01T00:00:00"
+
+
+def test_user_response_takes_role_objects():
+    now = datetime(2024, 1, 1)
+    user = SimpleNamespace(
+        id="u1",
+        name="User",
+        phoneNumber="555-0100",
+        email="u@example.com",
+        username="user1",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+        roles=[SimpleNamespace(name="admin"), SimpleNamespace(name="member")],
+    )
+
+    assert UserResponse.model_validate(user).roles == ["admin", "member"]
@@ -0,0 +1,74 @@
+"""Test storage backends."""
+import pytest
+
+from src.core.storage import (
+    LocalStorage,
+    MemoryStorage,
+    S3Storage,
+    normalize_key,
+    shard_key,
+)
+
+
+async def chunked(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+@pytest.fixture
+def s3_storage():
+    """S3 storage backed by moto."""
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="uploads")
+        yield S3Storage(bucket="uploads", client=client, part_size=0)
+
+
+@pytest.fixture(params=["memory", "local", "s3"])
+def storage(request, tmp_path):
+    """Each storage backend."""
+    if request.param == "memory":
+        return MemoryStorage()
+    if request.param == "local":
+        return LocalStorage(tmp_path)
+    return request.getfixturevalue("s3_storage")
+
+
+@pytest.mark.asyncio
+async def test_roundtrip(storage) -> None:
+    """Test saving, reading and deleting an object."""
+    await storage.save("files/a.txt", b"hello", content_type="text/plain")
+    assert await storage.exists("files/a.txt")
+    assert await storage.read("files/a.txt") == b"hello"
+    assert await storage.delete("files/a.txt")
+    assert not await storage.exists("files/a.txt")
+    assert not await storage.delete("files/a.txt")
+
+
+@pytest.mark.asyncio
+async def test_multipart_stream(s3_storage) -> None:
+    """Test streaming an upload spanning several multipart parts."""
+    data = bytes(range(256)) * 50000
+    written = await s3_storage.save_stream("files/big.bin", chunked(data, 1000000))
+    assert written == len(data)
+    assert await s3_storage.read("files/big.bin") == data
+    assert "files/big.bin" in await s3_storage.presigned_url("files/big.bin")
+
+
+def test_normalize_key_rejects_traversal() -> None:
+    """Test keys cannot escape the storage root."""
+    assert normalize_key("files/./a.txt") == "files/a.txt"
+    for key in ("../etc/passwd", "/etc/passwd", "files/../../x", ""):
+        with pytest.raises(ValueError):
+            normalize_key(key)
+
+
+def test_shard_key_keeps_variants_together() -> None:
+    """Test variants land in the same shard as their original."""
+    original = shard_key("userphotos/1b4e28ba-2fa1-11d2.jpg")
+    variant = shard_key("userphotos/1b4e28ba-2fa1-11d2_64.webp")
+    assert original.count("/") == 3
+    assert original.rsplit("/", 1)[0] == variant.rsplit("/", 1)[0]
+    assert shard_key("files/a.pdf", depth=0) == "files/a.pdf"
@@ -0,0 +1,49 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.api.deps import has_permission, is_superuser
+
+
+class NoQuerySession:
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("superuser check must not query")
+
+
+def user(is_superuser=False, permissions=()):
+    role = SimpleNamespace(
+        name="role",
+        permissions=[
+            SimpleNamespace(resource=resource, action=action, expression=expression)
+            for resource, action, expression in permissions
+        ],
+    )
+    return SimpleNamespace(
+        id="u1",
+        name="User",
+        phoneNumber="555-0100",
+        email="u@example.com",
+        username="user1",
+        is_active=True,
+        is_superuser=is_superuser,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+        roles=[role],
+    )
+
+
+def test_superuser_from_flag_or_unconditional_wildcard_role():
+    assert is_superuser(user(is_superuser=True))
+    assert is_superuser(user(permissions=[("*", "*", None)]))
+    assert not is_superuser(user(permissions=[("*", "*", {"eq": [1, 1]})]))
+    assert not is_superuser(user(permissions=[("users", "*", None)]))
+
+
+@pytest.mark.asyncio
+async def test_superuser_is_allowed_without_queries():
+    check = has_permission("users", "delete")
+
+    result = await check(user(is_superuser=True), NoQuerySession(), None)
+
+    assert result.username == "user1"
@@ -0,0 +1,86 @@
+"""Test span tracing."""
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.core.middleware.tracing import TracingMiddleware
+from src.core.tracing import (
+    InMemorySpanExporter,
+    encode_spans,
+    parse_traceparent,
+    trace_service,
+    traced,
+    tracer,
+)
+from src.core.tracing.sqlalchemy import trace_engine
+
+
+@pytest.fixture
+def exporter():
+    """Route spans to an in-memory exporter."""
+    exporter = InMemorySpanExporter()
+    tracer.set_exporter(exporter)
+    yield exporter
+    tracer.set_exporter(None)
+
+
+@trace_service
+class ItemService:
+    """Service under test."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def count(self) -> int:
+        with self.engine.connect() as conn:
+            result = conn.execute(text("SELECT 1 WHERE 1 = :one"), {"one": 1})
+            return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_request_dependency_service_and_sql_spans(exporter) -> None:
+    """Test spans nest from the request down to SQL statements."""
+    engine = create_engine("sqlite://")
+    trace_engine(engine)
+
+    @traced("dependency:get_service")
+    async def get_service() -> ItemService:
+        return ItemService(engine)
+
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int, service: ItemService = Depends(get_service)):
+        return {"count": await service.count()}
+
+    traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/items/1", headers={"traceparent": traceparent})
+    engine.dispose()
+
+    assert response.status_code == 200
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["GET /items/{item_id}"]
+    assert root.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert root.parent_id == "b7ad6b7169203331"
+    assert root.attributes["http.status_code"] == 200
+    assert spans["dependency:get_service"].parent_id == root.span_id
+    service_span = spans["ItemService.count"]
+    assert service_span.parent_id == root.span_id
+    sql_span = spans["SELECT"]
+    assert sql_span.parent_id == service_span.span_id
+    assert sql_span.attributes["db.statement"] == "SELECT 1 WHERE 1 = ?"
+
+    body = encode_spans(exporter.spans, "test")
+    assert len(body["resourceSpans"][0]["scopeSpans"][0]["spans"]) == len(spans)
+
+
+def test_disabled_tracer_and_malformed_traceparent() -> None:
+    """Test the disabled tracer yields no spans and bad headers are ignored."""
+    with tracer.start_span("noop") as span:
+        assert span is None
+    assert parse_traceparent("00-abc-def-01") is None
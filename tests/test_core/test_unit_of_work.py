@@ -0,0 +1,79 @@
+"""Test the request unit of work session."""
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db import get_db, read_only
+from src.core.db.session import engine, read_engine
+from src.core.db.unit_of_work import WROTE, UnitOfWorkSession
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record flushes and real commits instead of talking to a database."""
+    calls = []
+
+    async def flush(self, objects=None):
+        calls.append("flush")
+        self.info[WROTE] = True
+
+    async def commit(self):
+        calls.append("commit")
+
+    monkeypatch.setattr(AsyncSession, "flush", flush)
+    monkeypatch.setattr(AsyncSession, "commit", commit)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_service_commits_are_batched(calls) -> None:
+    """Test commits inside the unit of work flush and commit once at the end."""
+    session = UnitOfWorkSession()
+    session.begin_unit_of_work()
+
+    await session.commit()
+    await session.commit()
+    await session.complete()
+
+    assert calls == ["flush", "flush", "commit"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_unit_of_work_skips_commit(calls) -> None:
+    """Test a session that never wrote does not commit."""
+    session = UnitOfWorkSession()
+    session.begin_unit_of_work()
+
+    await session.complete()
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_only_read_only_endpoints_get_the_autocommit_bind() -> None:
+    """Test GET handlers keep a transaction unless marked read_only."""
+    app = FastAPI()
+    binds = {}
+
+    @app.get("/plain")
+    async def plain(db: AsyncSession = Depends(get_db)):
+        binds["plain"] = db.bind
+
+    @app.get("/read")
+    @read_only
+    async def read(db: AsyncSession = Depends(get_db)):
+        binds["read"] = db.bind
+
+    @app.post("/read")
+    @read_only
+    async def write(db: AsyncSession = Depends(get_db)):
+        binds["write"] = db.bind
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/plain")
+        await client.get("/read")
+        await client.post("/read")
+
+    assert binds == {"plain": engine, "read": read_engine, "write": engine}
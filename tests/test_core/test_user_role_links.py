@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import BackgroundTasks
+
+from src.app.api.v1.endpoints import users
+
+
+class FakeUserService:
+    def __init__(self, db):
+        self.db = db
+
+    async def add_role(self, user_id, role_id):
+        self.db.user.roles.append(SimpleNamespace(role_id=role_id, name="editor"))
+        return 1
+
+    async def get_by_id(self, user_id):
+        return self.db.user
+
+
+class FakeSession:
+    def __init__(self):
+        self.user = SimpleNamespace(
+            id="u1",
+            name="User",
+            phoneNumber="555-0100",
+            email="u@example.com",
+            username="user1",
+            is_active=True,
+            roles=[SimpleNamespace(role_id=1, name="member")],
+        )
+        self.refreshed = []
+
+    async def refresh(self, instance, attribute_names=None):
+        self.refreshed.append(attribute_names)
+
+
+@pytest.mark.asyncio
+async def test_add_role_keeps_user_with_roles_response(monkeypatch):
+    monkeypatch.setattr(users, "UserService", FakeUserService)
+    db = FakeSession()
+    background_tasks = BackgroundTasks()
+
+    result = await users.add_role_to_user("u1", 2, background_tasks, db, None)
+
+    assert [role.name for role in result.roles] == ["member", "editor"]
+    assert db.refreshed == [["roles"]]
+    assert len(background_tasks.tasks) == 1
@@ -0,0 +1,128 @@
+"""Test RETURNING writes and version checks."""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.app.models import Role
+from src.app.schemas import RoleCreate
+from src.app.services import RoleService
+from src.app.services import role as role_module
+from src.core.db import Base
+from src.core.db.writes import (
+    StaleVersionError,
+    delete_returning,
+    insert_returning,
+    is_unique_violation,
+    update_returning,
+)
+
+
+class Widget(Base):
+    """Versioned test model."""
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+class SyncSession:
+    """Await-able facade over a sync session, aiosqlite is not required."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def execute(self, statement):
+        return self.session.execute(statement)
+
+    async def scalar(self, statement):
+        return self.session.scalar(statement)
+
+
+@pytest.fixture
+def db():
+    """Session over an in-memory SQLite database holding the test table."""
+    engine = create_engine("sqlite://")
+    Widget.__table__.create(engine)
+    with Session(engine) as session:
+        yield SyncSession(session)
+
+
+@pytest.mark.asyncio
+async def test_update_increments_version(db) -> None:
+    """Test inserts start at version 1 and updates return the new row."""
+    widget = await insert_returning(db, Widget, {"name": "a"})
+    assert widget.version == 1
+
+    widget = await update_returning(db, Widget, widget.id, {"name": "b"}, 1)
+    assert (widget.name, widget.version) == ("b", 2)
+
+
+@pytest.mark.asyncio
+async def test_stale_version_conflicts(db) -> None:
+    """Test an outdated version raises while a missing row returns None."""
+    widget = await insert_returning(db, Widget, {"name": "a"})
+    await update_returning(db, Widget, widget.id, {"name": "b"})
+
+    with pytest.raises(StaleVersionError):
+        await update_returning(db, Widget, widget.id, {"name": "c"}, 1)
+    assert await update_returning(db, Widget, 999, {"name": "c"}, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_reports_existence(db) -> None:
+    """Test deletes report whether a row was removed."""
+    widget = await insert_returning(db, Widget, {"name": "a"})
+
+    assert await delete_returning(db, Widget, widget.id) is True
+    assert await delete_returning(db, Widget, widget.id) is False
+
+
+class UniqueViolation(Exception):
+    """Driver error naming the violated constraint, as asyncpg raises."""
+
+    def __init__(self, constraint_name):
+        super().__init__(constraint_name)
+        self.constraint_name = constraint_name
+
+
+class DriverError(Exception):
+    """DBAPI error as adapted by SQLAlchemy, chaining the driver's error."""
+
+    def __init__(self, sqlstate, constraint_name):
+        super().__init__(f"{sqlstate} on {constraint_name}")
+        self.sqlstate = sqlstate
+        self.__cause__ = UniqueViolation(constraint_name)
+
+
+def integrity_error(sqlstate, constraint_name) -> IntegrityError:
+    return IntegrityError("INSERT", {}, DriverError(sqlstate, constraint_name))
+
+
+def test_unique_violation_is_matched_by_constraint() -> None:
+    """Test only a duplicate on the column's own unique index matches."""
+    assert is_unique_violation(integrity_error("23505", "ix_role_name"), Role.name)
+    assert not is_unique_violation(integrity_error("23505", "role_pkey"), Role.name)
+    assert not is_unique_violation(integrity_error("23502", None), Role.name)
+
+
+@pytest.mark.asyncio
+async def test_create_reports_only_duplicate_names(monkeypatch) -> None:
+    """Test a duplicate name is a 400 and other integrity errors propagate."""
+    errors = []
+
+    async def insert_returning(db, model, values):
+        raise errors.pop()
+
+    monkeypatch.setattr(role_module, "insert_returning", insert_returning)
+    service = RoleService(None)
+    role_in = RoleCreate(name="editor")
+
+    errors.append(integrity_error("23505", "ix_role_name"))
+    with pytest.raises(HTTPException) as exc:
+        await service.create(role_in)
+    assert exc.value.status_code == 400
+
+    errors.append(integrity_error("23502", None))
+    with pytest.raises(IntegrityError):
+        await service.create(role_in)